@@ -1,12 +1,22 @@
 # serial_process.py
 # -*- coding: utf-8 -*-
-from PyQt5.QtCore import QObject, pyqtSignal, QTimer, QIODevice, QByteArray
+from PyQt5.QtCore import QObject, pyqtSignal, QTimer, QByteArray
 from PyQt5.QtSerialPort import QSerialPort, QSerialPortInfo
 import os
+import time
+from collections import deque
+
+from Serial_Port.pipeline_probe import PipelineProbe
+from Serial_Port.serial_stats import SerialStatistics
+from Serial_Port.transports import create_transport
 
 
 class SerialProcess(QObject):
-    """串口处理类"""
+    """串口处理类
+
+    设备读写经由传输层（transports.py）：端口名可以是本地串口，也可以是 tcp://host:port、
+    host:port 或 unix://path 形式的网络端点，对外的信号和接口不变。
+    """
 
     # 定义信号
     data_received = pyqtSignal(QByteArray)
@@ -14,48 +24,90 @@ class SerialProcess(QObject):
     port_closed = pyqtSignal()  # 串口关闭信号
     error_occurred = pyqtSignal(str)  # 错误发生信号
 
+    DEFAULT_READ_BUFFER = 1024 * 1024  # QSerialPort 内部读缓冲上限
+    PAUSE_HISTORY_BYTES = 4 * 1024 * 1024  # 暂停期间保留的数据上限
+
     def __init__(self):
         super().__init__()
-        self.serial = QSerialPort()
+        self.transport = None
+        self.port_name = ""
         self.is_open = False
+        self.is_opening = False  # 网络端点正在后台连接
         self.is_paused = False
+        # 暂停只冻结显示：读取照常进行，数据暂存在有界的历史中，恢复时再显示
+        self.paused_chunks = deque()
+        self.paused_bytes = 0
+        self.last_read_held = False
         self.receive_count = 0
         self.send_count = 0
 
+        # 设备模拟应答器（None 表示关闭）
+        self.auto_responder = None
+
+        # 接收链路分段计时探针（默认关闭）
+        self.probe = PipelineProbe()
+
+        # 滑动窗口收发统计
+        self.stats = SerialStatistics()
+
+        # 最近一次读取的时刻（monotonic_ns），供时间戳等下游使用
+        self.last_read_ns = 0
+
+        # 当前设置下传输一个字符的时间（纳秒），供按静默间隔分帧使用
+        self.baud_rate = 115200
+        self.char_time_ns = self.calc_char_time_ns(115200, 8, QSerialPort.NoParity, QSerialPort.OneStop)
+
         # 自动发送定时器
         self.auto_send_timer: QTimer = QTimer()
         self.auto_send_timer.timeout.connect(self.auto_send_data)
         self.auto_send_interval = 1000  # 默认1秒
 
-        # 连接串口信号
-        self.serial.readyRead.connect(self.read_data)
-        self.serial.errorOccurred.connect(self.handle_error)
+        # 读缓冲有上限，处理不过来时由驱动侧溢出并计数，而不是无限占用内存
+        self.read_buffer_size = self.DEFAULT_READ_BUFFER
+
+    @property
+    def serial(self):
+        """当前底层设备（QSerialPort / QTcpSocket / QLocalSocket），未打开过时为 None"""
+        return self.transport.device if self.transport is not None else None
+
+    def device_open(self):
+        return self.transport is not None and self.transport.is_open()
+
+    def bytes_available(self):
+        """设备中已到达、尚未读取的字节数"""
+        return self.transport.bytes_available() if self.device_open() else 0
 
     def open_port(self, port_name, baud_rate, data_bits, parity, stop_bits, flow_control):
-        """打开串口"""
+        """打开串口或网络端点
+
+        返回 False 表示打开失败。串口同步打开；网络端点返回 True 时仍在后台连接（is_opening），
+        连接成功发出 port_opened，失败发出 error_occurred，界面线程不会被阻塞。
+        """
         try:
-            if self.serial.isOpen():
-                self.serial.close()
+            self.release_transport()
 
-            # 设置串口参数
-            self.serial.setPortName(port_name)
-            self.serial.setBaudRate(baud_rate)
-            self.serial.setDataBits(data_bits)
-            self.serial.setParity(parity)
-            self.serial.setStopBits(stop_bits)
-            self.serial.setFlowControl(flow_control)
+            transport = create_transport(port_name, baud_rate, data_bits, parity, stop_bits, flow_control)
+            transport.set_read_buffer_size(self.read_buffer_size)
+            transport.ready_read.connect(self.read_data)
+            transport.error_occurred.connect(self.error_occurred)
+            transport.connection_lost.connect(self.close_port)
+            transport.opened.connect(self.on_transport_opened)
+            transport.open_failed.connect(self.on_open_failed)
+            self.transport = transport
+            self.port_name = port_name
+
+            self.baud_rate = baud_rate
+            self.char_time_ns = self.calc_char_time_ns(baud_rate, data_bits, parity, stop_bits)
 
             # 打开串口
-            if self.serial.open(QIODevice.ReadWrite):
-                self.is_open = True
-                self.port_opened.emit()
-                return True
-            else:
-                error_msg = f"无法打开串口 {port_name}"
-                print(error_msg)  # 调试信息
-                self.error_occurred.emit(error_msg)
+            if not transport.open():
+                self.on_open_failed(transport.error_string())
                 return False
-
+            if transport.is_open():
+                self.on_transport_opened()
+            else:
+                self.is_opening = True
+            return True
 
         except Exception as e:
             error_msg = f"打开串口错误: {str(e)}"
@@ -63,30 +115,97 @@ class SerialProcess(QObject):
             self.error_occurred.emit(error_msg)
             return False
 
+    @staticmethod
+    def calc_char_time_ns(baud_rate, data_bits, parity, stop_bits):
+        """一个字符的传输时间：起始位 + 数据位 + 校验位 + 停止位"""
+        parity_bits = 0 if parity == QSerialPort.NoParity else 1
+        stop = {QSerialPort.OneStop: 1, QSerialPort.OneAndHalfStop: 1.5, QSerialPort.TwoStop: 2}.get(stop_bits, 1)
+        bits = 1 + int(data_bits) + parity_bits + stop
+        return int(bits * 1e9 / baud_rate)
+
+    def on_transport_opened(self):
+        self.is_opening = False
+        self.is_open = True
+        self.port_opened.emit()
+
+    def on_open_failed(self, reason):
+        self.is_opening = False
+        error_msg = f"无法打开 {self.port_name}: {reason}"
+        print(error_msg)  # 调试信息
+        self.error_occurred.emit(error_msg)
+        self.release_transport()
+
     def close_port(self):
-        """关闭串口"""
-        if self.serial.isOpen():
-            self.serial.close()
+        """关闭串口（对端断开时设备已不可用，仍需走完关闭流程）；连接中时取消连接"""
+        if self.is_opening:
+            self.is_opening = False
+            self.transport.close()
+        if self.is_open:
+            self.transport.close()
             self.is_open = False
+            # 暂停期间保留的数据属于这次连接，恢复时不再显示
+            self.clear_held()
             self.port_closed.emit()
 
+    def release_transport(self):
+        """关闭并释放当前传输层"""
+        transport = self.transport
+        if transport is None:
+            return
+        self.close_port()
+        self.transport = None
+        transport.ready_read.disconnect(self.read_data)
+        transport.error_occurred.disconnect(self.error_occurred)
+        transport.connection_lost.disconnect(self.close_port)
+        transport.opened.disconnect(self.on_transport_opened)
+        transport.open_failed.disconnect(self.on_open_failed)
+        transport.deleteLater()
+
+    def set_read_buffer_size(self, size):
+        """设置设备读缓冲上限（字节，0 为不限）"""
+        self.read_buffer_size = size
+        if self.transport is not None:
+            self.transport.set_read_buffer_size(size)
+
     def read_data(self):
-        """读取串口数据"""
-        if self.is_paused or not self.serial.isOpen():
+        """读取串口数据（暂停时也照常读取，避免数据堆积在驱动缓冲中）"""
+        if not self.device_open():
             return
 
         try:
+            read_ns = time.perf_counter_ns()
+            probe = self.probe
+            if probe.enabled:
+                probe.begin()
             # 读取所有可用数据
-            data = self.serial.readAll()
+            self.last_read_ns = time.monotonic_ns()
+            data = self.transport.read_all()
             if data:
+                # 串口读到的数据填满了读缓冲：期间停止从驱动读取，驱动侧可能已丢数据（推测，非确认）。
+                # 套接字填满缓冲只是流量控制，对端会等待，不计数
+                if (self.transport.FULL_BUFFER_MAY_OVERRUN and self.read_buffer_size
+                        and data.size() >= self.read_buffer_size):
+                    self.stats.add('overruns')
+                self.last_read_held = self.is_paused
+                if self.is_paused:
+                    self.hold(self.last_read_ns, data.data())
                 self.receive_count += data.size()
+                self.stats.add('rx_bytes', data.size())
+                self.stats.add('rx_chunks')
+                # 设备模拟模式下先应答，再通知界面
+                if self.auto_responder is not None:
+                    self.auto_responder.feed(data.data(), read_ns)
+                if probe.enabled:
+                    probe.mark('read_done')
                 self.data_received.emit(data)
+                if probe.enabled:
+                    probe.end()
         except Exception as e:
             self.error_occurred.emit(f"读取数据错误: {str(e)}")
 
     def send_data(self, data, data_hex, is_hex=False):
         """发送数据"""
-        if not self.serial.isOpen():
+        if not self.device_open():
             self.error_occurred.emit("串口未打开")
             return False
 
@@ -105,11 +224,24 @@ class SerialProcess(QObject):
                 # 文本发送
                 byte_data = data.encode('utf-8')
 
-            # 发送数据
-            bytes_written = self.serial.write(byte_data)
+            return self.send_bytes(byte_data)
+
+        except Exception as e:
+            self.error_occurred.emit(f"发送数据错误: {str(e)}")
+            return False
+
+    def send_bytes(self, byte_data):
+        """直接发送字节数据（不经过界面和编码转换）"""
+        if not self.device_open():
+            self.error_occurred.emit("串口未打开")
+            return False
+
+        try:
+            bytes_written = self.transport.write(byte_data)
             if bytes_written > 0:
                 self.send_count += bytes_written
-                self.serial.flush()  # 确保数据发送完成
+                self.stats.add('tx_bytes', bytes_written)
+                self.transport.flush()  # 不等待，尽快写出发送缓冲
                 return True
             else:
                 self.error_occurred.emit("发送数据失败")
@@ -128,16 +260,15 @@ class SerialProcess(QObject):
         try:
             with open(file_path, 'rb') as file:
                 content = file.read()
-                return self.send_data(content.hex(), is_hex=True)
+                return self.send_bytes(content)
         except Exception as e:
             self.error_occurred.emit(f"发送文件错误: {str(e)}")
             return False
 
     def set_flow_control(self, rts_state, dtr_state):
         """设置流控制"""
-        if self.serial.isOpen():
-            self.serial.setRequestToSend(rts_state)
-            self.serial.setDataTerminalReady(dtr_state)
+        if self.device_open():
+            self.transport.set_flow_control(rts_state, dtr_state)
 
     def set_auto_send(self, enabled, interval=1000):
         """设置自动发送"""
@@ -153,43 +284,34 @@ class SerialProcess(QObject):
         # 这个功能需要主界面提供发送内容
         pass
 
+    def set_auto_responder(self, responder):
+        """设置设备模拟应答器，传入 None 关闭"""
+        if responder is not None:
+            responder.reset_state()
+        self.auto_responder = responder
+
     def pause_receive(self, paused):
-        """暂停/恢复接收"""
+        """暂停/恢复接收显示，恢复时返回暂停期间保留的 [(读取时刻, 数据)]"""
         self.is_paused = paused
-
-    def handle_error(self, error):
-        """处理串口错误"""
-        # 忽略 NoError 情况
-        if error == QSerialPort.SerialPortError.NoError:
-            return
-
-        error_str = ""
-        if error == QSerialPort.SerialPortError.ResourceError:
-            error_str = "资源错误，串口可能被拔出"
-        elif error == QSerialPort.SerialPortError.PermissionError:
-            error_str = "权限错误，无法访问串口"
-        elif error == QSerialPort.SerialPortError.OpenError:
-            error_str = "打开串口错误"
-        elif error == QSerialPort.SerialPortError.WriteError:
-            error_str = "写入串口错误"
-        elif error == QSerialPort.SerialPortError.ReadError:
-            error_str = "读取串口错误"
-        elif error == QSerialPort.SerialPortError.UnknownError:
-            error_str = "未知串口错误"
-        else:
-            error_str = f"串口错误: {self.serial.errorString()}"
-
-        # 只有当有实际错误时才发射信号
-        if error_str:
-            self.error_occurred.emit(error_str)
-
-        # 如果串口打开时发生严重错误，关闭串口
-        if self.serial.isOpen() and error in [
-            QSerialPort.SerialPortError.ResourceError,
-            QSerialPort.SerialPortError.PermissionError,
-            QSerialPort.SerialPortError.OpenError
-        ]:
-            self.close_port()
+        if paused:
+            return []
+        chunks = list(self.paused_chunks)
+        self.clear_held()
+        return chunks
+
+    def clear_held(self):
+        """丢弃暂停期间保留的数据（清空接收区、关闭端口时）"""
+        self.paused_chunks.clear()
+        self.paused_bytes = 0
+
+    def hold(self, t_ns, data):
+        """暂停期间暂存数据，超出上限时丢弃最早的并计数"""
+        self.paused_chunks.append((t_ns, data))
+        self.paused_bytes += len(data)
+        while self.paused_bytes > self.PAUSE_HISTORY_BYTES:
+            _, dropped = self.paused_chunks.popleft()
+            self.paused_bytes -= len(dropped)
+            self.stats.add('paused_dropped', len(dropped))
 
     def get_port_info(self, port_name):
         """获取串口信息"""
@@ -209,12 +331,13 @@ class SerialProcess(QObject):
 
     def get_stats(self):
         """获取统计信息"""
-        return {
-            'receive_count': self.receive_count,
-            'send_count': self.send_count
-        }
+        stats = self.stats.export()
+        stats['receive_count'] = self.receive_count
+        stats['send_count'] = self.send_count
+        return stats
 
     def reset_stats(self):
         """重置统计信息"""
         self.receive_count = 0
         self.send_count = 0
+        self.stats.reset()
@@ -1,28 +1,52 @@
 # -*- coding: utf-8 -*-
+import os
+import time
+from collections import deque
 from datetime import datetime
 
 # 正确的导入方式
 from PyQt5 import QtCore
 from PyQt5.QtCore import QTimer
-from PyQt5.QtGui import QFont, QTextCursor
-from PyQt5.QtWidgets import QMainWindow, QMessageBox, QFileDialog, QTextEdit, QVBoxLayout
+from PyQt5.QtGui import QFont, QTextCharFormat, QColor
+from PyQt5.QtWidgets import QMainWindow, QMessageBox, QFileDialog, QTextEdit, QVBoxLayout, QLabel, QActionGroup, QApplication, QInputDialog
 from PyQt5.QtSerialPort import QSerialPort, QSerialPortInfo
 
 from Serial_Port.Serial_MainWindow import Ui_Serial_MainWindow
 from Serial_Port.config_manager import JSONConfigManager
 from Serial_Port.app_SerialProcess import SerialProcess
+from Serial_Port.trigger_engine import TriggerEngine
+from Serial_Port.auto_responder import AutoResponder
+from Serial_Port.diagnostics_panel import DiagnosticsPanel
+from Serial_Port.profiler_hooks import HotPathProfiler
+from Serial_Port.line_timestamper import LineTimestamper
+from Serial_Port.hex_input import HexInputController
+from Serial_Port.text_hex_sync import TextHexSync
+from Serial_Port.send_payload import SendPayload
+from Serial_Port.payload_view import PayloadPageView
+from Serial_Port.capture_archive import CaptureWriter, CODECS
+from Serial_Port.modbus_monitor import ModbusMonitor
+from Serial_Port.checksum import ALGORITHM_TITLES, LineChecksumVerifier, append_checksum, verify as verify_checksum
+from Serial_Port.motor_view_model import MotorViewModel
+from Serial_Port.display_governor import DisplayGovernor, FULL
+from Serial_Port.decode_pool import DecodePool, DECODERS
+from Serial_Port.bridge_policy import POLICY_TITLES
+from Serial_Port.decoder_plugins import (discover_plugins, PluginHost, MotorProtocolPlugin,
+                                         SpeedRecord, MotorRecord, TextRecord)
+from Serial_Port.framing import FRAMING_TITLES, make_decoder, encode as encode_frame
+from Serial_Port.transports import is_network_target, parse_target
 from typing import TYPE_CHECKING
 
-from datetime import datetime
-import numpy as np
-import pyqtgraph as pg
-from collections import deque
-
 if TYPE_CHECKING:
     from WindowManager import WindowManagerClass
 
 
 class SerialAppClass(QMainWindow):
+    # 遥测记录的字段
+    TELEMETRY_FIELDS = ("speed", "motor_state", "motor_value")
+    CHART_INTERVAL = 33  # 毫秒，速度图表重绘间隔
+    CHART_FOLLOW_SECONDS = 10  # 跟随最新数据时默认显示的时长
+    HELD_TEXT_RECORDS = 10000  # 暂停期间保留的插件文本条数上限
+
     def __init__(self, window_manager: 'WindowManagerClass'):
         super().__init__()
 
@@ -42,21 +66,44 @@ class SerialAppClass(QMainWindow):
         # 初始化串口处理类
         self.serial_process = SerialProcess()
 
+        # 初始化触发器引擎（先于界面连接 data_received，命中动作在显示之前执行）
+        self.trigger_engine = TriggerEngine(self.serial_process, self.config_manager.get_triggers())
+        self.trigger_highlight = False
+
+        # 按行时间戳
+        self.timestamper = LineTimestamper()
+
+        # 解码插件：内置电机协议，plugins 目录和 entry points 中的插件在首次绘制后加载
+        self.plugin_host = PluginHost([MotorProtocolPlugin()])
+        self.plugin_errors = []
+        self.plugin_host.register(SpeedRecord, self.on_speed_record)
+        self.plugin_host.register(MotorRecord, self.on_motor_record)
+        self.plugin_host.register(TextRecord, self.on_text_record)
+        # 暂停期间插件输出的文本：[(所属读取时刻, 文本)]，恢复时与暂存数据一起按序显示
+        self.held_text = deque(maxlen=self.HELD_TEXT_RECORDS)
+
+        # 设备模拟应答器（通过菜单开启）
+        self.auto_responder = AutoResponder(self.serial_process, self.config_manager.get_auto_responses())
+
+        # 热路径性能采样（必须在连接信号和定时器之前包装）
+        self.profiler = HotPathProfiler()
+        self.profiler.instrument(self, ['on_data_received', 'append_to_receive', 'update_speed_chart',
+                                        'refresh_ports'])
+        self.profiler.instrument(self.config_manager, ['save_all_settings'])
+        self.profiler.finished.connect(self.on_profile_finished)
+
         # 初始化界面
         self.init_serial_ui()
 
-        # 初始化端口列表
-        self.refresh_ports()
-
-        # 设置定时器，每2秒检查一次
+        # 端口检查定时器，首次绘制后再启动
         self.port_infor_timer: QTimer = QTimer()
         self.port_infor_timer.timeout.connect(self.refresh_ports)
-        self.port_infor_timer.start(1000)
 
         self.connect_signals()
 
-        # 延迟加载上次设置，确保端口列表已刷新
-        QTimer.singleShot(10, self.load_last_settings)
+        # 窗口先显示，端口枚举和上次设置在首次绘制之后再加载
+        self.startup_timer = self.window_manager.startup_timer
+        self.startup_timer.call_after_first_paint(self, self.deferred_startup)
 
         # 自动清空相关属性
         self.receive_data_size = 0
@@ -77,13 +124,11 @@ class SerialAppClass(QMainWindow):
         # 同步状态标志
         self.is_syncing = False
 
-        # 添加速度可视化相关属性
-        self.speed_history = deque(maxlen=200)  # 保存200个数据点
-        self.send_count_history = deque(maxlen=200)  # 发送数历史
+        # 添加速度可视化相关属性（速度数据保存在图表的多分辨率存储中）
         self.send_count = 0  # 发送计数器
 
-        # 初始化界面
-        self.init_serial_ui()
+        # 初始化菜单栏和状态栏
+        self.init_menus()
 
     def init_serial_ui(self):
         """初始化串口界面"""
@@ -117,9 +162,36 @@ class SerialAppClass(QMainWindow):
         # 初始化速度显示
         self.ui.speed_ledit.setText("0")
         self.ui.speed_ctrl_ledit.setText("0")
+        # 电机状态控件只在值变化时更新
+        self.motor_view = MotorViewModel(self.ui, self)
 
-        # 初始化速度图表
-        self.init_speed_chart()
+        # 端口框可直接输入网络端点（tcp://host:port、host:port、unix://path）
+        self.ui.port_cb.setEditable(True)
+        self.ui.port_cb.setInsertPolicy(self.ui.port_cb.NoInsert)
+        self.ui.port_cb.lineEdit().setPlaceholderText("串口或 host:port")
+
+        # 速度图表在收到第一个速度数据时才创建（按需加载pyqtgraph）
+        self.plot_widget = None
+        self.init_chart_placeholder()
+
+    def deferred_startup(self):
+        """首次绘制之后的启动步骤：枚举端口、加载上次设置"""
+        # 初始化端口列表
+        self.refresh_ports()
+
+        # 设置定时器，每1秒检查一次
+        self.port_infor_timer.start(1000)
+
+        # 加载外部解码插件，需在加载设置（禁用列表）之前
+        self.load_plugins()
+
+        # 加载上次设置（会尝试自动打开串口）
+        self.load_last_settings()
+
+        self.startup_timer.mark("ready")
+        report = self.startup_timer.report()
+        print(report)
+        self.ui.statusbar.showMessage(report, 5000)
 
     def setup_text_edits(self):
         """设置接收和发送文本框"""
@@ -158,6 +230,16 @@ class SerialAppClass(QMainWindow):
 				border: 2px solid #0078d4;
 			}
 		""")
+        # 十六进制输入增量格式化
+        self.hex_input = HexInputController(self.ui.send_hex_tEdit)
+
+        # 发送内容模型；载入的大数据用分页视图显示，覆盖在十六进制框的位置
+        self.payload = SendPayload()
+        self.payload_view = PayloadPageView(self.payload, self.ui.groupBox_5)
+        self.payload_view.setGeometry(self.ui.send_hex_tEdit.geometry())
+        self.payload_view.hide()
+        self.payload_view.unload_requested.connect(self.unload_payload)
+
         # 添加焦点事件监听
         self.ui.send_tEdit.focusInEvent = self.send_text_edit_focus_in
         self.ui.send_tEdit.focusOutEvent = self.send_text_edit_focus_out
@@ -173,15 +255,18 @@ class SerialAppClass(QMainWindow):
         # 连接同步单选按钮信号
         self.ui.send_sync_rbtn.toggled.connect(self.on_sync_mode_changed)
 
-        # 连接两个文本框的内容变化信号
-        self.ui.send_tEdit.textChanged.connect(self.on_text_edit_changed)
-        self.ui.send_hex_tEdit.textChanged.connect(self.on_hex_edit_changed)
+        # 字符串 -> 十六进制的增量同步（防抖，只重新编码改动的行）
+        self.text_hex_sync = TextHexSync(self.ui.send_tEdit, self.hex_input, self.get_send_source_text)
+
+        # 显示模式文本缓存：(实际文本, 显示文本)
+        self.display_mode_cache = (None, "")
 
     def connect_signals(self):
         """连接信号和槽"""
         # 串口处理类信号
         self.serial_process.data_received.connect(self.on_data_received)
         self.serial_process.port_opened.connect(self.on_port_opened)
+        self.serial_process.port_opened.connect(self.timestamper.reset)
         self.serial_process.port_closed.connect(self.on_port_closed)
         self.serial_process.error_occurred.connect(self.on_serial_error)
 
@@ -217,7 +302,10 @@ class SerialAppClass(QMainWindow):
         self.ui.auto_clearReceive_chb.stateChanged.connect(self.auto_save_settings)
 
         # 端口和参数变化信号 - 添加自动保存
-        self.ui.port_cb.currentTextChanged.connect(self.auto_save_settings)
+        # 端口框可编辑，输入完成后再保存，避免每次按键都写配置
+        self.ui.port_cb.currentIndexChanged.connect(self.auto_save_settings)
+        self.ui.port_cb.lineEdit().editingFinished.connect(self.auto_save_settings)
+        self.ui.port_cb.lineEdit().editingFinished.connect(self.update_port_info_display)
         self.ui.baudrate_cb.currentTextChanged.connect(self.auto_save_settings)
         self.ui.parity_cb.currentTextChanged.connect(self.auto_save_settings)
         self.ui.databits_cb.currentTextChanged.connect(self.auto_save_settings)
@@ -229,6 +317,12 @@ class SerialAppClass(QMainWindow):
         # 速度设置
         self.ui.speed_ctrl_hsld.valueChanged.connect(self.speed_setting_changed)
 
+        # 触发器信号
+        self.trigger_engine.triggered.connect(self.on_trigger_fired)
+        self.trigger_engine.highlight_requested.connect(self.on_trigger_highlight)
+        self.trigger_engine.counter_changed.connect(self.on_trigger_counter)
+        self.trigger_engine.pause_requested.connect(self.on_trigger_pause)
+
         # 连接上下限文本框编辑完成事件
         self.ui.speed_ctrl_min_ledit.editingFinished.connect(self.update_slider_range)
         self.ui.speed_ctrl_max_ledit.editingFinished.connect(self.update_slider_range)
@@ -239,14 +333,14 @@ class SerialAppClass(QMainWindow):
 
     def toggle_serial_port(self):
         """打开/关闭串口"""
-        if self.serial_process.is_open:
-            # 关闭串口
+        if self.serial_process.is_open or self.serial_process.is_opening:
+            # 关闭串口（网络端点连接中时取消连接）
             self.serial_process.close_port()
             self.ui.open_btn.setText("打开串口")
         else:
-            # 打开串口
+            # 打开串口；网络端点在后台连接，连上后由 on_port_opened 更新按钮
             if self.open_serial_port():
-                self.ui.open_btn.setText("关闭串口")
+                self.ui.open_btn.setText("关闭串口" if self.serial_process.is_open else "取消连接")
 
     def open_serial_port(self):
         """打开串口"""
@@ -311,59 +405,114 @@ class SerialAppClass(QMainWindow):
 
     def on_data_received(self, data):
         """处理接收到的数据"""
+        probe = self.serial_process.probe
+        if probe.enabled:
+            probe.mark('slot_entry')
+
+        # 协议解码交给插件，按记录类型分发
+        self.plugin_host.feed(data.data(), self.serial_process.last_read_ns)
+        if probe.enabled:
+            probe.mark('chart')
+
+        # 暂停时数据已由 SerialProcess 暂存，恢复时再显示
+        if self.serial_process.last_read_held:
+            self.trigger_highlight = False
+            return
 
-        # 判断是否是电机数据
-        smart_text = data.data().decode('utf-8', errors='ignore')
-        # print(smart_text)
-        if smart_text.startswith("[M]:"):
-            self.motor_data_process(smart_text[4:])
-        else:
-            line = smart_text.strip()          # 去掉 \r\n 和首尾空格
-            if not line:
-                return
-            try:
-                speed_value = float(line)
-            except ValueError:
-                # 不是数字就忽略（比如乱码、提示信息）
-                return
-            self.ui.speed_ledit.setText(f"{speed_value:.2f}")
-            self.send_count += 1
-            if speed_value <= -10.0:
-                self.set_motor_status('reverse')
-            elif speed_value >= 10.0:
-                self.set_motor_status('forward')
-            else:
-                self.set_motor_status('stop')
-            self.update_speed_chart(speed_value, self.send_count)
-
-    # 更新接收数据大小
+        # 更新接收数据大小
         self.receive_data_size += len(data)
 
-        if self.ui.hex_receive_chb.isChecked():
+        # 转换为显示文本，时间戳取读取时刻
+        display_text = self.render_received(data.data(), self.serial_process.last_read_ns)
+        if probe.enabled:
+            probe.mark('decode')
+
+        # 追加到接收文本框（触发器命中时高亮显示）
+        highlight = self.trigger_highlight
+        self.trigger_highlight = False
+        if display_text:
+            self.append_to_receive(display_text, highlight)
+        if probe.enabled:
+            probe.mark('append')
+
+    def render_received(self, raw, read_ns):
+        """按当前显示设置把一块接收数据转换成显示文本"""
+        if self.decode_pool is not None:
+            # 交给解码进程，结果按接收顺序回来后再显示
+            self.decode_pool.feed(raw)
+            return ""
+        timestamp_enabled = self.ui.timestamp_chb.isChecked()
+        if self.frame_decoder is not None:
+            # 按分帧层解码后逐帧显示
+            display_text = self.format_frames(self.frame_decoder.feed(raw))
+            if timestamp_enabled:
+                display_text = self.timestamper.stamp_lines(display_text, read_ns)
+        elif self.ui.hex_receive_chb.isChecked():
             # 十六进制显示
-            hex_data = data.toHex().data().decode()
-            formatted_hex = ' '.join([hex_data[i:i + 2] for i in range(0, len(hex_data), 2)])
-            display_text = formatted_hex
+            display_text = raw.hex(' ')
+            if timestamp_enabled:
+                display_text = self.timestamper.stamp_block(display_text, read_ns)
         else:
             # 文本显示
-            display_text = data.data().decode('utf-8', errors='ignore')
-
-        # 添加时间戳
-        if self.ui.timestamp_chb.isChecked():
-            from datetime import datetime
-            timestamp = datetime.now().strftime("[%H:%M:%S] ")
-            display_text = timestamp + display_text
-
-        # 追加到接收文本框
-        self.append_to_receive(display_text)
+            display_text = raw.decode('utf-8', errors='ignore')
+            if timestamp_enabled:
+                display_text = self.timestamper.stamp_lines(display_text, read_ns)
+        return display_text
+
+    def format_frames(self, frames):
+        """解码后的帧每帧一行十六进制；开启接收校验时按帧校验"""
+        if not frames:
+            return ""
+        title = self.receive_framing.upper()
+        lines = []
+        failures = 0
+        for payload, ok in frames:
+            line = payload.hex(' ').upper()
+            if not ok:
+                line = f"[{title} 错误] {line}"
+            elif self.receive_checksum != "none" and not verify_checksum(self.receive_checksum, payload):
+                failures += 1
+                line += " [校验错误]"
+            lines.append(line + '\n')
+        stats = self.serial_process.stats
+        stats.add('frames', len(frames))
+        if failures:
+            stats.add('checksum_failures', failures)
+            self.ui.statusbar.showMessage(f"接收校验失败 {failures} 帧", 2000)
+        return ''.join(lines)
+
+    def on_speed_record(self, record):
+        """速度记录"""
+        speed_value = record.speed
+        self.serial_process.stats.add('frames')
+        self.record_telemetry(record.t_ns, speed=speed_value)
+        self.motor_view.set_speed(speed_value)
+        self.send_count += 1
+        if speed_value <= -10.0:
+            self.set_motor_status('reverse')
+        elif speed_value >= 10.0:
+            self.set_motor_status('forward')
+        else:
+            self.set_motor_status('stop')
+        self.update_speed_chart(speed_value, record.t_ns)
+
+    def on_motor_record(self, record):
+        """电机状态记录"""
+        self.serial_process.stats.add('frames')
+        self.record_telemetry(record.t_ns, motor_state=record.state, motor_value=record.value)
+        self.motor_view.set_connect_state(record.state)
+
+    def on_text_record(self, record):
+        """插件输出的文本追加到接收区；暂停时先保留，恢复后随暂存数据显示"""
+        text = f"[{record.source}] {record.text}\n"
+        if self.serial_process.last_read_held:
+            self.held_text.append((self.serial_process.last_read_ns, text))
+            return
+        self.append_to_receive(text)
 
-    def append_to_receive(self, text):
-        """将文本追加到接收文本框"""
-        cursor = self.ui.receive_tEdit.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        cursor.insertText(text)
-        self.ui.receive_tEdit.setTextCursor(cursor)
-        self.ui.receive_tEdit.ensureCursorVisible()
+    def append_to_receive(self, text, highlight=False):
+        """将文本追加到接收文本框（先缓存，由显示调节器成批写入）"""
+        self.display_governor.append(text, highlight)
 
     def send_data(self):
         """发送数据"""
@@ -371,15 +520,35 @@ class SerialAppClass(QMainWindow):
             QMessageBox.warning(self, "提示", "请先打开串口")
             return
 
-        if not self.ui.hex_send_chb.isChecked() and not self.actual_text:
-            QMessageBox.information(self, "提示", "请输入要发送的字符串数据")
-            return
+        # 取发送内容的字节，编辑框内容未变时复用上次的编码结果
+        is_text = False
+        if self.payload.loaded:
+            byte_data = self.payload.data
+        elif self.ui.hex_send_chb.isChecked():
+            byte_data = self.payload.from_hex(self.hex_input)
+            if not byte_data:
+                QMessageBox.information(self, "提示", "请输入要发送的十六进制数据")
+                return
+            incomplete = self.hex_input.incomplete_rows()
+            if incomplete:
+                # 中间行的半个字节拼接后会使其后的字节全部错位，不发送
+                QMessageBox.warning(self, "提示", f"第 {incomplete[0] + 1} 行有不完整的字节，请补全后再发送")
+                return
+        else:
+            byte_data = self.payload.from_text(self.actual_text)
+            if not byte_data:
+                QMessageBox.information(self, "提示", "请输入要发送的字符串数据")
+                return
+            is_text = True
 
-        if self.ui.hex_send_chb.isChecked() and not self.actual_hex_text:
-            QMessageBox.information(self, "提示", "请输入要发送的十六进制数据")
-            return
+        # 按设置追加校验值：分帧时校验值在帧内；字符串发送不分帧时放在行尾换行之前
+        if self.send_checksum != "none":
+            line_mode = self.send_framing == "none" and is_text
+            byte_data = append_checksum(self.send_checksum, byte_data, line_mode)
+        if self.send_framing != "none":
+            byte_data = encode_frame(self.send_framing, byte_data)
 
-        if self.serial_process.send_data(self.actual_text, self.actual_hex_text, self.ui.hex_send_chb.isChecked()):
+        if self.serial_process.send_bytes(byte_data):
             # 发送成功
             pass
 
@@ -394,9 +563,11 @@ class SerialAppClass(QMainWindow):
             self.ui.statusbar.showMessage("文件发送完成", 1000)  # 显示3秒
 
     def clear_receive_data(self):
-        """清空接收数据"""
-        self.ui.receive_tEdit.clear()
-        self.serial_process.reset_stats()
+        """清空接收数据（收发统计不随显示清空）"""
+        self.display_governor.clear()
+        self.serial_process.clear_held()
+        self.held_text.clear()
+        self.timestamper.at_line_start = True
 
     def clear_send_data(self):
         """清空发送数据"""
@@ -405,11 +576,12 @@ class SerialAppClass(QMainWindow):
             self.on_auto_send_changed()
         self.actual_text = ""
         self.ui.send_tEdit.clear()
+        if self.payload.loaded:
+            self.unload_payload()
 
     def clear_send_hex_data(self):
         """清空发送十六进制数据"""
-        self.ui.send_hex_tEdit.clear()
-        self.actual_hex_text = ""
+        self.hex_input.clear()
 
     def toggle_pause_receive(self):
         """暂停/恢复接收"""
@@ -417,11 +589,32 @@ class SerialAppClass(QMainWindow):
             self.serial_process.pause_receive(True)
             self.ui.pause_receive_btn.setText("恢复接收")
         else:
-            self.serial_process.pause_receive(False)
+            held = self.serial_process.pause_receive(False)
             self.ui.pause_receive_btn.setText("暂停接收")
+            self.show_held_data(held)
+
+    def show_held_data(self, held):
+        """显示暂停期间暂存的数据（由显示调节器按负载决定显示方式）
+
+        插件文本与接收时一样排在所属那次读取的数据之前。
+        """
+        held_text = self.held_text
+        for read_ns, raw in held:
+            while held_text and held_text[0][0] <= read_ns:
+                self.append_to_receive(held_text.popleft()[1])
+            self.receive_data_size += len(raw)
+            display_text = self.render_received(raw, read_ns)
+            if display_text:
+                self.append_to_receive(display_text)
+        while held_text:
+            self.append_to_receive(held_text.popleft()[1])
+        if held:
+            self.ui.statusbar.showMessage(f"已显示暂停期间接收的 {sum(len(raw) for _, raw in held)} 字节", 3000)
 
     def save_receive_data(self):
         """保存接收数据"""
+        # 先写入尚未显示的数据
+        self.display_governor.flush()
         # 先检查是否有预设的保存路径
         preset_path = self.ui.file_receive_lEdit.text().strip()
 
@@ -452,7 +645,7 @@ class SerialAppClass(QMainWindow):
         default_name = f"serial_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
 
         file_path, _ = QFileDialog.getSaveFileName(
-            self, "设置接收数据保存路径", default_name, "文本文件 (*.txt)"
+            self, "设置接收数据保存路径", default_name, "文本文件 (*.txt);;压缩录制 (*.pmcap)"
         )
 
         if file_path:
@@ -484,7 +677,8 @@ class SerialAppClass(QMainWindow):
 
     def on_timestamp_changed(self, state):
         """时间戳显示切换"""
-        pass
+        if state:
+            self.timestamper.prev_line_ns = None
 
     def on_flow_control_changed(self, state):
         """流控制设置改变"""
@@ -495,10 +689,15 @@ class SerialAppClass(QMainWindow):
 
     def on_port_opened(self):
         """串口打开成功"""
+        # 上次连接残留的半行不能拼到新连接的数据前面
+        self.plugin_host.reset()
+        self.ui.open_btn.setText("关闭串口")
         self.ui.statusbar.showMessage("串口已打开", 3000)
 
     def on_port_closed(self):
         """串口关闭"""
+        self.plugin_host.reset()
+        self.held_text.clear()
         self.ui.statusbar.showMessage("串口已关闭", 3000)
 
     def on_serial_error(self, error_msg):
@@ -588,7 +787,10 @@ class SerialAppClass(QMainWindow):
         saved_port = serial_settings.get("port", "")
 
         # 智能选择端口：如果保存的端口可用则使用，否则使用第一个可用端口
-        if saved_port and self.config_manager.is_port_available(saved_port):
+        if saved_port and is_network_target(saved_port):
+            self.ui.port_cb.setCurrentText(saved_port)
+            self.update_port_info_display()
+        elif saved_port and self.config_manager.is_port_available(saved_port):
             self.ui.port_cb.setCurrentText(saved_port)
         else:
             # 获取第一个可用端口
@@ -601,6 +803,8 @@ class SerialAppClass(QMainWindow):
         self.ui.parity_cb.setCurrentText(serial_settings.get("parity", "无"))
         self.ui.databits_cb.setCurrentText(serial_settings.get("databits", "8"))
         self.ui.stopbits_cb.setCurrentText(serial_settings.get("stopbits", "1"))
+        read_buffer_kb = serial_settings.get("read_buffer_kb", SerialProcess.DEFAULT_READ_BUFFER // 1024)
+        self.serial_process.set_read_buffer_size(max(0, int(read_buffer_kb)) * 1024)
 
         # 加载发送设置
         send_settings = last_settings.get("send", {})
@@ -612,6 +816,46 @@ class SerialAppClass(QMainWindow):
         self.ui.hex_receive_chb.setChecked(receive_settings.get("hex_receive", False))
         self.ui.timestamp_chb.setChecked(receive_settings.get("timestamp", False))
         self.ui.auto_clearReceive_chb.setChecked(receive_settings.get("auto_clear_receive", False))
+        timestamp_mode = receive_settings.get("timestamp_mode", "abs_ms")
+        self.timestamper.set_mode(timestamp_mode)
+        if timestamp_mode in self.timestamp_mode_actions:
+            self.timestamp_mode_actions[timestamp_mode].setChecked(True)
+        self.capture_codec = receive_settings.get("capture_codec", "zlib")
+        if self.capture_codec in self.capture_codec_actions:
+            self.capture_codec_actions[self.capture_codec].setChecked(True)
+        self.display_auto_action.setChecked(receive_settings.get("display_auto", True))
+
+        # 加载校验设置
+        protocol_settings = last_settings.get("protocol", {})
+        self.send_checksum = protocol_settings.get("send_checksum", "none")
+        if self.send_checksum not in self.send_checksum_actions:
+            self.send_checksum = "none"
+        self.send_checksum_actions[self.send_checksum].setChecked(True)
+        receive_checksum = protocol_settings.get("receive_checksum", "none")
+        if receive_checksum not in self.receive_checksum_actions:
+            receive_checksum = "none"
+        self.receive_checksum_actions[receive_checksum].setChecked(True)
+        self.set_receive_checksum(receive_checksum)
+        self.send_framing = protocol_settings.get("send_framing", "none")
+        if self.send_framing not in self.send_framing_actions:
+            self.send_framing = "none"
+        self.send_framing_actions[self.send_framing].setChecked(True)
+        receive_framing = protocol_settings.get("receive_framing", "none")
+        if receive_framing not in self.receive_framing_actions:
+            receive_framing = "none"
+        self.receive_framing_actions[receive_framing].setChecked(True)
+        self.set_receive_framing(receive_framing)
+        for name in protocol_settings.get("disabled_plugins", []):
+            if name in self.plugin_actions:
+                self.plugin_actions[name].setChecked(False)
+
+        # 加载转发服务设置
+        bridge_settings = last_settings.get("bridge", {})
+        self.bridge_port = bridge_settings.get("port", 5000)
+        self.bridge_policy = bridge_settings.get("policy", "drop")
+        if self.bridge_policy not in self.bridge_policy_actions:
+            self.bridge_policy = "drop"
+        self.bridge_policy_actions[self.bridge_policy].setChecked(True)
 
         # 加载流控制
         flow_control = last_settings.get("flow_control", {})
@@ -635,12 +879,15 @@ class SerialAppClass(QMainWindow):
         if index >= 0:
             combo_box.setCurrentIndex(index)
 
-    def update_port_info_display(self, index):
+    def update_port_info_display(self, index=None):
         """更新端口信息显示"""
         port_name = self.ui.port_cb.currentText()
 
+        # 网络端点没有设备信息，只显示解析结果
+        if is_network_target(port_name):
+            self.show_network_info(port_name)
         # 检查是否是有效端口
-        if port_name and port_name != "未检测到串口":
+        elif port_name and port_name != "未检测到串口":
             port_info = self.get_port_info(port_name)
             if port_info:
                 self.show_port_info(port_info)
@@ -671,6 +918,13 @@ class SerialAppClass(QMainWindow):
         for port_name in current_ports:
             self.ui.port_cb.addItem(port_name)
 
+        # 输入的网络端点不在串口列表中，刷新后保留
+        if is_network_target(current_selection):
+            self.ui.port_cb.addItem(current_selection)
+            self.ui.port_cb.setCurrentText(current_selection)
+            self.update_port_info_display()
+            return
+
         # 如果没有端口，显示提示
         if len(current_ports) == 0:
             self.ui.port_cb.addItem("未检测到串口")
@@ -727,6 +981,19 @@ class SerialAppClass(QMainWindow):
 
         self.ui.port_info_lEdit.setPlainText(info_text)
 
+    def show_network_info(self, port_name):
+        """显示网络端点信息"""
+        try:
+            target = parse_target(port_name)
+        except ValueError as e:
+            self.ui.port_info_lEdit.setPlainText(str(e))
+            return
+        if target[0] == 'tcp':
+            info_text = f"网络端点: TCP\n主机: {target[1]}\n端口: {target[2]}"
+        else:
+            info_text = f"网络端点: Unix 域套接字\n路径: {target[1]}"
+        self.ui.port_info_lEdit.setPlainText(info_text + "\n（波特率等串口参数不生效）")
+
     def on_auto_clear_changed(self, state):
         """自动清空复选框状态改变"""
         if state:
@@ -745,7 +1012,7 @@ class SerialAppClass(QMainWindow):
                 return
 
             send_text = self.ui.send_tEdit.toPlainText()
-            if not send_text:
+            if not send_text and not self.payload.loaded:
                 QMessageBox.warning(self, "提示", "请输入要发送的数据")
                 return
 
@@ -778,7 +1045,7 @@ class SerialAppClass(QMainWindow):
     def comprehensive_auto_clear(self):
         """综合自动清空策略"""
         if self.receive_data_size > self.max_size:
-            self.ui.receive_tEdit.clear()
+            self.display_governor.clear()
             self.receive_data_size = 0
 
     def auto_send_function(self):
@@ -824,122 +1091,112 @@ class SerialAppClass(QMainWindow):
 
     def restore_actual_text(self):
         """恢复实际文本显示（编辑模式）"""
-        # 还原实际文本
-        # print("actual_text:",self.actual_text)
+        # 还原实际文本，同步内容没有变化，不需要重新编码
+        self.text_hex_sync.suspend(True)
         self.ui.send_tEdit.setPlainText(self.actual_text)
+        self.text_hex_sync.suspend(False)
 
     def format_to_display_mode(self):
         """格式化为显示模式（非编辑模式）"""
+        # 先把未同步的改动同步完，之后文本框里是显示格式
+        self.text_hex_sync.flush()
         self.actual_text = self.ui.send_tEdit.toPlainText()
-        # print("actual_text",  self.actual_text)
-        # 按真正的换行符分割文本
-        lines = self.actual_text.split('\n')
-        display_lines = []
-        # print("lines", lines)
-        line_number = 0
-
-        if all(line == '' for line in lines):
-            for i in range(0, len(lines) - 1):
-                display_lines.append('[\\n]\n')
-        else:
-            # 处理开头的空行
-            for line_number, line in enumerate(lines):
-                if line == '':
-                    display_lines.append('[\\n]\n')
-                else:
-                    break
-            # 从 line_number 开始继续处理剩余行
-            for i in range(line_number, len(lines)):
-                line = lines[i]
-                if line != '':
-                    if i < len(lines) - 1:
-                        display_lines.append(line + '\n')
-                    else:
-                        display_lines.append(line)
-                else:
-                    display_lines.append('[\\n]\n')
 
-        display_text = ''.join(display_lines)
-        # print("display_text", display_text)
+        # 文本没有变化时直接复用上次的显示文本
+        source, display_text = self.display_mode_cache
+        if source != self.actual_text:
+            # 按真正的换行符分割文本，空行显示为 [\n]
+            lines = self.actual_text.split('\n')
+            last = len(lines) - 1
+            if not any(lines):
+                display_text = '[\\n]\n' * last
+            else:
+                display_text = ''.join(['[\\n]\n' if not line else (line + '\n' if i < last else line)
+                                        for i, line in enumerate(lines)])
+            self.display_mode_cache = (self.actual_text, display_text)
+
+        self.text_hex_sync.suspend(True)
         self.ui.send_tEdit.blockSignals(True)
         self.ui.send_tEdit.setPlainText(display_text)
         self.ui.send_tEdit.blockSignals(False)
+        self.text_hex_sync.suspend(False)
+
+    def get_send_source_text(self):
+        """字符串发送区的实际文本（失去焦点时文本框显示的是格式化文本）"""
+        if self.ui.send_tEdit.hasFocus():
+            return self.ui.send_tEdit.toPlainText()
+        return self.actual_text
 
     def on_sync_mode_changed(self, checked):
         """同步模式切换"""
         if checked:
-            self.sync_text_to_hex(self.actual_text)
+            self.text_hex_sync.set_enabled(True)
             self.ui.send_hex_tEdit.setEnabled(False)
             self.ui.hex_send_chb.setChecked(False)
         else:
+            self.text_hex_sync.set_enabled(False)
             self.ui.send_hex_tEdit.setEnabled(True)
-            self.ui.send_hex_tEdit.clear()
-
-    def on_text_edit_changed(self):
-        """字符串文本框内容变化"""
-        if self.ui.send_sync_rbtn.isChecked() and self.ui.send_tEdit.hasFocus():
-            # 保存当前光标位置
-            cursor = self.ui.send_tEdit.textCursor()
-            cursor_position = cursor.position()
-
-            self.sync_text_to_hex(self.ui.send_tEdit.toPlainText())
-
-            # 恢复光标位置
-            cursor.setPosition(cursor_position)
-            self.ui.send_tEdit.setTextCursor(cursor)
-
-    def on_hex_edit_changed(self):
-        """十六进制文本框内容变化"""
-        # 阻塞信号防止递归
-        self.ui.send_hex_tEdit.blockSignals(True)
-
-        current_text = self.ui.send_hex_tEdit.toPlainText()
-        cursor = self.ui.send_hex_tEdit.textCursor()
-        original_position = cursor.position()
+            self.hex_input.clear()
 
-        # 移除空格计算长度
-        hex_without_spaces = current_text.replace(' ', '')
+    @property
+    def actual_hex_text(self):
+        """十六进制发送内容（不带空格），由 HexInputController 随编辑增量维护"""
+        return self.hex_input.hex_text()
 
-        # 计算原始文本中光标前的有效字符数
-        text_before_cursor = current_text[:original_position]
-        hex_chars_before_cursor = text_before_cursor.replace(' ', '')
-        hex_chars_count_before = len(hex_chars_before_cursor)
+    @actual_hex_text.setter
+    def actual_hex_text(self, text):
+        self.hex_input.set_hex_text(text)
 
-        # 格式化文本
-        formatted_text = ' '.join([hex_without_spaces[i:i + 2] for i in range(0, len(hex_without_spaces), 2)])
-
-        # 更新文本框
-        self.ui.send_hex_tEdit.setPlainText(formatted_text)
+    def load_payload_file(self):
+        """从文件载入发送数据"""
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "载入发送数据", "", "所有文件 (*)"
+        )
+        if not file_path:
+            return
 
-        # 更新实际文本（不带空格）
-        self.actual_hex_text = hex_without_spaces
+        try:
+            self.payload.load_file(file_path)
+        except OSError as e:
+            QMessageBox.critical(self, "错误", f"载入失败: {e}")
+            return
+        self.show_loaded_payload()
 
-        # 计算新光标位置
-        if formatted_text:
-            # 计算新位置：每2个字符后有一个空格
-            new_position = hex_chars_count_before + (hex_chars_count_before // 2)
-            new_position = min(new_position, len(formatted_text))
+    def load_payload_clipboard(self):
+        """从剪贴板载入发送数据（优先取二进制数据）"""
+        mime_data = QApplication.clipboard().mimeData()
+        if mime_data.hasFormat("application/octet-stream"):
+            data = bytes(mime_data.data("application/octet-stream"))
+        else:
+            data = mime_data.text().encode('utf-8')
+        if not data:
+            QMessageBox.information(self, "提示", "剪贴板中没有数据")
+            return
 
-            cursor.setPosition(new_position)
-            self.ui.send_hex_tEdit.setTextCursor(cursor)
+        self.payload.load(data, 'clipboard')
+        self.show_loaded_payload()
 
-        # 恢复信号
-        self.ui.send_hex_tEdit.blockSignals(False)
+    def show_loaded_payload(self):
+        """显示载入的数据：小数据放进十六进制框继续编辑，大数据只读分页显示"""
+        if not self.payload.is_large() and self.ui.send_hex_tEdit.isEnabled():
+            data = self.payload.data
+            self.payload.unload()
+            self.hex_input.set_hex_text(data.hex())
+            self.ui.hex_send_chb.setChecked(True)
+            return
 
-    def sync_text_to_hex(self, text_to_convert):
-        """从字符串同步到十六进制"""
-        try:
-            # 转换为十六进制
-            if text_to_convert:
-                hex_text = text_to_convert.encode('utf-8').hex()
-                # 格式化为每两个字符一组，用空格分隔
-                self.actual_hex_text = ' '.join([hex_text[i:i + 2] for i in range(0, len(hex_text), 2)])
-                self.ui.send_hex_tEdit.setPlainText(self.actual_hex_text)
-            else:
-                self.ui.send_hex_tEdit.clear()
+        self.ui.send_hex_tEdit.hide()
+        self.payload_view.refresh()
+        self.payload_view.show()
+        self.ui.send_tEdit.setEnabled(False)
+        self.ui.statusbar.showMessage(f"已载入{self.payload.summary()}，发送时使用载入的数据", 3000)
 
-        except Exception as e:
-            print(f"同步到十六进制时出错: {e}")
+    def unload_payload(self):
+        """卸载载入的数据，恢复编辑框"""
+        self.payload.unload()
+        self.payload_view.hide()
+        self.ui.send_hex_tEdit.show()
+        self.ui.send_tEdit.setEnabled(True)
 
     def sync_hex_to_text(self):
         """从十六进制同步到字符串"""
@@ -992,31 +1249,8 @@ class SerialAppClass(QMainWindow):
             self.ui.speed_ctrl_hsld.setMaximum(100)
 
     def set_motor_status(self, status):
-        """设置电机状态显示 - 超简版"""
-        # 重置所有标签
-        self.ui.forward_lbl.setStyleSheet("background-color: lightgray;")
-        self.ui.reversal_lbl.setStyleSheet("background-color: lightgray;")
-        self.ui.cease_lbl.setStyleSheet("background-color: lightgray;")
-
-        # 设置当前状态标签
-        if status == 'forward':
-            self.ui.forward_lbl.setStyleSheet("""
-                background-color: lightgreen; 
-                font-weight: bold; 
-                border: 2px solid green;
-            """)
-        elif status == 'reverse':
-            self.ui.reversal_lbl.setStyleSheet("""
-                background-color: lightblue; 
-                font-weight: bold; 
-                border: 2px solid blue;
-            """)
-        elif status == 'stop':
-            self.ui.cease_lbl.setStyleSheet("""
-                background-color: #ffcccc; 
-                font-weight: bold; 
-                border: 2px solid red;
-            """)
+        """设置电机状态显示"""
+        self.motor_view.set_status(status)
 
     def on_connect_clicked(self):
         """连接按钮点击"""
@@ -1030,20 +1264,24 @@ class SerialAppClass(QMainWindow):
         self.ui.hex_send_chb.setChecked(True)
         self.send_data()
 
-    def motor_data_process(self, smart_text):
-        smart_text = smart_text.strip()
-        parts = smart_text.split(',')
-        if len(parts) == 2:
-            part1_clean = parts[0].strip()
-            part2_clean = parts[1].strip()
-            if int(part1_clean) == 1:
-                self.ui.connect_btn.setText("已连接")
-            elif int(part1_clean) == 2:
-                self.ui.connect_btn.setText("未连接")
+    def init_chart_placeholder(self):
+        """图表创建前的占位显示"""
+        if not hasattr(self.ui, 'groupBox_6'):
+            return
+        if not self.ui.groupBox_6.layout():
+            self.ui.groupBox_6.setLayout(QVBoxLayout())
+        placeholder = QLabel("等待速度数据...")
+        placeholder.setAlignment(QtCore.Qt.AlignCenter)
+        self.ui.groupBox_6.layout().addWidget(placeholder)
+        self.ui.groupBox_6.setTitle("速度可视化")
 
     def init_speed_chart(self):
         """初始化速度图表 - 放在groupBox_6中"""
         try:
+            # 首次使用时才导入绘图库，加快启动
+            import pyqtgraph as pg
+            from Serial_Port.timeseries_pyramid import TimeSeriesPyramid
+
             # 确保groupBox_6存在
             if hasattr(self.ui, 'groupBox_6'):
                 # 清空groupBox_6中可能存在的旧布局
@@ -1062,14 +1300,30 @@ class SerialAppClass(QMainWindow):
                 self.plot_widget.setBackground('white')
                 self.plot_widget.setTitle("速度曲线", color='blue', size='12pt')
                 self.plot_widget.setLabel('left', '速度', units='rpm')
-                self.plot_widget.setLabel('bottom', '发送数')
+                self.plot_widget.setLabel('bottom', '时间', units='s')
                 self.plot_widget.showGrid(x=True, y=True, alpha=0.3)
 
                 # 设置坐标轴范围
+                self.plot_widget.setXRange(0, self.CHART_FOLLOW_SECONDS)
                 self.plot_widget.setYRange(-100, 100)
 
-                # 创建曲线
+                # 创建曲线：原始数据或聚合后的最小/最大包络，以及聚合后的均值
                 self.speed_curve = self.plot_widget.plot(pen=pg.mkPen(color='blue', width=2))
+                self.speed_mean_curve = self.plot_widget.plot(pen=pg.mkPen(color='orange', width=1))
+
+                # 速度数据的多分辨率存储，缩放时按可见范围选择合适的层
+                self.speed_series = TimeSeriesPyramid()
+                self.chart_start_ns = None
+                self.chart_follow = True
+                self.chart_dirty = False
+                view_box = self.plot_widget.getViewBox()
+                view_box.sigRangeChangedManually.connect(self.on_chart_range_manual)
+                view_box.sigXRangeChanged.connect(self.on_chart_range_changed)
+
+                # 固定频率重绘，与数据到达频率无关
+                self.chart_timer: QTimer = QTimer()
+                self.chart_timer.timeout.connect(self.redraw_speed_chart)
+                self.chart_timer.start(self.CHART_INTERVAL)
 
                 # 添加一条零线作为参考
                 zero_line = pg.InfiniteLine(pos=0, angle=0, pen=pg.mkPen('gray', width=1, style=QtCore.Qt.DashLine))
@@ -1091,47 +1345,701 @@ class SerialAppClass(QMainWindow):
             import traceback
             traceback.print_exc()
 
-    def update_speed_chart(self, speed, count):
-        """更新速度图表"""
+    def update_speed_chart(self, speed, read_ns):
+        """更新速度图表（只追加数据，由定时器重绘）"""
         try:
-            # 检查图表是否已初始化
+            # 首次收到数据时创建图表
+            if self.plot_widget is None:
+                self.init_speed_chart()
             if not hasattr(self, 'speed_curve'):
                 print("图表未初始化")
                 return
 
-            # 添加到历史数据
-            self.speed_history.append(speed)
-            self.send_count_history.append(count)
-
-            # 更新曲线数据
-            self.speed_curve.setData(list(self.send_count_history), list(self.speed_history))
-
-            # 自动调整X轴范围（显示最近100个点）
-            if count > 100:
-                self.plot_widget.setXRange(count - 100, count)
-            else:
-                self.plot_widget.setXRange(0, max(100, count))
-
-            # 自动调整Y轴范围，带边距
-            if len(self.speed_history) > 0:
-                min_val = min(self.speed_history)
-                max_val = max(self.speed_history)
-                margin = max(abs(min_val), abs(max_val), 10) * 0.1  # 10%边距，至少10
-                self.plot_widget.setYRange(min_val - margin, max_val + margin)
+            # 横轴为相对第一个数据的秒数
+            if self.chart_start_ns is None:
+                self.chart_start_ns = read_ns
+            self.speed_series.append((read_ns - self.chart_start_ns) / 1e9, speed)
+            self.chart_dirty = True
 
         except Exception as e:
             print(f"更新图表时出错: {e}")
 
+    def redraw_speed_chart(self):
+        """按可见范围从多分辨率存储取数据重绘"""
+        if not self.chart_dirty:
+            return
+        self.chart_dirty = False
+        probe = self.serial_process.probe
+        start_ns = time.monotonic_ns() if probe.enabled else 0
+
+        from Serial_Port.timeseries_pyramid import envelope
+        series = self.speed_series
+        if not len(series):
+            self.speed_curve.clear()
+            self.speed_mean_curve.clear()
+            return
+
+        view_box = self.plot_widget.getViewBox()
+        x0, x1 = view_box.viewRange()[0]
+        latest = series.times.data[series.times.size - 1]
+        if self.chart_follow and latest > x1:
+            # 跟随最新数据，保持当前显示时长
+            x0, x1 = latest - (x1 - x0), latest
+            self.plot_widget.setXRange(x0, x1, padding=0)
+            self.chart_dirty = False
+
+        level, t, v_min, v_max, mean = series.query(x0, x1, max(int(view_box.width()), 100))
+        if level == 0:
+            self.speed_curve.setData(t, v_min)
+            self.speed_mean_curve.clear()
+        else:
+            self.speed_curve.setData(*envelope(t, v_min, v_max))
+            self.speed_mean_curve.setData(t, mean)
+
+        # 跟随时自动调整Y轴范围，带边距
+        if self.chart_follow and len(t):
+            min_val = float(v_min.min())
+            max_val = float(v_max.max())
+            margin = max(abs(min_val), abs(max_val), 10) * 0.1  # 10%边距，至少10
+            self.plot_widget.setYRange(min_val - margin, max_val + margin, padding=0)
+        if start_ns:
+            probe.record('chart_draw', time.monotonic_ns() - start_ns)
+
+    def on_chart_range_manual(self, *args):
+        """手动缩放/平移图表后停止跟随"""
+        self.chart_follow = False
+
+    def on_chart_range_changed(self, view_box, x_range):
+        """可见范围变化时重绘；平移到最新数据处时恢复跟随"""
+        self.chart_dirty = True
+        series = self.speed_series
+        if not self.chart_follow and len(series) and x_range[1] >= series.times.data[series.times.size - 1]:
+            self.chart_follow = True
+
     def clear_chart_data(self):
         """清空图表数据"""
-        if hasattr(self, 'speed_history'):
-            self.speed_history.clear()
-            self.send_count_history.clear()
-            self.send_count = 0
-            if hasattr(self, 'speed_curve'):
-                self.speed_curve.clear()
+        self.send_count = 0
+        if self.plot_widget is not None and hasattr(self, 'speed_series'):
+            self.speed_series.clear()
+            self.chart_start_ns = None
+            self.chart_dirty = True
+
+    def init_menus(self):
+        """初始化菜单栏和状态栏常驻标签"""
+        # 触发器高亮格式
+        self.highlight_format = QTextCharFormat()
+        self.highlight_format.setBackground(QColor("#fff59d"))
+
+        # 状态栏显示触发器计数
+        self.trigger_counter_lbl = QLabel("")
+        self.ui.statusbar.addPermanentWidget(self.trigger_counter_lbl)
+        self.trigger_counters = {}
+
+        # 状态栏显示收发速率，固定低频刷新
+        self.stats_lbl = QLabel("")
+        self.ui.statusbar.addPermanentWidget(self.stats_lbl)
+        self.stats_timer: QTimer = QTimer()
+        self.stats_timer.timeout.connect(self.update_stats_display)
+        self.stats_timer.start(1000)
+
+        # 接收显示负载调节，状态栏常驻显示当前模式
+        self.display_governor = DisplayGovernor(self.ui.receive_tEdit, self.serial_process.stats,
+                                                self.highlight_format, self.serial_process.probe, self)
+        self.display_mode_lbl = QLabel(self.display_governor.status_text())
+        self.ui.statusbar.addPermanentWidget(self.display_mode_lbl)
+        self.display_governor.mode_changed.connect(self.on_display_mode_changed)
+
+        # 接收菜单：时间戳格式
+        self.receive_menu = self.ui.menubar.addMenu("接收")
+        timestamp_menu = self.receive_menu.addMenu("时间戳格式")
+        self.timestamp_mode_group = QActionGroup(self)
+        self.timestamp_mode_actions = {}
+        for mode, title in LineTimestamper.MODES:
+            action = timestamp_menu.addAction(title)
+            action.setCheckable(True)
+            action.setChecked(mode == self.timestamper.mode)
+            action.setData(mode)
+            self.timestamp_mode_group.addAction(action)
+            self.timestamp_mode_actions[mode] = action
+        self.timestamp_mode_group.triggered.connect(self.on_timestamp_mode_changed)
+
+        # 接收菜单：压缩录制
+        self.receive_menu.addSeparator()
+        self.capture_writer = None
+        self.closing_captures = set()  # 后台写完之前保留引用
+        self.capture_codec = "zlib"
+        self.capture_action = self.receive_menu.addAction("压缩录制")
+        self.capture_action.setCheckable(True)
+        self.capture_action.toggled.connect(self.on_capture_toggled)
+        codec_menu = self.receive_menu.addMenu("录制压缩格式")
+        self.capture_codec_group = QActionGroup(self)
+        self.capture_codec_actions = {}
+        for codec in CODECS:
+            action = codec_menu.addAction(codec)
+            action.setCheckable(True)
+            action.setChecked(codec == self.capture_codec)
+            action.setData(codec)
+            self.capture_codec_group.addAction(action)
+            self.capture_codec_actions[codec] = action
+        self.capture_codec_group.triggered.connect(self.on_capture_codec_changed)
+
+        # 接收菜单：遥测记录
+        self.telemetry_store = None
+        self.telemetry_action = self.receive_menu.addAction("遥测记录")
+        self.telemetry_action.setCheckable(True)
+        self.telemetry_action.toggled.connect(self.on_telemetry_toggled)
+        self.receive_menu.addAction("导出遥测 CSV...", self.export_telemetry_csv)
+
+        # 接收菜单：负载过高时自动降级显示
+        self.receive_menu.addSeparator()
+        self.display_auto_action = self.receive_menu.addAction("负载过高时自动降级显示")
+        self.display_auto_action.setCheckable(True)
+        self.display_auto_action.setChecked(True)
+        self.display_auto_action.toggled.connect(self.on_display_auto_toggled)
+        self.receive_menu.addAction("读缓冲大小...", self.set_read_buffer_size)
+
+        # 发送菜单：载入大数据
+        self.send_menu = self.ui.menubar.addMenu("发送")
+        self.send_menu.addAction("从文件载入...", self.load_payload_file)
+        self.send_menu.addAction("从剪贴板载入", self.load_payload_clipboard)
+        self.send_menu.addAction("卸载载入的数据", self.unload_payload)
+
+        # 协议菜单
+        self.protocol_menu = self.ui.menubar.addMenu("协议")
+        self.protocol_menu.addAction("Modbus RTU 监视器", self.show_modbus_monitor)
+        self.modbus_monitor = None
+        self.protocol_menu.addSeparator()
+
+        # 协议菜单：发送追加校验、接收按行校验
+        self.send_checksum = "none"
+        self.receive_checksum = "none"
+        self.checksum_verifier = None
+        self.send_checksum_actions, self.send_checksum_group = self.add_choice_menu(
+            "发送追加校验", ALGORITHM_TITLES, self.on_send_checksum_changed)
+        self.receive_checksum_actions, self.receive_checksum_group = self.add_choice_menu(
+            "接收按行校验", ALGORITHM_TITLES, self.on_receive_checksum_changed)
+
+        # 协议菜单：收发分帧（COBS/SLIP）
+        self.protocol_menu.addSeparator()
+        self.send_framing = "none"
+        self.receive_framing = "none"
+        self.frame_decoder = None
+        self.send_framing_actions, self.send_framing_group = self.add_choice_menu(
+            "发送分帧", FRAMING_TITLES, self.on_send_framing_changed)
+        self.receive_framing_actions, self.receive_framing_group = self.add_choice_menu(
+            "接收分帧", FRAMING_TITLES, self.on_receive_framing_changed)
+
+        # 协议菜单：解码插件，可随时禁用耗时的插件
+        self.protocol_menu.addSeparator()
+        self.plugin_menu = self.protocol_menu.addMenu("解码插件")
+        self.plugin_menu.addAction("插件耗时统计", self.show_plugin_timing)
+        self.plugin_menu.addSeparator()
+        self.plugin_actions = {}
+        for plugin in self.plugin_host.plugins:
+            self.add_plugin_action(plugin)
+
+        # 协议菜单：多进程解码（耗时的解码放到工作进程，界面进程只负责显示）
+        self.protocol_menu.addSeparator()
+        self.decode_pool = None
+        self.decode_pool_actions, self.decode_pool_group = self.add_choice_menu(
+            "多进程解码", tuple((name, spec.title) for name, spec in DECODERS.items()),
+            self.on_decode_pool_changed)
+
+        # 工具菜单
+        self.tools_menu = self.ui.menubar.addMenu("工具")
+        self.tools_menu.addAction("触发器统计", self.show_trigger_stats)
+        self.tools_menu.addAction("重新加载触发器", self.reload_triggers)
+        self.tools_menu.addSeparator()
+        self.emulation_action = self.tools_menu.addAction("设备模拟模式")
+        self.emulation_action.setCheckable(True)
+        self.emulation_action.toggled.connect(self.on_emulation_toggled)
+        self.tools_menu.addAction("模拟应答时间分布", self.show_emulation_stats)
+        self.tools_menu.addSeparator()
+        self.tools_menu.addAction("诊断面板", self.show_diagnostics_panel)
+        self.diagnostics_panel = None
+        self.tools_menu.addAction("字节分布", self.show_byte_stats_panel)
+        self.byte_stats_panel = None
+        self.tools_menu.addSeparator()
+
+        # 工具菜单：TCP 转发服务，状态栏显示客户端数
+        self.tcp_bridge = None
+        self.bridge_port = 5000
+        self.bridge_policy = "drop"
+        self.bridge_action = self.tools_menu.addAction("TCP 转发服务")
+        self.bridge_action.setCheckable(True)
+        self.bridge_action.toggled.connect(self.on_bridge_toggled)
+        policy_menu = self.tools_menu.addMenu("转发客户端过慢时")
+        self.bridge_policy_group = QActionGroup(self)
+        self.bridge_policy_actions = {}
+        for policy, title in POLICY_TITLES:
+            action = policy_menu.addAction(title)
+            action.setCheckable(True)
+            action.setChecked(policy == self.bridge_policy)
+            action.setData(policy)
+            self.bridge_policy_group.addAction(action)
+            self.bridge_policy_actions[policy] = action
+        self.bridge_policy_group.triggered.connect(self.on_bridge_policy_changed)
+        self.bridge_lbl = QLabel("")
+        self.ui.statusbar.addPermanentWidget(self.bridge_lbl)
+        self.tools_menu.addSeparator()
+        self.profile_action = self.tools_menu.addAction(f"性能采样（{HotPathProfiler.DEFAULT_WINDOW}秒）")
+        self.profile_action.setCheckable(True)
+        self.profile_action.toggled.connect(self.on_profile_toggled)
+
+        # 设置了环境变量时启动即开始采样
+        if self.profiler.start_from_env():
+            self.profile_action.blockSignals(True)
+            self.profile_action.setChecked(True)
+            self.profile_action.blockSignals(False)
+
+    def on_timestamp_mode_changed(self, action):
+        """时间戳格式切换"""
+        self.timestamper.set_mode(action.data())
+        self.auto_save_settings()
+
+    def on_capture_codec_changed(self, action):
+        """录制压缩格式切换（下次开始录制时生效）"""
+        self.capture_codec = action.data()
+        self.auto_save_settings()
+
+    def on_capture_toggled(self, checked):
+        """开始/停止压缩录制"""
+        if checked:
+            if not self.start_capture():
+                self.capture_action.blockSignals(True)
+                self.capture_action.setChecked(False)
+                self.capture_action.blockSignals(False)
+        else:
+            self.stop_capture()
+
+    def start_capture(self):
+        """开始压缩录制：保存路径为 .pmcap 时直接使用，否则选择文件"""
+        file_path = self.ui.file_receive_lEdit.text().strip()
+        if not file_path.endswith(".pmcap"):
+            default_name = f"serial_capture_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pmcap"
+            file_path, _ = QFileDialog.getSaveFileName(
+                self, "压缩录制保存路径", default_name, "压缩录制 (*.pmcap)"
+            )
+            if not file_path:
+                return False
+
+        try:
+            self.capture_writer = CaptureWriter(file_path, self.capture_codec)
+        except (OSError, ValueError) as e:
+            QMessageBox.critical(self, "错误", f"无法开始录制: {e}")
+            return False
+        self.capture_writer.error_occurred.connect(self.on_capture_error)
+        self.serial_process.data_received.connect(self.on_capture_data)
+        self.ui.statusbar.showMessage(f"开始压缩录制（{self.capture_codec}）: {file_path}", 3000)
+        return True
+
+    def stop_capture(self):
+        """停止录制，排队的数据块由工作线程在后台写完"""
+        if self.capture_writer is None:
+            return
+        self.serial_process.data_received.disconnect(self.on_capture_data)
+        writer = self.capture_writer
+        self.capture_writer = None
+        self.closing_captures.add(writer)
+        writer.finished.connect(lambda: self.on_capture_finished(writer))
+        writer.close()
+        self.ui.statusbar.showMessage(f"正在写入录制文件: {writer.path}", 3000)
+
+    def on_capture_finished(self, writer):
+        """录制文件写完"""
+        self.closing_captures.discard(writer)
+        if writer.failed:
+            return
+        ratio = writer.compressed_bytes / writer.raw_bytes if writer.raw_bytes else 0
+        self.ui.statusbar.showMessage(
+            f"录制已保存: {writer.path}（{len(writer.blocks)} 块，压缩率 {ratio:.1%}）", 5000)
+
+    def on_capture_error(self, error_msg):
+        """录制出错（丢块或写文件失败）"""
+        print(error_msg)
+        self.ui.statusbar.showMessage(error_msg, 5000)
+
+    def on_capture_data(self, data):
+        """接收数据写入录制（只拼接，不压缩）"""
+        self.capture_writer.write(data.data(), self.serial_process.last_read_ns)
+
+    def record_telemetry(self, t_ns, **values):
+        """记录解析出的遥测数值"""
+        if self.telemetry_store is not None:
+            self.telemetry_store.append_row(t_ns, values)
+
+    def on_telemetry_toggled(self, checked):
+        """开始/停止遥测记录"""
+        if not checked:
+            if self.telemetry_store is not None:
+                store = self.telemetry_store
+                self.telemetry_store = None
+                store.close()
+                self.ui.statusbar.showMessage(f"遥测已保存: {store.directory}（{store.rows_written} 行）", 5000)
+            return
+
+        base_dir = QFileDialog.getExistingDirectory(self, "选择遥测保存目录")
+        if not base_dir:
+            self.telemetry_action.blockSignals(True)
+            self.telemetry_action.setChecked(False)
+            self.telemetry_action.blockSignals(False)
+            return
+
+        # 首次使用时才导入 numpy
+        from Serial_Port.telemetry_store import TelemetryStore
+        directory = os.path.join(base_dir, f"telemetry_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+        self.telemetry_store = TelemetryStore(directory, self.TELEMETRY_FIELDS)
+        self.ui.statusbar.showMessage(f"开始遥测记录: {directory}", 3000)
+
+    def export_telemetry_csv(self):
+        """把遥测目录逐段导出为 CSV"""
+        directory = QFileDialog.getExistingDirectory(self, "选择遥测目录")
+        if not directory:
+            return
+        if not os.path.exists(os.path.join(directory, "meta.json")):
+            QMessageBox.warning(self, "提示", "所选目录不是遥测目录")
+            return
+
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "导出 CSV", os.path.basename(directory) + ".csv", "CSV 文件 (*.csv)"
+        )
+        if not file_path:
+            return
+
+        from Serial_Port.telemetry_store import TelemetryReader
+        if self.telemetry_store is not None and os.path.samefile(directory, self.telemetry_store.directory):
+            # 正在记录的目录，先写出缓冲中的数据
+            self.telemetry_store.flush()
+        try:
+            rows = TelemetryReader(directory).export_csv(file_path)
+        except (OSError, ValueError) as e:
+            QMessageBox.critical(self, "错误", f"导出失败: {e}")
+            return
+        QMessageBox.information(self, "成功", f"已导出 {rows} 行到: {file_path}")
+
+    def on_display_mode_changed(self, mode):
+        """接收显示模式切换，状态栏标签降级时标红"""
+        self.display_mode_lbl.setText(self.display_governor.status_text())
+        self.display_mode_lbl.setStyleSheet("" if mode == FULL else "color: #d32f2f;")
+        self.ui.statusbar.showMessage(self.display_governor.status_text(), 2000)
+
+    def on_display_auto_toggled(self, checked):
+        """开关自动降级显示"""
+        self.display_governor.set_auto(checked)
+        self.display_mode_lbl.setText(self.display_governor.status_text())
+        self.auto_save_settings()
+
+    def set_read_buffer_size(self):
+        """设置串口读缓冲上限"""
+        size_kb, ok = QInputDialog.getInt(
+            self, "读缓冲大小", "QSerialPort 读缓冲上限（KB，0 为不限）：",
+            self.serial_process.read_buffer_size // 1024, 0, 256 * 1024)
+        if ok:
+            self.serial_process.set_read_buffer_size(size_kb * 1024)
+            self.auto_save_settings()
+
+    def update_stats_display(self):
+        """刷新状态栏收发速率"""
+        self.stats_lbl.setText(self.serial_process.stats.status_text())
+        self.update_bridge_status()
+
+    def on_trigger_fired(self, name, latency_ns):
+        """触发器命中"""
+        self.ui.statusbar.showMessage(f"触发器[{name}]命中，响应延迟 {latency_ns / 1000:.1f} µs", 3000)
+
+    def on_trigger_highlight(self, name):
+        """触发器请求高亮当前数据"""
+        self.trigger_highlight = True
+
+    def on_trigger_counter(self, name, count):
+        """触发器计数更新"""
+        self.trigger_counters[name] = count
+        self.trigger_counter_lbl.setText("  ".join(f"{n}: {c}" for n, c in self.trigger_counters.items()))
+
+    def on_trigger_pause(self, name):
+        """触发器暂停了接收，同步按钮状态"""
+        self.ui.pause_receive_btn.setText("恢复接收")
+
+    def load_plugins(self):
+        """加载外部解码插件（启动时导入模块、扫描 entry points 较慢，放在首次绘制之后）"""
+        plugins, self.plugin_errors = discover_plugins()
+        for error in self.plugin_errors:
+            print(f"加载解码插件失败: {error}")
+        for plugin in plugins:
+            if self.plugin_host.add(plugin):
+                self.add_plugin_action(plugin)
+
+    def add_plugin_action(self, plugin):
+        action = self.plugin_menu.addAction(plugin.title or plugin.name)
+        action.setCheckable(True)
+        action.setChecked(True)
+        action.setData(plugin.name)
+        action.toggled.connect(self.on_plugin_toggled)
+        self.plugin_actions[plugin.name] = action
+
+    def on_plugin_toggled(self, checked):
+        """启用/禁用解码插件"""
+        self.plugin_host.set_enabled(self.sender().data(), checked)
+        self.auto_save_settings()
+
+    def disabled_plugins(self):
+        """已禁用的插件名，保存到配置"""
+        return [name for name, enabled in self.plugin_host.enabled.items() if not enabled]
+
+    def show_plugin_timing(self):
+        """显示各解码插件耗时"""
+        lines = self.plugin_host.timing_report()
+        if self.plugin_errors:
+            lines.append("")
+            lines.append("加载失败:")
+            lines.extend(self.plugin_errors)
+        QMessageBox.information(self, "解码插件耗时", "\n".join(lines))
+
+    def on_bridge_toggled(self, checked):
+        """开启/关闭 TCP 转发服务"""
+        if not checked:
+            self.stop_bridge()
+            return
+        port, ok = QInputDialog.getInt(self, "TCP 转发服务", "监听端口：", self.bridge_port, 1, 65535)
+        if not ok:
+            self.bridge_action.setChecked(False)
+            return
+        # asyncio 导入较慢，开启时才导入
+        from Serial_Port.tcp_bridge import TcpBridge
+
+        bridge = TcpBridge(port=port, policy=self.bridge_policy)
+        try:
+            bridge.start()
+        except OSError as e:
+            QMessageBox.critical(self, "错误", f"无法启动转发服务: {e}")
+            self.bridge_action.setChecked(False)
+            return
+        self.bridge_port = port
+        self.tcp_bridge = bridge
+        bridge.data_from_client.connect(self.on_bridge_data)
+        bridge.clients_changed.connect(self.on_bridge_clients_changed)
+        self.serial_process.data_received.connect(self.on_bridge_publish)
+        self.on_bridge_clients_changed(0)
+        self.auto_save_settings()
+
+    def stop_bridge(self):
+        if self.tcp_bridge is None:
+            return
+        self.serial_process.data_received.disconnect(self.on_bridge_publish)
+        self.tcp_bridge.stop()
+        self.tcp_bridge = None
+        self.bridge_lbl.setText("")
+        self.bridge_lbl.setToolTip("")
+
+    def on_bridge_publish(self, data):
+        """接收数据转发给所有客户端"""
+        self.tcp_bridge.publish(data.data())
+
+    def on_bridge_data(self, data):
+        """客户端发来的数据写入串口"""
+        if self.serial_process.is_open:
+            self.serial_process.send_bytes(data)
+
+    def on_bridge_clients_changed(self, count):
+        self.update_bridge_status()
+
+    def update_bridge_status(self):
+        """转发服务状态：客户端数和丢弃总量，各客户端明细放在提示中"""
+        bridge = self.tcp_bridge
+        if bridge is None:
+            return
+        format_bytes = self.serial_process.stats.format_bytes
+        stats = bridge.client_stats()
+        text = f"TCP :{bridge.port} 客户端 {bridge.client_count}"
+        dropped = sum(client_dropped for _, _, client_dropped, _ in stats)
+        if dropped:
+            text += f" 丢弃 {format_bytes(dropped)}"
+        self.bridge_lbl.setText(text)
+        self.bridge_lbl.setToolTip("\n".join(
+            f"{address[0]}:{address[1]}  已发送 {format_bytes(sent)}  "
+            f"丢弃 {format_bytes(client_dropped)}  排队 {queued} 块"
+            for address, sent, client_dropped, queued in stats))
+
+    def on_bridge_policy_changed(self, action):
+        """转发客户端过慢时的处理方式"""
+        self.bridge_policy = action.data()
+        if self.tcp_bridge is not None:
+            self.tcp_bridge.policy = self.bridge_policy
+        self.auto_save_settings()
+
+    def show_trigger_stats(self):
+        """显示触发器统计"""
+        stats = self.trigger_engine.get_stats()
+        lines = [f"{name}: {count} 次" for name, count in stats['triggers'].items()]
+        if not lines:
+            lines.append("未配置触发器")
+        lines.append("")
+        lines.append(f"命中到动作延迟: {self.trigger_engine.latency.summary()}")
+        QMessageBox.information(self, "触发器统计", "\n".join(lines))
+
+    def reload_triggers(self):
+        """从配置文件重新加载触发器"""
+        self.config_manager.config = self.config_manager.load_or_create_config()
+        self.trigger_engine.load_triggers(self.config_manager.get_triggers())
+        self.trigger_counters.clear()
+        self.trigger_counter_lbl.setText("")
+        self.ui.statusbar.showMessage(f"已加载 {len(self.trigger_engine.triggers)} 个触发器", 3000)
+
+    def on_emulation_toggled(self, checked):
+        """开启/关闭设备模拟模式"""
+        if checked:
+            self.config_manager.config = self.config_manager.load_or_create_config()
+            self.auto_responder.load_rules(self.config_manager.get_auto_responses())
+            self.serial_process.set_auto_responder(self.auto_responder)
+            self.ui.statusbar.showMessage(f"设备模拟已开启，{len(self.auto_responder.rules)} 条应答规则", 3000)
+        else:
+            self.serial_process.set_auto_responder(None)
+            self.ui.statusbar.showMessage("设备模拟已关闭", 3000)
+
+    def show_emulation_stats(self):
+        """显示请求到应答的时间分布"""
+        histogram = self.auto_responder.latency
+        lines = [f"应答延迟: {histogram.summary()}", ""]
+        buckets = histogram.buckets()
+        if buckets:
+            peak = max(count for _, count in buckets)
+            for upper_ns, count in buckets:
+                bar = "█" * max(1, count * 30 // peak)
+                lines.append(f"≤{upper_ns / 1000:>10.1f} µs  {bar} {count}")
+        QMessageBox.information(self, "模拟应答时间分布", "\n".join(lines))
+
+    def show_diagnostics_panel(self):
+        """显示诊断面板"""
+        if self.diagnostics_panel is None:
+            self.diagnostics_panel = DiagnosticsPanel(self.serial_process.probe, self)
+        self.diagnostics_panel.show()
+        self.diagnostics_panel.raise_()
+
+    def add_choice_menu(self, title, choices, slot):
+        """在协议菜单添加一个单选子菜单（第一项为“无”）"""
+        menu = self.protocol_menu.addMenu(title)
+        group = QActionGroup(self)
+        actions = {}
+        for name, text in (("none", "无"),) + choices:
+            action = menu.addAction(text)
+            action.setCheckable(True)
+            action.setChecked(name == "none")
+            action.setData(name)
+            group.addAction(action)
+            actions[name] = action
+        group.triggered.connect(slot)
+        return actions, group
+
+    def on_send_checksum_changed(self, action):
+        """发送追加校验切换"""
+        self.send_checksum = action.data()
+        self.auto_save_settings()
+
+    def on_receive_checksum_changed(self, action):
+        """接收校验切换"""
+        self.set_receive_checksum(action.data())
+        self.auto_save_settings()
+
+    def set_receive_checksum(self, name):
+        """设置接收校验算法，只在开启时处理接收数据"""
+        if self.checksum_verifier is not None:
+            self.serial_process.data_received.disconnect(self.on_checksum_data)
+            self.checksum_verifier = None
+        self.receive_checksum = name
+        if name != "none":
+            self.checksum_verifier = LineChecksumVerifier(name)
+            self.serial_process.data_received.connect(self.on_checksum_data)
+
+    def on_checksum_data(self, data):
+        """按行校验接收数据，失败计入统计"""
+        if self.frame_decoder is not None:
+            # 开启接收分帧时改为按帧校验（见 format_frames）
+            return
+        results = self.checksum_verifier.feed(data.data())
+        failures = sum(1 for _, ok in results if not ok)
+        if failures:
+            self.serial_process.stats.add('checksum_failures', failures)
+            self.ui.statusbar.showMessage(f"接收校验失败 {failures} 行", 2000)
+
+    def on_send_framing_changed(self, action):
+        """发送分帧切换"""
+        self.send_framing = action.data()
+        self.auto_save_settings()
+
+    def on_receive_framing_changed(self, action):
+        """接收分帧切换"""
+        self.set_receive_framing(action.data())
+        self.auto_save_settings()
+
+    def set_receive_framing(self, name):
+        """设置接收分帧，切换时丢弃未完成的帧"""
+        self.receive_framing = name
+        self.frame_decoder = make_decoder(name) if name != "none" else None
+
+    def on_decode_pool_changed(self, action):
+        """切换多进程解码器，原有工作进程先关闭"""
+        self.close_decode_pool()
+        name = action.data()
+        if name == "none":
+            return
+        try:
+            self.decode_pool = DecodePool(DECODERS[name], stats=self.serial_process.stats, parent=self)
+        except OSError as e:
+            QMessageBox.critical(self, "错误", f"无法启动解码进程: {e}")
+            self.decode_pool_actions["none"].setChecked(True)
+            return
+        self.decode_pool.decoded.connect(self.on_pool_decoded)
+        self.ui.statusbar.showMessage(f"多进程解码已开启（{self.decode_pool.workers} 个进程）", 3000)
+
+    def close_decode_pool(self):
+        if self.decode_pool is not None:
+            self.decode_pool.close()
+            self.decode_pool = None
+
+    def on_pool_decoded(self, lines):
+        """解码进程的结果（已按接收顺序排列）"""
+        self.append_to_receive(''.join(lines))
+
+    def show_modbus_monitor(self):
+        """显示 Modbus RTU 监视器"""
+        if self.modbus_monitor is None:
+            self.modbus_monitor = ModbusMonitor(self.serial_process, self)
+        self.modbus_monitor.show()
+        self.modbus_monitor.raise_()
+
+    def show_byte_stats_panel(self):
+        """显示字节分布面板"""
+        if self.byte_stats_panel is None:
+            # 首次使用时才导入绘图库
+            from Serial_Port.byte_stats_panel import ByteStatsPanel
+            self.byte_stats_panel = ByteStatsPanel(self.serial_process, self)
+        self.byte_stats_panel.show()
+        self.byte_stats_panel.raise_()
+
+    def on_profile_toggled(self, checked):
+        """开始/提前结束性能采样"""
+        if checked:
+            self.profiler.start()
+            self.ui.statusbar.showMessage("性能采样中...", 3000)
+        else:
+            self.profiler.stop()
+
+    def on_profile_finished(self, prof_path, trace_path):
+        """性能采样结束"""
+        self.profile_action.blockSignals(True)
+        self.profile_action.setChecked(False)
+        self.profile_action.blockSignals(False)
+        self.ui.statusbar.showMessage(f"性能采样已保存: {prof_path}, {trace_path}", 10000)
 
     def closeEvent(self, event):
         """关闭时停止定时器"""
         self.port_infor_timer.stop()
+        self.stats_timer.stop()
+        self.display_governor.flush_timer.stop()
+        self.close_decode_pool()
+        self.stop_bridge()
+        self.profiler.stop()
+        self.stop_capture()
+        if self.telemetry_store is not None:
+            self.telemetry_store.close()
         event.accept()
@@ -0,0 +1,75 @@
+# auto_responder.py
+# -*- coding: utf-8 -*-
+import time
+
+from PyQt5.QtCore import QTimer
+
+from Serial_Port.latency_histogram import LatencyHistogram
+from Serial_Port.trigger_engine import MultiPatternMatcher, Trigger
+
+
+class AutoResponseRule:
+    """单条自动应答规则：请求模式 -> 应答内容"""
+
+    def __init__(self, config):
+        self.request = Trigger.parse_bytes(config.get("request", ""), config.get("request_hex", False))
+        self.reply = Trigger.parse_bytes(config.get("reply", ""), config.get("reply_hex", False))
+        self.delay_ms = int(config.get("delay_ms", 0))
+        self.enabled = config.get("enabled", True)
+        self.count = 0
+
+
+class AutoResponder:
+    """设备模拟：按应答表自动回复
+
+    由 SerialProcess.read_data 在读出数据后直接调用，不经过信号和界面；
+    应答直接写入串口，请求到应答的延迟记录到直方图中。
+    """
+
+    def __init__(self, serial_process, rule_configs=None):
+        self.serial_process = serial_process
+        self.rules = []
+        self.matcher = MultiPatternMatcher([])
+        self.latency = LatencyHistogram()
+        self.load_rules(rule_configs or [])
+
+    def load_rules(self, rule_configs):
+        """从配置加载应答表"""
+        rules = []
+        for config in rule_configs:
+            try:
+                rule = AutoResponseRule(config)
+            except ValueError as e:
+                print(f"自动应答配置错误: {config.get('request', '')} {e}")
+                continue
+            if rule.enabled and rule.request and rule.reply:
+                rules.append(rule)
+
+        self.rules = rules
+        self.matcher = MultiPatternMatcher([r.request for r in rules])
+
+    def reset_state(self):
+        """重置跨块匹配状态"""
+        self.matcher.reset()
+
+    def feed(self, data, read_ns):
+        """处理一个刚读出的数据块，read_ns 为读取时刻（perf_counter_ns）"""
+        for rule_id, _ in self.matcher.feed(data):
+            rule = self.rules[rule_id]
+            rule.count += 1
+            if rule.delay_ms > 0:
+                QTimer.singleShot(rule.delay_ms, lambda r=rule, t=read_ns: self.reply(r, t))
+            else:
+                self.reply(rule, read_ns)
+
+    def reply(self, rule, read_ns):
+        """发送应答并记录延迟"""
+        if self.serial_process.send_bytes(rule.reply):
+            self.latency.record(time.perf_counter_ns() - read_ns)
+
+    def get_stats(self):
+        """获取应答统计"""
+        return {
+            'rules': {r.request.hex(' '): r.count for r in self.rules},
+            'latency_ns': self.latency.to_dict()
+        }
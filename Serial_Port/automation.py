@@ -0,0 +1,309 @@
+# automation.py
+# -*- coding: utf-8 -*-
+import asyncio
+import contextlib
+import re
+from collections import deque, namedtuple
+
+from PyQt5.QtCore import QCoreApplication, QObject, QThread, pyqtSignal, pyqtSlot
+from PyQt5.QtSerialPort import QSerialPort
+
+from Serial_Port.app_SerialProcess import SerialProcess
+from Serial_Port.framing import make_decoder
+
+# expect() 的结果：匹配之前的数据、匹配到的数据、正则分组
+Expected = namedtuple('Expected', ['before', 'match', 'groups'])
+
+_app = None
+
+
+def _ensure_app():
+    """没有界面时创建 QCoreApplication（SerialProcess 的设备需要）"""
+    global _app
+    if QCoreApplication.instance() is None:
+        _app = QCoreApplication([])
+
+
+def _resolve(future, result=None, error=None):
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+class _QtWorker(QObject):
+    """Qt 线程中的执行者：在本线程调用传入的函数"""
+
+    call = pyqtSignal(object)
+
+    def __init__(self):
+        super().__init__()
+        self.call.connect(self.run)
+
+    # 必须是真正的槽：普通方法会经由创建于调用线程的代理对象执行
+    @pyqtSlot(object)
+    def run(self, func):
+        func()
+
+
+class AsyncPort:
+    """脚本化测试用的异步串口
+
+    SerialProcess 运行在独立的 Qt 线程中，由该线程的事件循环驱动读写，asyncio 侧不轮询：
+    每次读取的数据块通过 call_soon_threadsafe 追加到接收缓冲并唤醒等待者。
+    expect()/frames() 从缓冲中消费数据，已消费的部分丢弃；字节串模式只扫描新到达的数据
+    （加上模式长度减一的重叠），不会重复扫描历史。端口名与界面相同，也可以是网络端点。
+
+        async with AsyncPort() as port:
+            await port.open("tcp://127.0.0.1:9000")
+            await port.write(b"PING\\n")
+            await port.expect(b"PONG", timeout=1)
+    """
+
+    MAX_BUFFER = 4 * 1024 * 1024  # 未消费数据上限，超出时丢弃最早的数据
+
+    def __init__(self):
+        self.loop = None
+        self.thread = None
+        self.worker = None
+        self.process = None
+        self.buffer = bytearray()
+        self.dropped = 0
+        self.trimmed = 0  # 从缓冲开头移除的字节累计，等待中的扫描据此修正起点
+        self.bad_frames = 0
+        self.errors = []
+        self.is_open = False
+        self._changed = None
+        self._opened = None  # 等待打开结果（网络端点在后台连接）
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def _start(self):
+        """启动 Qt 线程并在其中创建 SerialProcess"""
+        _ensure_app()
+        self.loop = asyncio.get_running_loop()
+        self._changed = asyncio.Event()
+        self.thread = QThread()
+        self.worker = _QtWorker()
+        self.worker.moveToThread(self.thread)
+        self.thread.start()
+
+        def create():
+            process = SerialProcess()
+            # 以下回调在 Qt 线程中执行，转交给 asyncio 线程
+            process.data_received.connect(
+                lambda data: self.loop.call_soon_threadsafe(self._on_data, data.data()))
+            process.error_occurred.connect(
+                lambda message: self.loop.call_soon_threadsafe(self._on_error, message))
+            process.port_opened.connect(
+                lambda: self.loop.call_soon_threadsafe(self._on_opened))
+            process.port_closed.connect(
+                lambda: self.loop.call_soon_threadsafe(self._on_closed))
+            return process
+
+        self.process = await self._in_qt(create)
+
+    async def _in_qt(self, func):
+        """在 Qt 线程中执行 func 并等待结果"""
+        loop = self.loop
+        future = loop.create_future()
+
+        def task():
+            try:
+                result = func()
+            except Exception as e:
+                loop.call_soon_threadsafe(_resolve, future, None, e)
+            else:
+                loop.call_soon_threadsafe(_resolve, future, result)
+
+        self.worker.call.emit(task)
+        return await future
+
+    async def open(self, port_name, baud_rate=115200, data_bits=QSerialPort.Data8, parity=QSerialPort.NoParity,
+                   stop_bits=QSerialPort.OneStop, flow_control=QSerialPort.NoFlowControl):
+        """打开串口或网络端点，失败时抛出 ConnectionError"""
+        if self.process is None:
+            await self._start()
+        self.errors.clear()
+        # 打开前清空：设备连接后立即发送的数据（欢迎信息等）要留给 expect()
+        self.clear()
+        self._opened = self.loop.create_future()
+        started = await self._in_qt(lambda: self.process.open_port(
+            port_name, baud_rate, data_bits, parity, stop_bits, flow_control))
+        if not started:
+            # 错误信息经 call_soon_threadsafe 排在结果之前，此时已经收到。
+            # _on_error 已把异常放进 _opened：取回它，否则 asyncio 会报告异常未被取回
+            if self._opened.done():
+                self._opened.exception()
+            else:
+                self._opened.cancel()
+            self._opened = None
+            raise ConnectionError(self.errors[-1] if self.errors else f"无法打开 {port_name}")
+        # 串口此时已打开；网络端点等待连接结果（传输层自带连接超时）
+        await self._opened
+        self.is_open = True
+
+    async def close(self):
+        """关闭端口并停止 Qt 线程"""
+        if self.process is None:
+            return
+        process = self.process
+        self.process = None
+
+        def shutdown():
+            process.release_transport()
+            process.auto_send_timer.stop()
+            process.deleteLater()
+
+        await self._in_qt(shutdown)
+        self.is_open = False
+        self.thread.quit()
+        await self.loop.run_in_executor(None, self.thread.wait)
+        self.thread = None
+        self.worker = None
+
+    async def write(self, data):
+        """写入数据（进入设备发送缓冲即返回）"""
+        self._check_open()
+        if not await self._in_qt(lambda: self.process.send_bytes(bytes(data))):
+            raise ConnectionError(self.errors[-1] if self.errors else "发送失败")
+
+    def clear(self):
+        """丢弃尚未消费的接收数据"""
+        self._consume(len(self.buffer))
+
+    async def expect(self, pattern, timeout=5.0, window=None):
+        """等待 pattern（bytes 或 bytes 正则）出现，消费到匹配结束处，返回 Expected
+
+        正则模式每次从未消费数据的开头搜索；给出 window（最长匹配字节数）后只从新数据前
+        window 字节处开始搜索。超时抛出 TimeoutError，端口关闭抛出 ConnectionError。
+        """
+        if isinstance(pattern, str):
+            pattern = pattern.encode()
+        is_regex = isinstance(pattern, re.Pattern)
+        start = 0
+
+        async with self._deadline(timeout, pattern):
+            while True:
+                buffer = self.buffer
+                if is_regex:
+                    found = pattern.search(buffer, start)
+                    if found is not None:
+                        result = Expected(bytes(buffer[:found.start()]), found.group(0), found.groups())
+                        self._consume(found.end())
+                        return result
+                    if window is not None:
+                        start = max(0, len(buffer) - window)
+                else:
+                    index = buffer.find(pattern, start)
+                    if index >= 0:
+                        end = index + len(pattern)
+                        result = Expected(bytes(buffer[:index]), bytes(pattern), ())
+                        self._consume(end)
+                        return result
+                    # 下次只从可能跨块匹配的位置开始
+                    start = max(0, len(buffer) - len(pattern) + 1)
+                start = await self._wait_data(start)
+
+    async def read_frame(self, delimiter=b'\n', timeout=5.0):
+        """读取一帧（到分隔符为止，不含分隔符）"""
+        start = 0
+        async with self._deadline(timeout, delimiter):
+            while True:
+                buffer = self.buffer
+                index = buffer.find(delimiter, start)
+                if index >= 0:
+                    frame = bytes(buffer[:index])
+                    self._consume(index + len(delimiter))
+                    return frame
+                start = max(0, len(buffer) - len(delimiter) + 1)
+                start = await self._wait_data(start)
+
+    async def frames(self, delimiter=b'\n', framing=None, timeout=None):
+        """逐帧迭代接收数据，端口关闭后结束
+
+        framing 为 'cobs'/'slip' 时按对应协议解码，解码失败的帧跳过并计入 bad_frames。
+        timeout 为两帧之间的最长等待时间（None 为不限），超时抛出 TimeoutError。
+        """
+        if framing is None:
+            while True:
+                try:
+                    yield await self.read_frame(delimiter, timeout)
+                except ConnectionError:
+                    return
+
+        decoder = make_decoder(framing)
+        pending = deque()
+        while True:
+            while not pending:
+                if not self.buffer:
+                    try:
+                        async with self._deadline(timeout, framing):
+                            await self._wait_data()
+                    except ConnectionError:
+                        return
+                data = bytes(self.buffer)
+                self._consume(len(data))
+                for payload, ok in decoder.feed(data):
+                    if ok:
+                        pending.append(payload)
+                    else:
+                        self.bad_frames += 1
+            yield pending.popleft()
+
+    @contextlib.asynccontextmanager
+    async def _deadline(self, timeout, pattern):
+        """给一段等待加上超时（None 为不限），超时信息带上未消费数据的末尾"""
+        try:
+            async with asyncio.timeout(timeout):
+                yield
+        except TimeoutError:
+            tail = bytes(self.buffer[-80:])
+            raise TimeoutError(f"等待 {pattern!r} 超时（{timeout}s），未消费数据末尾: {tail!r}") from None
+
+    async def _wait_data(self, start=0):
+        """等待新数据到达，返回按缓冲开头移除量修正后的扫描起点；端口已关闭时抛出 ConnectionError"""
+        if not self.is_open:
+            raise ConnectionError(self.errors[-1] if self.errors else "端口未打开")
+        trimmed = self.trimmed
+        # 回调都在本线程执行，检查缓冲与清除事件之间不会有数据插入
+        self._changed.clear()
+        await self._changed.wait()
+        return max(0, start - (self.trimmed - trimmed))
+
+    def _check_open(self):
+        if not self.is_open:
+            raise ConnectionError("端口未打开")
+
+    def _consume(self, count):
+        del self.buffer[:count]
+        self.trimmed += count
+
+    def _on_data(self, data):
+        buffer = self.buffer
+        buffer += data
+        if len(buffer) > self.MAX_BUFFER:
+            excess = len(buffer) - self.MAX_BUFFER
+            self._consume(excess)
+            self.dropped += excess
+        self._changed.set()
+
+    def _on_opened(self):
+        _resolve(self._opened)
+
+    def _on_error(self, message):
+        self.errors.append(message)
+        # 打开过程中的错误即打开失败
+        if self._opened is not None:
+            _resolve(self._opened, error=ConnectionError(message))
+
+    def _on_closed(self):
+        self.is_open = False
+        self._changed.set()
+
@@ -0,0 +1,8 @@
+# bridge_policy.py
+# -*- coding: utf-8 -*-
+
+# TCP 转发客户端来不及接收时的处理方式（界面菜单用；tcp_bridge 依赖 asyncio，开启服务时才导入）
+POLICY_TITLES = (
+    ('drop', "丢弃新数据"),
+    ('disconnect', "断开该客户端"),
+)
@@ -0,0 +1,96 @@
+# byte_stats.py
+# -*- coding: utf-8 -*-
+import numpy as np
+
+
+class ByteHistogram:
+    """滑动窗口字节值分布
+
+    最近 window_bytes 个字节保存在环形缓冲区中。每个数据块只做一次 bincount：
+    新字节计入 0~255，被挤出窗口的旧字节加 256 计入 256~511，两段相减即为增量。
+    """
+
+    WINDOW_BYTES = 64 * 1024
+    # 可打印字符：0x20~0x7E 以及 \t \n \r
+    PRINTABLE = np.zeros(256, dtype=bool)
+    PRINTABLE[0x20:0x7F] = True
+    PRINTABLE[[0x09, 0x0A, 0x0D]] = True
+
+    # 疑似波特率/校验位错误的判断阈值
+    MIN_SAMPLES = 256
+    MAX_ZERO_FF_SHARE = 0.3
+    MAX_TEXT_ENTROPY = 6.5
+    MIN_PRINTABLE_SHARE = 0.7
+
+    def __init__(self, window_bytes=WINDOW_BYTES):
+        self.window = window_bytes
+        self.ring = np.zeros(window_bytes, dtype=np.uint8)
+        self.counts = np.zeros(256, dtype=np.int64)
+        self.pos = 0
+        self.filled = 0
+
+    def reset(self):
+        """清空统计"""
+        self.counts[:] = 0
+        self.pos = 0
+        self.filled = 0
+
+    def add(self, data):
+        """加入一个数据块"""
+        new = np.frombuffer(data, dtype=np.uint8)
+        if len(new) > self.window:
+            new = new[-self.window:]
+        n = len(new)
+        if n == 0:
+            return
+
+        # 取出将被覆盖的旧字节（未写满时只有回绕部分是有效数据）
+        window = self.window
+        pos = self.pos
+        end = pos + n
+        full = self.filled == window
+        if end <= window:
+            evicted = self.ring[pos:end] if full else self.ring[:0]
+        else:
+            head = self.ring[pos:] if full else self.ring[:0]
+            evicted = np.concatenate((head, self.ring[:end - window]))
+
+        merged = np.concatenate((new.astype(np.uint16), evicted.astype(np.uint16) + 256))
+        delta = np.bincount(merged, minlength=512)
+        self.counts += delta[:256]
+        self.counts -= delta[256:]
+
+        # 写入环形缓冲区
+        if end <= window:
+            self.ring[pos:end] = new
+        else:
+            split = window - pos
+            self.ring[pos:] = new[:split]
+            self.ring[:end - window] = new[split:]
+        self.pos = end % window
+        self.filled = min(window, self.filled + n)
+
+    def summary(self):
+        """统计摘要：字节数、可打印占比、0x00/0xFF 占比、香农熵（比特/字节）"""
+        total = self.filled
+        if not total:
+            return {'total': 0, 'printable': 0.0, 'zero_ff': 0.0, 'entropy': 0.0}
+        counts = self.counts
+        p = counts[counts > 0] / total
+        return {
+            'total': total,
+            'printable': float(counts[self.PRINTABLE].sum() / total),
+            'zero_ff': float((counts[0x00] + counts[0xFF]) / total),
+            'entropy': float(-(p * np.log2(p)).sum()),
+        }
+
+    def diagnosis(self, summary=None):
+        """按文本协议判断是否像波特率或校验位设置错误，返回提示文本"""
+        summary = summary or self.summary()
+        if summary['total'] < self.MIN_SAMPLES:
+            return "数据不足"
+        if summary['zero_ff'] > self.MAX_ZERO_FF_SHARE:
+            return "0x00/0xFF 过多，疑似波特率或校验位设置错误"
+        if summary['entropy'] > self.MAX_TEXT_ENTROPY and summary['printable'] < self.MIN_PRINTABLE_SHARE:
+            return "熵偏高且可打印字符少，文本协议下疑似波特率设置错误"
+        return "正常"
@@ -0,0 +1,83 @@
+# byte_stats_panel.py
+# -*- coding: utf-8 -*-
+import numpy as np
+import pyqtgraph as pg
+from PyQt5.QtCore import QTimer
+from PyQt5.QtGui import QFont
+from PyQt5.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton
+
+from Serial_Port.byte_stats import ByteHistogram
+
+
+class ByteStatsPanel(QDialog):
+    """字节分布面板：字节值直方图、可打印字符占比和熵
+
+    面板可见时才统计接收数据；每个数据块只更新计数，图表按固定低频刷新。
+    """
+
+    REFRESH_INTERVAL = 250  # 毫秒
+
+    def __init__(self, serial_process, parent=None):
+        super().__init__(parent)
+        self.serial_process = serial_process
+        self.histogram = ByteHistogram()
+        self.setWindowTitle("字节分布")
+        self.resize(720, 420)
+
+        self.plot_widget = pg.PlotWidget()
+        self.plot_widget.setBackground('white')
+        self.plot_widget.setLabel('left', '次数')
+        self.plot_widget.setLabel('bottom', '字节值')
+        self.plot_widget.setXRange(-1, 256, padding=0)
+        self.bars = pg.BarGraphItem(x=np.arange(256), height=np.zeros(256), width=1.0, brush='#4a90d9')
+        self.plot_widget.addItem(self.bars)
+
+        self.summary_lbl = QLabel("")
+        self.summary_lbl.setFont(QFont("Consolas", 10))
+        self.diagnosis_lbl = QLabel("")
+
+        self.reset_btn = QPushButton("重置统计")
+        self.reset_btn.clicked.connect(self.on_reset)
+
+        top_layout = QHBoxLayout()
+        top_layout.addWidget(self.summary_lbl)
+        top_layout.addStretch()
+        top_layout.addWidget(self.reset_btn)
+
+        layout = QVBoxLayout(self)
+        layout.addLayout(top_layout)
+        layout.addWidget(self.diagnosis_lbl)
+        layout.addWidget(self.plot_widget)
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.histogram.reset()
+        self.serial_process.data_received.connect(self.on_data_received)
+        self.refresh()
+        self.refresh_timer.start(self.REFRESH_INTERVAL)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.refresh_timer.stop()
+        self.serial_process.data_received.disconnect(self.on_data_received)
+
+    def on_data_received(self, data):
+        """接收数据块：只更新计数"""
+        self.histogram.add(data.data())
+
+    def on_reset(self):
+        """重置统计"""
+        self.histogram.reset()
+        self.refresh()
+
+    def refresh(self):
+        """刷新图表和摘要"""
+        summary = self.histogram.summary()
+        self.bars.setOpts(height=self.histogram.counts)
+        self.summary_lbl.setText(
+            f"窗口 {summary['total']} 字节  可打印 {summary['printable']:.1%}  "
+            f"0x00/0xFF {summary['zero_ff']:.1%}  熵 {summary['entropy']:.2f} bit/B")
+        self.diagnosis_lbl.setText(self.histogram.diagnosis(summary))
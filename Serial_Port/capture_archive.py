@@ -0,0 +1,251 @@
+# capture_archive.py
+# -*- coding: utf-8 -*-
+import bisect
+import gzip
+import lzma
+import os
+import queue
+import struct
+import threading
+import time
+import zlib
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+# 文件结构：
+#   文件头   b"PMCAP1" + 压缩格式编号 + 保留字节
+#   数据块   块头(b"PMBK", 压缩长度, 原始长度, 首条时间, 末条时间) + 独立压缩的数据
+#   索引     b"PMIX" + 块数 + 每块(文件偏移, 压缩长度, 原始长度, 首条时间, 末条时间)
+#   文件尾   索引偏移 + b"PMEN"
+# 块解压后是若干条记录：(墙上时间 ns, 长度) + 接收到的原始数据。
+# 每块独立压缩，按索引可直接解压任意一块；没有文件尾（异常退出）时顺序扫描块头恢复。
+FILE_MAGIC = b"PMCAP1"
+FILE_HEADER = struct.Struct('<6sBB')
+BLOCK_HEADER = struct.Struct('<4sIIqq')
+INDEX_ENTRY = struct.Struct('<QIIqq')
+INDEX_HEADER = struct.Struct('<4sI')
+TRAILER = struct.Struct('<Q4s')
+RECORD_HEADER = struct.Struct('<qI')
+
+CODECS = {
+    'zlib': (1, lambda data: zlib.compress(data, 6), zlib.decompress),
+    'lzma': (2, lzma.compress, lzma.decompress),
+    'gzip': (3, lambda data: gzip.compress(data, 6), gzip.decompress),
+}
+CODEC_NAMES = {codec_id: name for name, (codec_id, _, _) in CODECS.items()}
+
+
+class CaptureWriter(QObject):
+    """压缩录制：界面线程只拼接数据块，压缩和写文件在工作线程完成"""
+
+    BLOCK_BYTES = 1024 * 1024  # 每块原始数据大小
+    FLUSH_INTERVAL = 5000  # 毫秒，数据不足一块时也定期落盘
+    MAX_PENDING_BLOCKS = 64  # 待压缩块上限，超出时丢弃并计数
+
+    # 错误信号（从工作线程发出）
+    error_occurred = pyqtSignal(str)
+    # 文件已写完并关闭（从工作线程发出）
+    finished = pyqtSignal()
+
+    def __init__(self, path, codec='zlib'):
+        super().__init__()
+        if codec not in CODECS:
+            raise ValueError(f"不支持的压缩格式: {codec}")
+        self.path = path
+        self.codec = codec
+        self._compress = CODECS[codec][1]
+        # monotonic -> 墙上时间的偏移，只在开始录制时计算一次
+        self.wall_offset_ns = time.time_ns() - time.monotonic_ns()
+
+        self.raw_bytes = 0
+        self.compressed_bytes = 0
+        self.dropped_bytes = 0
+        self.failed = False  # 工作线程出错后不再写入
+        self.blocks = []
+
+        self._buffer = bytearray()
+        self._first_ns = None
+        self._last_ns = None
+        # 不限长度：上限由 flush() 检查，结束标记总能立即放入
+        self._queue = queue.Queue()
+
+        self._file = open(path, 'wb')
+        self._file.write(FILE_HEADER.pack(FILE_MAGIC, CODECS[codec][0], 0))
+        # 非守护线程：程序退出时仍会写完排队的数据块和索引
+        self._thread = threading.Thread(target=self._run, name="CaptureWriter")
+        self._thread.start()
+
+        self.flush_timer = QTimer(self)
+        self.flush_timer.timeout.connect(self.flush)
+        self.flush_timer.start(self.FLUSH_INTERVAL)
+
+    def write(self, data, t_ns):
+        """追加一条接收记录（t_ns 为读取时的 monotonic_ns）"""
+        t_ns += self.wall_offset_ns
+        if self._first_ns is None:
+            self._first_ns = t_ns
+        self._last_ns = t_ns
+        self._buffer += RECORD_HEADER.pack(t_ns, len(data))
+        self._buffer += data
+        if len(self._buffer) >= self.BLOCK_BYTES:
+            self.flush()
+
+    def flush(self):
+        """把当前块交给工作线程"""
+        if not self._buffer:
+            return
+        block = (bytes(self._buffer), self._first_ns, self._last_ns)
+        self._buffer = bytearray()
+        self._first_ns = None
+        if self.failed:
+            self.dropped_bytes += len(block[0])
+            return
+        if self._queue.qsize() >= self.MAX_PENDING_BLOCKS:
+            self.dropped_bytes += len(block[0])
+            self.error_occurred.emit(f"压缩跟不上接收速度，已丢弃 {self.dropped_bytes} 字节")
+            return
+        self._queue.put_nowait(block)
+
+    def close(self):
+        """结束录制：剩余数据交给工作线程后立即返回，写完索引和文件尾时发出 finished"""
+        self.flush_timer.stop()
+        self.flush()
+        self._queue.put_nowait(None)
+
+    def wait(self, timeout=None):
+        """等待工作线程结束，返回是否已写完"""
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def _run(self):
+        """工作线程：压缩并写入数据块"""
+        f = self._file
+        stopping = False
+        try:
+            while True:
+                block = self._queue.get()
+                if block is None:
+                    stopping = True
+                    break
+                raw, first_ns, last_ns = block
+                compressed = self._compress(raw)
+                offset = f.tell()
+                f.write(BLOCK_HEADER.pack(b"PMBK", len(compressed), len(raw), first_ns, last_ns))
+                f.write(compressed)
+                f.flush()
+                self.blocks.append((offset, len(compressed), len(raw), first_ns, last_ns))
+                self.raw_bytes += len(raw)
+                self.compressed_bytes += len(compressed)
+
+            index_offset = f.tell()
+            f.write(INDEX_HEADER.pack(b"PMIX", len(self.blocks)))
+            for entry in self.blocks:
+                f.write(INDEX_ENTRY.pack(*entry))
+            f.write(TRAILER.pack(index_offset, b"PMEN"))
+        except Exception as e:
+            self.failed = True
+            self.error_occurred.emit(f"写入录制文件出错: {e}")
+        finally:
+            f.close()
+        if not stopping:
+            # 出错后继续取走排队的块并丢弃，直到 close() 放入结束标记
+            while (block := self._queue.get()) is not None:
+                self.dropped_bytes += len(block[0])
+        self.finished.emit()
+
+
+class CaptureReader:
+    """读取压缩录制文件，可按块或按时间单独解压"""
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, 'rb')
+        magic, codec_id, _ = FILE_HEADER.unpack(self._file.read(FILE_HEADER.size))
+        if magic != FILE_MAGIC or codec_id not in CODEC_NAMES:
+            self._file.close()
+            raise ValueError(f"不是录制文件: {path}")
+        self.codec = CODEC_NAMES[codec_id]
+        self._decompress = CODECS[self.codec][2]
+        self.blocks = self._read_index() or self._scan_blocks()
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _read_index(self):
+        """从文件尾读取索引"""
+        f = self._file
+        size = f.seek(0, os.SEEK_END)
+        if size < FILE_HEADER.size + TRAILER.size:
+            return None
+        f.seek(size - TRAILER.size)
+        index_offset, magic = TRAILER.unpack(f.read(TRAILER.size))
+        if magic != b"PMEN":
+            return None
+        f.seek(index_offset)
+        magic, count = INDEX_HEADER.unpack(f.read(INDEX_HEADER.size))
+        if magic != b"PMIX":
+            return None
+        data = f.read(INDEX_ENTRY.size * count)
+        return [INDEX_ENTRY.unpack_from(data, i * INDEX_ENTRY.size) for i in range(count)]
+
+    def _scan_blocks(self):
+        """没有索引时顺序扫描块头（录制未正常结束）"""
+        f = self._file
+        blocks = []
+        offset = FILE_HEADER.size
+        while True:
+            f.seek(offset)
+            header = f.read(BLOCK_HEADER.size)
+            if len(header) < BLOCK_HEADER.size:
+                break
+            magic, compressed_len, raw_len, first_ns, last_ns = BLOCK_HEADER.unpack(header)
+            if magic != b"PMBK":
+                break
+            end = offset + BLOCK_HEADER.size + compressed_len
+            if f.seek(0, os.SEEK_END) < end:
+                break  # 最后一块没写完
+            blocks.append((offset, compressed_len, raw_len, first_ns, last_ns))
+            offset = end
+        return blocks
+
+    def read_block(self, index):
+        """解压一块，返回原始记录数据"""
+        offset, compressed_len, _, _, _ = self.blocks[index]
+        self._file.seek(offset + BLOCK_HEADER.size)
+        return self._decompress(self._file.read(compressed_len))
+
+    def block_records(self, index):
+        """一块中的记录：[(墙上时间 ns, 数据)]"""
+        raw = self.read_block(index)
+        records = []
+        pos = 0
+        while pos < len(raw):
+            t_ns, length = RECORD_HEADER.unpack_from(raw, pos)
+            pos += RECORD_HEADER.size
+            records.append((t_ns, raw[pos:pos + length]))
+            pos += length
+        return records
+
+    def find_block(self, t_ns):
+        """包含某个时刻的块号"""
+        starts = [entry[3] for entry in self.blocks]
+        return max(0, bisect.bisect_right(starts, t_ns) - 1)
+
+    def records(self, start_ns=None, end_ns=None):
+        """按时间范围逐条读取，只解压涉及的块"""
+        first = 0 if start_ns is None else self.find_block(start_ns)
+        for index in range(first, len(self.blocks)):
+            if end_ns is not None and self.blocks[index][3] > end_ns:
+                break
+            for t_ns, data in self.block_records(index):
+                if start_ns is not None and t_ns < start_ns:
+                    continue
+                if end_ns is not None and t_ns > end_ns:
+                    return
+                yield t_ns, data
@@ -0,0 +1,281 @@
+# checksum.py
+# -*- coding: utf-8 -*-
+import binascii
+import zlib
+
+# 数据量超过此值时 CRC 改用 numpy 多通道计算
+LANE_THRESHOLD = 64 * 1024
+LANE_COUNT = 4096
+
+
+class CrcSpec:
+    """查表 CRC（宽度 8 或 16）
+
+    逐字节查表更新；大块数据把缓冲区切成 LANE_COUNT 段，用 numpy 同时推进各段的 CRC，
+    再利用 CRC 的线性性质合并：crc(A+B) = Z^len(B)(crc(A)) ^ crc0(B)，Z 为补零字节的变换。
+    """
+
+    def __init__(self, width, poly, init, reflected, xorout, byteorder):
+        self.width = width
+        self.poly = poly
+        self.init = init
+        self.reflected = reflected
+        self.xorout = xorout
+        self.byteorder = byteorder
+        self.size = width // 8
+        self.mask = (1 << width) - 1
+        self.table = self._make_table()
+        self._zero_ops = {}
+
+    def _make_table(self):
+        table = []
+        if self.reflected:
+            poly = int(f"{self.poly:0{self.width}b}"[::-1], 2)
+            for byte in range(256):
+                crc = byte
+                for _ in range(8):
+                    crc = (crc >> 1) ^ poly if crc & 1 else crc >> 1
+                table.append(crc)
+        else:
+            top = 1 << (self.width - 1)
+            for byte in range(256):
+                crc = byte << (self.width - 8)
+                for _ in range(8):
+                    crc = ((crc << 1) ^ self.poly if crc & top else crc << 1) & self.mask
+                table.append(crc)
+        return tuple(table)
+
+    def update(self, crc, data):
+        """流式更新（crc 为未做 xorout 的中间值）"""
+        if len(data) >= LANE_THRESHOLD:
+            return self._update_lanes(crc, data)
+        return self._update_bytes(crc, data)
+
+    def _update_bytes(self, crc, data):
+        table = self.table
+        if self.reflected:
+            for byte in data:
+                crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+        else:
+            shift = self.width - 8
+            mask = self.mask
+            for byte in data:
+                crc = ((crc << 8) & mask) ^ table[((crc >> shift) ^ byte) & 0xFF]
+        return crc
+
+    def _zero_op(self, length):
+        """补 length 个零字节对 CRC 的线性变换，按低/高字节拆成两张表"""
+        op = self._zero_ops.get(length)
+        if op is None:
+            if len(self._zero_ops) > 16:
+                self._zero_ops.clear()
+            columns = [self._update_bytes(1 << bit, bytes(length)) for bit in range(self.width)]
+            halves = []
+            for base in range(0, self.width, 8):
+                half = []
+                for value in range(256):
+                    out = 0
+                    for bit in range(8):
+                        if value >> bit & 1:
+                            out ^= columns[base + bit]
+                    half.append(out)
+                halves.append(half)
+            op = self._zero_ops[length] = halves
+        return op
+
+    def _apply_zero_op(self, op, crc):
+        out = 0
+        for half in op:
+            out ^= half[crc & 0xFF]
+            crc >>= 8
+        return out
+
+    def _update_lanes(self, crc, data):
+        import numpy as np
+
+        buf = np.frombuffer(data, dtype=np.uint8)
+        lane_len = len(buf) // LANE_COUNT
+        # 转置后每一步读取的是各段同一位置的字节，内存连续
+        lanes = buf[:lane_len * LANE_COUNT].reshape(LANE_COUNT, lane_len).T.copy()
+        table = np.array(self.table, dtype=np.uint32)
+        crcs = np.zeros(LANE_COUNT, dtype=np.uint32)
+        if self.reflected:
+            for row in lanes:
+                crcs = (crcs >> 8) ^ table[(crcs ^ row) & 0xFF]
+        else:
+            shift = self.width - 8
+            for row in lanes:
+                crcs = ((crcs << 8) & self.mask) ^ table[((crcs >> shift) ^ row) & 0xFF]
+
+        # 从初值开始依次合并各段
+        op = self._zero_op(lane_len)
+        result = crc
+        for lane_crc in crcs.tolist():
+            result = self._apply_zero_op(op, result) ^ lane_crc
+        return self._update_bytes(result, data[lane_len * LANE_COUNT:])
+
+    def finish(self, crc):
+        return ((crc ^ self.xorout) & self.mask).to_bytes(self.size, self.byteorder)
+
+
+class _FuncSpec:
+    """由现成函数实现的校验（zlib/binascii 的查表实现、异或、累加和）"""
+
+    def __init__(self, size, init, update, finish, byteorder='big'):
+        self.size = size
+        self.init = init
+        self.update = update
+        self._finish = finish
+        self.byteorder = byteorder
+
+    def finish(self, value):
+        return self._finish(value).to_bytes(self.size, self.byteorder)
+
+
+def _xor_update(value, data):
+    if len(data) >= LANE_THRESHOLD:
+        import numpy as np
+        return value ^ int(np.bitwise_xor.reduce(np.frombuffer(data, dtype=np.uint8)))
+    for byte in data:
+        value ^= byte
+    return value
+
+
+CRC8 = CrcSpec(8, 0x07, 0x00, False, 0x00, 'big')  # CRC-8/SMBUS
+CRC16_MODBUS = CrcSpec(16, 0x8005, 0xFFFF, True, 0x0000, 'little')
+CRC16_CCITT = _FuncSpec(2, 0xFFFF, lambda crc, data: binascii.crc_hqx(data, crc), lambda crc: crc)  # CCITT-FALSE
+CRC32 = _FuncSpec(4, 0, lambda crc, data: zlib.crc32(data, crc), lambda crc: crc, 'little')
+XOR8 = _FuncSpec(1, 0, _xor_update, lambda value: value)
+SUM8 = _FuncSpec(1, 0, lambda value, data: (value + sum(data)) & 0xFF, lambda value: value)
+
+ALGORITHMS = {
+    'crc8': CRC8,
+    'crc16_modbus': CRC16_MODBUS,
+    'crc16_ccitt': CRC16_CCITT,
+    'crc32': CRC32,
+    'xor': XOR8,
+    'sum8': SUM8,
+}
+
+# 菜单显示名称
+ALGORITHM_TITLES = (
+    ('crc8', "CRC-8"),
+    ('crc16_modbus', "CRC-16/MODBUS"),
+    ('crc16_ccitt', "CRC-16/CCITT"),
+    ('crc32', "CRC-32"),
+    ('xor', "异或校验"),
+    ('sum8', "累加和"),
+)
+
+
+class Checksum:
+    """流式校验计算：update() 可多次调用，digest() 返回按协议字节序排列的校验值"""
+
+    def __init__(self, name):
+        self.name = name
+        self.spec = ALGORITHMS[name]
+        self.value = self.spec.init
+
+    def update(self, data):
+        self.value = self.spec.update(self.value, data)
+        return self
+
+    def digest(self):
+        return self.spec.finish(self.value)
+
+    def reset(self):
+        self.value = self.spec.init
+
+
+def compute(name, data):
+    """计算校验值"""
+    spec = ALGORITHMS[name]
+    return spec.finish(spec.update(spec.init, data))
+
+
+def verify(name, frame):
+    """校验以校验值结尾的帧"""
+    size = ALGORITHMS[name].size
+    if len(frame) <= size:
+        return False
+    return compute(name, frame[:-size]) == bytes(frame[-size:])
+
+
+def crc16_modbus(data, crc=0xFFFF):
+    """计算 CRC-16/MODBUS 中间值（低字节在前发送）"""
+    return CRC16_MODBUS.update(crc, data)
+
+
+def append_checksum(name, data, line_mode=False):
+    """追加校验值
+
+    line_mode 用于文本发送：数据以换行结尾时校验值放在换行之前，接收端按行校验可以通过。
+    二进制数据（十六进制、载入的文件）末尾的 0x0D/0x0A 是数据本身，校验值直接接在最后。
+    """
+    if not line_mode:
+        return data + compute(name, data)
+    body = data.rstrip(b'\r\n')
+    return body + compute(name, body) + data[len(body):]
+
+
+class LineChecksumVerifier:
+    """按行校验接收数据：每行为 数据 + 校验值 + \n（或 \r\n）
+
+    校验值是二进制的，其中可能出现 \n 或 \r。遇到换行时先校验到此为止的一行；不通过时，
+    真正的行尾可能在其后 校验值长度+1 字节之内，依次尝试这些位置的换行，都不通过才判为错误。
+    数据不够判断时留到下次。
+    """
+
+    MAX_LINE = 64 * 1024  # 超长不换行的数据直接丢弃，避免缓冲无限增长
+
+    def __init__(self, name):
+        self.name = name
+        self.size = ALGORITHMS[name].size
+        self.buffer = bytearray()
+
+    def feed(self, data):
+        """加入数据，返回本次完整行的 (行, 是否通过)"""
+        self.buffer += data
+        buffer = self.buffer
+        results = []
+        start = 0
+        while True:
+            end = buffer.find(b'\n', start)
+            if end < 0:
+                break
+            if end == start:
+                start = end + 1
+                continue
+            line = self.check(buffer[start:end])
+            if line is not None:
+                results.append((line, True))
+                start = end + 1
+                continue
+            # 行尾最远在 \n 之后 size+1 字节（校验值首字节为 \n 且以 \r\n 结尾）
+            limit = end + self.size + 1
+            if len(buffer) <= limit:
+                break
+            later = buffer.find(b'\n', end + 1, limit + 1)
+            while later >= 0:
+                line = self.check(buffer[start:later])
+                if line is not None:
+                    results.append((line, True))
+                    start = later + 1
+                    break
+                later = buffer.find(b'\n', later + 1, limit + 1)
+            else:
+                line = buffer[start:end]
+                results.append((bytes(line[:-1] if line.endswith(b'\r') else line), False))
+                start = end + 1
+        del buffer[:start]
+        if len(buffer) > self.MAX_LINE:
+            buffer.clear()
+        return results
+
+    def check(self, line):
+        """校验一行，通过时返回去掉 \r 的行，\r 也可能是校验值的最后一个字节"""
+        if line.endswith(b'\r') and verify(self.name, line[:-1]):
+            return bytes(line[:-1])
+        if verify(self.name, line):
+            return bytes(line)
+        return None
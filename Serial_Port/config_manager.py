@@ -56,7 +56,8 @@ class JSONConfigManager:
                     "baudrate": "115200",
                     "parity": "无",
                     "databits": "8",
-                    "stopbits": "1"
+                    "stopbits": "1",
+                    "read_buffer_kb": 1024
                 },
                 "send": {
                     "hex_send": False,
@@ -65,17 +66,33 @@ class JSONConfigManager:
                 "receive": {
                     "hex_receive": False,
                     "timestamp": False,
+                    "timestamp_mode": "abs_ms",
+                    "capture_codec": "zlib",
+                    "display_auto": True,
                     "auto_clear_receive": False
                 },
                 "flow_control": {
                     "rts": False,
                     "dtr": False
                 },
+                "protocol": {
+                    "send_checksum": "none",
+                    "receive_checksum": "none",
+                    "send_framing": "none",
+                    "receive_framing": "none",
+                    "disabled_plugins": []
+                },
+                "bridge": {
+                    "port": 5000,
+                    "policy": "drop"
+                },
                 "file_paths": {
                     "receive_save": "",
                     "send_file": ""
                 }
-            }
+            },
+            "triggers": [],
+            "auto_responses": []
         }
 
         self.save_config(default_config)
@@ -111,6 +128,14 @@ class JSONConfigManager:
         self.save_config()
         return True
 
+    def get_triggers(self):
+        """获取触发器配置列表"""
+        return self.config.get("triggers", [])
+
+    def get_auto_responses(self):
+        """获取设备模拟应答表"""
+        return self.config.get("auto_responses", [])
+
     def save_user_settings(self, settings_dict):
         """保存用户设置"""
         # 更新整个用户设置
@@ -129,7 +154,8 @@ class JSONConfigManager:
                 "baudrate": serial_app.ui.baudrate_cb.currentText(),
                 "parity": serial_app.ui.parity_cb.currentText(),
                 "databits": serial_app.ui.databits_cb.currentText(),
-                "stopbits": serial_app.ui.stopbits_cb.currentText()
+                "stopbits": serial_app.ui.stopbits_cb.currentText(),
+                "read_buffer_kb": serial_app.serial_process.read_buffer_size // 1024
             },
             "send": {
                 "hex_send": serial_app.ui.hex_send_chb.isChecked(),
@@ -138,12 +164,26 @@ class JSONConfigManager:
             "receive": {
                 "hex_receive": serial_app.ui.hex_receive_chb.isChecked(),
                 "timestamp": serial_app.ui.timestamp_chb.isChecked(),
+                "timestamp_mode": serial_app.timestamper.mode,
+                "capture_codec": serial_app.capture_codec,
+                "display_auto": serial_app.display_governor.auto,
                 "auto_clear_receive": serial_app.ui.auto_clearReceive_chb.isChecked()
             },
             "flow_control": {
                 "rts": serial_app.ui.rts_chb.isChecked(),
                 "dtr": serial_app.ui.dtr_chb.isChecked()
             },
+            "protocol": {
+                "send_checksum": serial_app.send_checksum,
+                "receive_checksum": serial_app.receive_checksum,
+                "send_framing": serial_app.send_framing,
+                "receive_framing": serial_app.receive_framing,
+                "disabled_plugins": serial_app.disabled_plugins()
+            },
+            "bridge": {
+                "port": serial_app.bridge_port,
+                "policy": serial_app.bridge_policy
+            },
             "file_paths": {
                 "receive_save": serial_app.ui.file_receive_lEdit.text(),
                 "send_file": serial_app.ui.file_send_lEdit.text()
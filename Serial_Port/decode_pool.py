@@ -0,0 +1,271 @@
+# decode_pool.py
+# -*- coding: utf-8 -*-
+import heapq
+import importlib
+import os
+import queue
+from collections import deque, namedtuple
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+# 解码器：函数路径（"模块:函数"，函数接收 bytes 返回显示行列表）、
+# 分批边界（按分隔符切分或按字节数对齐，保证一批里不出现半帧）
+DecoderSpec = namedtuple('DecoderSpec', ['path', 'title', 'delimiter', 'align'])
+
+ADC_FRAME_SAMPLES = 1024
+
+
+def adc_int16_stats(data):
+    """原始 ADC 采样（小端 int16）：每 ADC_FRAME_SAMPLES 点一帧，统计幅值并用 FFT 找主频"""
+    import numpy as np
+
+    samples = np.frombuffer(data, dtype='<i2')
+    frames = len(samples) // ADC_FRAME_SAMPLES
+    if not frames:
+        return []
+    block = samples[:frames * ADC_FRAME_SAMPLES].reshape(frames, ADC_FRAME_SAMPLES).astype(np.float64)
+    mean = block.mean(axis=1)
+    rms = np.sqrt(((block - mean[:, None]) ** 2).mean(axis=1))
+    spectrum = np.abs(np.fft.rfft(block - mean[:, None], axis=1))
+    peak = spectrum[:, 1:].argmax(axis=1) + 1
+    lines = []
+    for i in range(frames):
+        lines.append(f"ADC 帧 min {block[i].min():.0f} max {block[i].max():.0f} "
+                     f"均值 {mean[i]:.1f} RMS {rms[i]:.1f} 主频 bin {peak[i]}\n")
+    return lines
+
+
+def numeric_line_stats(data):
+    """文本数值行：每批输出一行统计"""
+    import numpy as np
+
+    values = []
+    for line in data.split(b'\n'):
+        try:
+            values.append(float(line))
+        except ValueError:
+            pass
+    if not values:
+        return []
+    array = np.array(values)
+    return [f"数值 {len(array)} 个 min {array.min():.3f} max {array.max():.3f} "
+            f"均值 {array.mean():.3f} 标准差 {array.std():.3f}\n"]
+
+
+DECODERS = {
+    'adc_int16': DecoderSpec('Serial_Port.decode_pool:adc_int16_stats', "ADC int16 统计", None,
+                             ADC_FRAME_SAMPLES * 2),
+    'numeric_lines': DecoderSpec('Serial_Port.decode_pool:numeric_line_stats', "数值行统计", b'\n', 1),
+}
+
+
+def load_decoder(path):
+    """按 "模块:函数" 导入解码函数"""
+    module_name, _, func_name = path.partition(':')
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+def _worker(shm_name, decoder_path, tasks, results):
+    """工作进程：从共享内存槽读取数据块并解码，只有槽号和长度经过队列传递"""
+    from multiprocessing import shared_memory
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    decode = load_decoder(decoder_path)
+    try:
+        while True:
+            task = tasks.get()
+            if task is None:
+                break
+            seq, offset, length = task
+            data = bytes(shm.buf[offset:offset + length])
+            try:
+                # 转成字符串：回传结果在队列线程中序列化，失败时主进程收不到这一批
+                lines = [str(line) for line in decode(data)]
+            except Exception as e:
+                lines = [f"[解码错误] {e}\n"]
+            results.put((seq, lines))
+    finally:
+        shm.close()
+
+
+class DecodePool(QObject):
+    """多进程解码
+
+    接收数据按解码器的边界分批，写入共享内存环形缓冲的空闲槽，队列中只传递 (序号, 偏移, 长度)；
+    各工作进程并行解码后回传显示行，主进程按序号重新排序，保证输出顺序与接收顺序一致。
+    槽全部占用时数据先在主进程排队，排队超过 MAX_PENDING_BYTES 后丢弃并计数。
+    每个工作进程有自己的任务队列，批次交给未完成最少的进程；进程意外退出时，
+    交给它的批次输出错误行并释放槽，再启动新的进程补上，后续输出不受影响。
+    """
+
+    # 按接收顺序解码完成的一批显示行
+    decoded = pyqtSignal(list)
+
+    SLOT_BYTES = 256 * 1024
+    SLOT_COUNT = 32
+    DISPATCH_INTERVAL = 20  # 毫秒，未凑满一槽的数据最长等待时间
+    MAX_PENDING_BYTES = 16 * 1024 * 1024
+
+    def __init__(self, spec, workers=None, stats=None, parent=None):
+        # multiprocessing 导入较慢，开启时才导入
+        import multiprocessing
+        from multiprocessing import shared_memory
+
+        super().__init__(parent)
+        self.spec = spec
+        self.workers = workers or max(1, (os.cpu_count() or 2) - 1)
+        self.stats = stats  # SerialStatistics，记录丢弃的字节
+        self.dropped = 0
+
+        self.shm = shared_memory.SharedMemory(create=True, size=self.SLOT_BYTES * self.SLOT_COUNT)
+        self.free_slots = deque(range(self.SLOT_COUNT))
+        self.slot_of = {}  # 序号 -> 槽
+        self.owner = {}  # 序号 -> 工作进程编号
+        self.next_seq = 0
+        self.emit_seq = 0
+        self.done = []  # (序号, 显示行) 小顶堆，等待前面的批次完成
+
+        self.buffer = bytearray()  # 未凑满一批的数据
+        self.pending = deque()  # 已分批、等待空闲槽的数据
+        self.pending_bytes = 0
+
+        # spawn 启动，避免在已有 Qt 线程的进程里 fork
+        self.context = multiprocessing.get_context('spawn')
+        self.results = self.context.Queue()
+        self.tasks = [None] * self.workers
+        self.processes = [None] * self.workers
+        self.assigned = [set() for _ in range(self.workers)]  # 各进程未完成的序号
+        for index in range(self.workers):
+            self.start_worker(index)
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.on_tick)
+        self.timer.start(self.DISPATCH_INTERVAL)
+
+    def start_worker(self, index):
+        """启动（或替换）第 index 个工作进程"""
+        self.tasks[index] = self.context.Queue()
+        process = self.context.Process(
+            target=_worker, args=(self.shm.name, self.spec.path, self.tasks[index], self.results), daemon=True)
+        process.start()
+        self.processes[index] = process
+
+    def feed(self, data):
+        """加入接收数据，凑满一槽时立即分发"""
+        self.buffer += data
+        if len(self.buffer) >= self.SLOT_BYTES:
+            self.cut_batches()
+            self.dispatch()
+
+    def cut_batches(self):
+        """按边界把缓冲切成批次，不足一个完整单元的尾部留到下次"""
+        buffer = self.buffer
+        if self.spec.delimiter is not None:
+            end = buffer.rfind(self.spec.delimiter) + 1
+            if not end and len(buffer) > self.SLOT_BYTES:
+                end = self.SLOT_BYTES  # 超长无分隔符，强制切开
+        else:
+            end = len(buffer) - len(buffer) % self.spec.align
+        if not end:
+            return
+        view = memoryview(buffer)
+        start = 0
+        while start < end:
+            stop = min(start + self.SLOT_BYTES, end)
+            if stop < end:
+                if self.spec.delimiter is not None:
+                    # 在槽内最后一个分隔符处切开
+                    cut = buffer.rfind(self.spec.delimiter, start, stop) + 1
+                    if cut > start:
+                        stop = cut
+                else:
+                    stop -= (stop - start) % self.spec.align
+            self.queue_batch(bytes(view[start:stop]))
+            start = stop
+        view.release()
+        del self.buffer[:end]
+
+    def queue_batch(self, batch):
+        if not batch:
+            return
+        if self.pending_bytes + len(batch) > self.MAX_PENDING_BYTES:
+            self.dropped += len(batch)
+            if self.stats is not None:
+                self.stats.add('decode_dropped', len(batch))
+            return
+        self.pending.append(batch)
+        self.pending_bytes += len(batch)
+
+    def dispatch(self):
+        """把排队的批次写入空闲槽并交给工作进程"""
+        while self.pending and self.free_slots:
+            batch = self.pending.popleft()
+            self.pending_bytes -= len(batch)
+            slot = self.free_slots.popleft()
+            offset = slot * self.SLOT_BYTES
+            self.shm.buf[offset:offset + len(batch)] = batch
+            seq = self.next_seq
+            self.next_seq += 1
+            index = min(range(self.workers), key=lambda i: len(self.assigned[i]))
+            self.slot_of[seq] = slot
+            self.owner[seq] = index
+            self.assigned[index].add(seq)
+            self.tasks[index].put((seq, offset, len(batch)))
+
+    def on_tick(self):
+        """收集结果、按序输出，并分发等待中的数据"""
+        while True:
+            try:
+                seq, lines = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if seq in self.slot_of:  # 否则已按进程退出处理过
+                self.finish(seq, lines)
+        self.check_workers()
+
+        ready = []
+        while self.done and self.done[0][0] == self.emit_seq:
+            ready.extend(heapq.heappop(self.done)[1])
+            self.emit_seq += 1
+        if ready:
+            self.decoded.emit(ready)
+
+        if self.buffer:
+            self.cut_batches()
+        self.dispatch()
+
+    def finish(self, seq, lines):
+        """一批解码完成：释放槽，结果等待按序输出"""
+        self.free_slots.append(self.slot_of.pop(seq))
+        self.assigned[self.owner.pop(seq)].discard(seq)
+        heapq.heappush(self.done, (seq, lines))
+
+    def check_workers(self):
+        """工作进程意外退出时，交给它的批次输出错误行，并启动新的进程"""
+        for index, process in enumerate(self.processes):
+            if process.is_alive():
+                continue
+            message = f"[解码错误] 解码进程已退出（退出码 {process.exitcode}），丢弃一批数据\n"
+            for seq in sorted(self.assigned[index]):
+                self.finish(seq, [message])
+            self.tasks[index].cancel_join_thread()
+            self.tasks[index].close()
+            print(message.strip())
+            self.start_worker(index)
+
+    def close(self):
+        """停止工作进程并释放共享内存
+
+        关闭后不再需要解码结果，直接结束工作进程，不在界面线程等待它们处理完排队的批次。
+        """
+        self.timer.stop()
+        for process in self.processes:
+            process.terminate()
+        for process in self.processes:
+            process.join(0.1)
+        for tasks in self.tasks:
+            tasks.cancel_join_thread()
+            tasks.close()
+        self.results.close()
+        self.shm.close()
+        self.shm.unlink()
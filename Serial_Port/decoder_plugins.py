@@ -0,0 +1,219 @@
+# decoder_plugins.py
+# -*- coding: utf-8 -*-
+import importlib.util
+import os
+import time
+from collections import namedtuple
+
+# 插件返回的记录类型，界面按类型分发
+SpeedRecord = namedtuple('SpeedRecord', ['t_ns', 'speed'])
+MotorRecord = namedtuple('MotorRecord', ['t_ns', 'state', 'value'])
+TextRecord = namedtuple('TextRecord', ['t_ns', 'source', 'text'])  # 追加到接收区的文本
+
+ENTRY_POINT_GROUP = 'portmonitor.decoders'
+PLUGIN_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'plugins')
+
+
+class DecoderPlugin:
+    """解码插件基类
+
+    每次调用收到一批帧（去掉换行的行数据）和对应的读取时刻，返回记录列表。
+    子类设置 name（唯一标识）和 title（菜单显示名），实现 decode()。
+    """
+
+    name = ""
+    title = ""
+
+    def decode(self, frames, timestamps):
+        raise NotImplementedError
+
+    def reset(self):
+        """串口重新打开等场合清空内部状态"""
+
+
+class MotorProtocolPlugin(DecoderPlugin):
+    """电机协议：数字行为速度，"[M]:状态,数值" 行为电机状态"""
+
+    name = 'motor'
+    title = "电机协议"
+
+    def decode(self, frames, timestamps):
+        records = []
+        for frame, t_ns in zip(frames, timestamps):
+            line = frame.strip()
+            if not line:
+                continue
+            if line.startswith(b'[M]:'):
+                parts = line[4:].split(b',')
+                if len(parts) != 2:
+                    continue
+                try:
+                    records.append(MotorRecord(t_ns, int(parts[0]), float(parts[1])))
+                except ValueError:
+                    continue
+            else:
+                try:
+                    records.append(SpeedRecord(t_ns, float(line)))
+                except ValueError:
+                    # 不是数字就忽略（比如乱码、提示信息）
+                    continue
+        return records
+
+
+class PluginTiming:
+    """单个插件的耗时统计"""
+
+    def __init__(self):
+        self.calls = 0
+        self.frames = 0
+        self.total_ns = 0
+        self.max_ns = 0
+        self.errors = 0
+
+    def add(self, frames, elapsed_ns):
+        self.calls += 1
+        self.frames += frames
+        self.total_ns += elapsed_ns
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+
+    def text(self):
+        if not self.calls:
+            return "未调用"
+        per_frame = self.total_ns / self.frames / 1000 if self.frames else 0
+        return (f"调用 {self.calls} 次  帧 {self.frames}  累计 {self.total_ns / 1e6:.1f}ms  "
+                f"单次最长 {self.max_ns / 1000:.0f}µs  每帧 {per_frame:.1f}µs  错误 {self.errors}")
+
+
+def _plugin_classes(namespace):
+    """模块中的插件类：优先用 PLUGINS 列表，否则取所有 DecoderPlugin 子类"""
+    if 'PLUGINS' in namespace:
+        return list(namespace['PLUGINS'])
+    return [obj for obj in namespace.values()
+            if isinstance(obj, type) and issubclass(obj, DecoderPlugin) and obj is not DecoderPlugin
+            and obj.__module__ == namespace.get('__name__')]
+
+
+def discover_plugins(directory=PLUGIN_DIR):
+    """发现外部插件：目录下的 .py 文件和 entry points，返回 (插件实例列表, 加载错误列表)"""
+    plugins = []
+    errors = []
+
+    if os.path.isdir(directory):
+        for file_name in sorted(os.listdir(directory)):
+            if not file_name.endswith('.py') or file_name.startswith('_'):
+                continue
+            path = os.path.join(directory, file_name)
+            try:
+                spec = importlib.util.spec_from_file_location(f"portmonitor_plugin_{file_name[:-3]}", path)
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+                plugins.extend(cls() for cls in _plugin_classes(vars(module)))
+            except Exception as e:
+                errors.append(f"{file_name}: {e}")
+
+    try:
+        from importlib.metadata import entry_points
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+            try:
+                plugins.append(entry_point.load()())
+            except Exception as e:
+                errors.append(f"{entry_point.name}: {e}")
+    except Exception as e:
+        errors.append(f"entry points: {e}")
+    return plugins, errors
+
+
+class PluginHost:
+    """插件宿主
+
+    把接收数据切成行，每次读取得到的完整行作为一批交给所有启用的插件，
+    记录每个插件的耗时，按记录类型调用注册的处理函数。插件可随时启用/禁用。
+    """
+
+    MAX_LINE = 64 * 1024  # 超长不换行的数据直接丢弃
+
+    def __init__(self, plugins=()):
+        self.plugins = []
+        self.enabled = {}
+        self.timings = {}
+        self.handlers = {}
+        self.buffer = bytearray()
+        self.buffer_ns = 0
+        for plugin in plugins:
+            self.add(plugin)
+
+    def add(self, plugin):
+        """加入插件，同名插件只保留先加入的"""
+        if not plugin.name or plugin.name in self.enabled:
+            return False
+        self.plugins.append(plugin)
+        self.enabled[plugin.name] = True
+        self.timings[plugin.name] = PluginTiming()
+        return True
+
+    def register(self, record_type, handler):
+        """注册记录类型的处理函数"""
+        self.handlers[record_type] = handler
+
+    def set_enabled(self, name, enabled):
+        self.enabled[name] = enabled
+
+    def reset(self):
+        """清空未结束的半行和各插件状态（端口打开、关闭时）"""
+        self.buffer = bytearray()
+        for plugin in self.plugins:
+            plugin.reset()
+
+    def feed(self, data, t_ns):
+        """加入一次读取的数据，返回本批记录数"""
+        if b'\n' not in data:
+            if not self.buffer:
+                self.buffer_ns = t_ns
+            self.buffer += data
+            if len(self.buffer) > self.MAX_LINE:
+                self.buffer = bytearray()
+            return 0
+        lines = data.split(b'\n')
+        if self.buffer:
+            lines[0] = bytes(self.buffer) + lines[0]
+        # 跨块的行取开始接收时的时刻
+        first_ns = self.buffer_ns if self.buffer else t_ns
+        tail = lines.pop()
+        self.buffer = bytearray(tail)
+        self.buffer_ns = t_ns
+        lines = [line[:-1] if line.endswith(b'\r') else line for line in lines]
+        timestamps = [t_ns] * len(lines)
+        timestamps[0] = first_ns
+        return self.run(lines, timestamps)
+
+    def run(self, frames, timestamps):
+        """把一批帧交给各插件并分发记录"""
+        count = 0
+        for plugin in self.plugins:
+            if not self.enabled[plugin.name]:
+                continue
+            timing = self.timings[plugin.name]
+            start = time.perf_counter_ns()
+            try:
+                records = plugin.decode(frames, timestamps)
+            except Exception as e:
+                timing.errors += 1
+                print(f"插件 {plugin.name} 解码出错: {e}")
+                records = []
+            timing.add(len(frames), time.perf_counter_ns() - start)
+            for record in records:
+                handler = self.handlers.get(type(record))
+                if handler is not None:
+                    handler(record)
+            count += len(records)
+        return count
+
+    def timing_report(self):
+        """各插件耗时，按累计耗时从高到低"""
+        order = sorted(self.plugins, key=lambda p: self.timings[p.name].total_ns, reverse=True)
+        lines = []
+        for plugin in order:
+            state = "" if self.enabled[plugin.name] else "（已禁用）"
+            lines.append(f"{plugin.title or plugin.name}{state}: {self.timings[plugin.name].text()}")
+        return lines
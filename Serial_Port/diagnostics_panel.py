@@ -0,0 +1,60 @@
+# diagnostics_panel.py
+# -*- coding: utf-8 -*-
+from PyQt5.QtCore import QTimer
+from PyQt5.QtGui import QFont
+from PyQt5.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QPlainTextEdit, QCheckBox, QPushButton
+
+
+class DiagnosticsPanel(QDialog):
+    """诊断面板：显示接收链路各阶段耗时"""
+
+    REFRESH_INTERVAL = 500  # 毫秒
+
+    def __init__(self, probe, parent=None):
+        super().__init__(parent)
+        self.probe = probe
+        self.setWindowTitle("诊断面板")
+        self.resize(720, 300)
+
+        self.enable_chb = QCheckBox("启用分段计时")
+        self.enable_chb.setChecked(probe.enabled)
+        self.enable_chb.toggled.connect(self.probe.set_enabled)
+
+        self.reset_btn = QPushButton("重置统计")
+        self.reset_btn.clicked.connect(self.on_reset)
+
+        self.report_tEdit = QPlainTextEdit()
+        self.report_tEdit.setReadOnly(True)
+        self.report_tEdit.setFont(QFont("Consolas", 10))
+
+        top_layout = QHBoxLayout()
+        top_layout.addWidget(self.enable_chb)
+        top_layout.addStretch()
+        top_layout.addWidget(self.reset_btn)
+
+        layout = QVBoxLayout(self)
+        layout.addLayout(top_layout)
+        layout.addWidget(self.report_tEdit)
+
+        # 只在面板可见时刷新
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.enable_chb.setChecked(self.probe.enabled)
+        self.refresh()
+        self.refresh_timer.start(self.REFRESH_INTERVAL)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.refresh_timer.stop()
+
+    def on_reset(self):
+        """重置统计"""
+        self.probe.reset()
+        self.refresh()
+
+    def refresh(self):
+        """刷新显示"""
+        self.report_tEdit.setPlainText(self.probe.report())
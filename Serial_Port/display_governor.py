@@ -0,0 +1,233 @@
+# display_governor.py
+# -*- coding: utf-8 -*-
+import time
+
+from PyQt5.QtCore import Qt, QObject, QTimer, pyqtSignal
+from PyQt5.QtGui import QTextCursor, QTextCharFormat
+from PyQt5.QtWidgets import QLabel
+
+FULL = 'full'
+TAIL = 'tail'
+SUMMARY = 'summary'
+HIDDEN = 'hidden'
+
+MODES = (FULL, TAIL, SUMMARY, HIDDEN)
+
+MODE_TITLES = {
+    FULL: "完整",
+    TAIL: "仅末尾",
+    SUMMARY: "摘要",
+    HIDDEN: "已隐藏",
+}
+
+# 进入各降级模式的阈值：(接收显示字符/秒, 事件循环延迟毫秒)，任一项超过即进入
+ENTER_THRESHOLDS = {
+    TAIL: (200_000, 50),
+    SUMMARY: (1_000_000, 150),
+    HIDDEN: (4_000_000, 400),
+}
+
+
+class DisplayGovernor(QObject):
+    """接收显示的负载调节
+
+    接收文本先缓存，由定时器成批写入接收框；同一个定时器测量自身的触发延迟（事件循环延迟）
+    和每秒待显示的字符数，负载超过阈值时立即切换到更省的模式：
+    仅保留末尾 TAIL_LINES 行、只显示摘要（速率、最后一行、错误数）、或完全不显示。
+    负载降到当前模式阈值的 RELEASE_RATIO 以下并持续 HOLD_SECONDS 后才逐级恢复，避免来回切换。
+    显示降级不影响录制、统计等其他接收处理。
+    """
+
+    mode_changed = pyqtSignal(str)
+
+    FLUSH_INTERVAL = 50  # 毫秒
+    SUMMARY_INTERVAL = 0.25  # 秒，摘要刷新间隔
+    TAIL_LINES = 500
+    RELEASE_RATIO = 0.5
+    HOLD_SECONDS = 2.0
+    SMOOTHING = 0.3  # 负载指标的指数平滑系数
+
+    def __init__(self, text_edit, stats, highlight_format, probe=None, parent=None):
+        super().__init__(parent)
+        self.text_edit = text_edit
+        self.stats = stats
+        self.probe = probe
+        self.auto = True
+        self.mode = FULL
+        self.pending = []  # [(文本, 是否高亮)]
+        self.pending_chars = 0
+        self.last_line = ""
+        self.char_rate = 0.0
+        self.lag_ms = 0.0
+        self.calm_since = None
+        self.last_summary = 0.0
+        self.highlight_format = highlight_format
+
+        # 摘要/隐藏模式下覆盖在接收框上的标签
+        self.summary_lbl = QLabel(text_edit.parentWidget())
+        self.summary_lbl.setGeometry(text_edit.geometry())
+        self.summary_lbl.setAlignment(Qt.AlignLeft | Qt.AlignTop)
+        self.summary_lbl.setWordWrap(True)
+        self.summary_lbl.setStyleSheet("background-color: #fafafa; border: 1px solid #ccc; padding: 6px;")
+        self.summary_lbl.hide()
+
+        self.last_tick = time.monotonic()
+        self.flush_timer = QTimer(self)
+        self.flush_timer.timeout.connect(self.on_tick)
+        self.flush_timer.start(self.FLUSH_INTERVAL)
+
+    def append(self, text, highlight=False):
+        """缓存待显示的文本"""
+        self.pending.append((text, highlight))
+        self.pending_chars += len(text)
+
+    def clear(self):
+        """清空显示和缓存"""
+        self.pending = []
+        self.pending_chars = 0
+        self.last_line = ""
+        self.text_edit.clear()
+
+    def set_auto(self, enabled):
+        """开关自动降级，关闭时恢复完整显示"""
+        self.auto = enabled
+        if not enabled:
+            self.set_mode(FULL)
+
+    def on_tick(self):
+        """定时器触发：测量负载、调整模式、写入缓存的文本"""
+        now = time.monotonic()
+        elapsed = now - self.last_tick
+        self.last_tick = now
+        lag_ms = max(0.0, elapsed * 1000 - self.FLUSH_INTERVAL)
+        rate = self.pending_chars / elapsed if elapsed > 0 else 0.0
+        a = self.SMOOTHING
+        self.lag_ms += a * (lag_ms - self.lag_ms)
+        self.char_rate += a * (rate - self.char_rate)
+
+        if self.auto:
+            self.adjust_mode(now)
+        if self.pending:
+            self.flush()
+        if self.mode in (SUMMARY, HIDDEN) and now - self.last_summary >= self.SUMMARY_INTERVAL:
+            self.last_summary = now
+            self.update_summary()
+
+    def adjust_mode(self, now):
+        """超过阈值立即降级；低于当前阈值一定比例并持续一段时间后恢复一级"""
+        level = MODES.index(self.mode)
+        target = level
+        for index in range(len(MODES) - 1, level, -1):
+            rate_limit, lag_limit = ENTER_THRESHOLDS[MODES[index]]
+            if self.char_rate >= rate_limit or self.lag_ms >= lag_limit:
+                target = index
+                break
+        if target > level:
+            self.calm_since = None
+            self.set_mode(MODES[target])
+            return
+        if level == 0:
+            return
+        rate_limit, lag_limit = ENTER_THRESHOLDS[self.mode]
+        if self.char_rate < rate_limit * self.RELEASE_RATIO and self.lag_ms < lag_limit * self.RELEASE_RATIO:
+            if self.calm_since is None:
+                self.calm_since = now
+            elif now - self.calm_since >= self.HOLD_SECONDS:
+                self.calm_since = None
+                self.set_mode(MODES[level - 1])
+        else:
+            self.calm_since = None
+
+    def set_mode(self, mode):
+        if mode == self.mode:
+            return
+        self.mode = mode
+        document = self.text_edit.document()
+        # 仅末尾模式由文档自动丢弃超出的旧行
+        document.setMaximumBlockCount(0 if mode == FULL else self.TAIL_LINES)
+        if mode in (SUMMARY, HIDDEN):
+            self.last_summary = 0.0
+            self.summary_lbl.show()
+            self.summary_lbl.raise_()
+        else:
+            self.summary_lbl.hide()
+        self.mode_changed.emit(mode)
+
+    def flush(self):
+        """把缓存的文本写入接收框，摘要/隐藏模式只记录最后一行"""
+        pending = self.pending
+        self.pending = []
+        self.pending_chars = 0
+        self.remember_last_line(pending)
+        if self.mode in (SUMMARY, HIDDEN):
+            return
+        if self.mode == TAIL:
+            pending = self.tail_of(pending)
+
+        probe = self.probe
+        start_ns = time.monotonic_ns() if probe is not None and probe.enabled else 0
+        cursor = self.text_edit.textCursor()
+        cursor.movePosition(QTextCursor.End)
+        # 相邻的同格式文本合并后一次插入
+        run = []
+        run_highlight = False
+        for text, highlight in pending + [(None, None)]:
+            if highlight != run_highlight or text is None:
+                if run:
+                    if run_highlight:
+                        cursor.insertText(''.join(run), self.highlight_format)
+                        cursor.setCharFormat(QTextCharFormat())
+                    else:
+                        cursor.insertText(''.join(run))
+                run = []
+                run_highlight = highlight
+            if text is not None:
+                run.append(text)
+        self.text_edit.setTextCursor(cursor)
+        self.text_edit.ensureCursorVisible()
+        if start_ns:
+            probe.record('render', time.monotonic_ns() - start_ns)
+
+    def tail_of(self, pending):
+        """只保留缓存中最后 TAIL_LINES 行"""
+        lines = 0
+        for i in range(len(pending) - 1, -1, -1):
+            text, highlight = pending[i]
+            lines += text.count('\n')
+            if lines > self.TAIL_LINES:
+                # 本块中还需保留的行数，从末尾找到对应的换行位置
+                keep = self.TAIL_LINES - (lines - text.count('\n'))
+                cut = len(text)
+                for _ in range(keep + 1):
+                    cut = text.rfind('\n', 0, cut)
+                return [(text[cut + 1:], highlight)] + pending[i + 1:]
+        return pending
+
+    def remember_last_line(self, pending):
+        for text, _ in reversed(pending):
+            stripped = text.rstrip('\r\n')
+            if stripped:
+                self.last_line = stripped[stripped.rfind('\n') + 1:][-200:]
+                return
+
+    def update_summary(self):
+        """摘要：速率、最后一行和错误数"""
+        if self.mode == HIDDEN:
+            self.summary_lbl.setText(
+                f"接收负载过高，已暂停显示（录制不受影响）\n"
+                f"显示负载 {self.char_rate / 1000:.0f}K 字符/s  事件循环延迟 {self.lag_ms:.0f}ms")
+            return
+        rates = self.stats.rates()
+        totals = self.stats.totals()
+        self.summary_lbl.setText(
+            f"接收负载过高，仅显示摘要\n\n"
+            f"接收 {self.stats.format_bytes(rates['rx_bytes'])}/s   帧 {rates['frames']:.0f}/s\n"
+            f"校验失败 {totals['checksum_failures']:.0f}   暂停丢弃 {self.stats.format_bytes(totals['paused_dropped'])}"
+            f"   解码丢弃 {self.stats.format_bytes(totals['decode_dropped'])}\n"
+            f"事件循环延迟 {self.lag_ms:.0f}ms\n\n"
+            f"最后一行:\n{self.last_line}")
+
+    def status_text(self):
+        """状态栏显示的当前模式"""
+        prefix = "显示" if self.auto else "显示(固定)"
+        return f"{prefix}: {MODE_TITLES[self.mode]}"
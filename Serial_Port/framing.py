@@ -0,0 +1,120 @@
+# framing.py
+# -*- coding: utf-8 -*-
+
+# 菜单显示名称
+FRAMING_TITLES = (
+    ('cobs', "COBS"),
+    ('slip', "SLIP"),
+)
+
+
+class StreamDecoder:
+    """按分隔符分帧的流式解码基类
+
+    每个数据块整体 split，不足一帧的尾部留到下一块，帧内解码由子类按块处理。
+    """
+
+    DELIMITER = b'\x00'
+    MAX_FRAME = 64 * 1024  # 超长仍未结束的帧直接丢弃
+
+    def __init__(self):
+        self.buffer = bytearray()
+        self.dropped = 0
+
+    def reset(self):
+        self.buffer = bytearray()
+
+    def feed(self, data):
+        """加入数据，返回本次完整帧的 [(内容, 是否正确)]"""
+        parts = data.split(self.DELIMITER)
+        if len(parts) == 1:
+            self.buffer += data
+            if len(self.buffer) > self.MAX_FRAME:
+                self.dropped += len(self.buffer)
+                self.buffer = bytearray()
+            return []
+        if self.buffer:
+            parts[0] = bytes(self.buffer) + parts[0]
+        self.buffer = bytearray(parts.pop())
+        # 连续分隔符之间的空帧忽略
+        return [self.decode_frame(part) for part in parts if part]
+
+    def decode_frame(self, frame):
+        raise NotImplementedError
+
+
+class CobsDecoder(StreamDecoder):
+    """COBS 解码：每个编码字节给出到下一个零的距离，按块复制"""
+
+    DELIMITER = b'\x00'
+
+    def decode_frame(self, frame):
+        view = memoryview(frame)
+        out = bytearray()
+        length = len(frame)
+        pos = 0
+        while pos < length:
+            code = view[pos]
+            end = pos + code
+            if end > length:
+                return frame, False
+            out += view[pos + 1:end]
+            pos = end
+            if code < 0xFF and pos < length:
+                out.append(0)
+        return bytes(out), True
+
+
+class SlipDecoder(StreamDecoder):
+    """SLIP 解码：END 分帧，转义序列整体替换"""
+
+    DELIMITER = b'\xc0'
+
+    def decode_frame(self, frame):
+        escapes = frame.count(b'\xdb')
+        ok = escapes == frame.count(b'\xdb\xdc') + frame.count(b'\xdb\xdd')
+        if not escapes:
+            return frame, ok
+        return frame.replace(b'\xdb\xdc', b'\xc0').replace(b'\xdb\xdd', b'\xdb'), ok
+
+
+def cobs_encode(data):
+    """COBS 编码（含结尾的 0x00 分隔符）"""
+    out = bytearray()
+    for segment in bytes(data).split(b'\x00'):
+        view = memoryview(segment)
+        while len(view) >= 254:
+            out.append(0xFF)
+            out += view[:254]
+            view = view[254:]
+        out.append(len(view) + 1)
+        out += view
+    out.append(0)
+    return bytes(out)
+
+
+def slip_encode(data):
+    """SLIP 编码（前后加 END，前面的 END 用于清掉线路上的噪声）"""
+    body = bytes(data).replace(b'\xdb', b'\xdb\xdd').replace(b'\xc0', b'\xdb\xdc')
+    return b'\xc0' + body + b'\xc0'
+
+
+DECODERS = {
+    'cobs': CobsDecoder,
+    'slip': SlipDecoder,
+}
+
+ENCODERS = {
+    'cobs': cobs_encode,
+    'slip': slip_encode,
+}
+
+
+def make_decoder(name):
+    """按名称创建流式解码器"""
+    return DECODERS[name]()
+
+
+def encode(name, data):
+    """按名称编码一帧"""
+    return ENCODERS[name](data)
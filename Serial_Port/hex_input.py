@@ -0,0 +1,189 @@
+# hex_input.py
+# -*- coding: utf-8 -*-
+import re
+
+from PyQt5.QtCore import QObject
+from PyQt5.QtGui import QTextCursor
+
+
+class HexInputController(QObject):
+    """十六进制输入框的增量格式化
+
+    文档中每个文本块（行）对应 rows 中的一段十六进制字符，编辑时只重新整理被改动的行：
+    过滤非法字符、两两分组，超长的行按 ROW_BYTES 拆分。rows 与显示同步更新，
+    取发送内容时无需重新解析整个文档。
+    """
+
+    ROW_BYTES = 16  # 整理后每行的字节数
+    MAX_ROW_DIGITS = 64  # 行内字符超过此长度才拆行，避免输入时影响后面的行
+    NON_HEX = re.compile(r'[^0-9a-fA-F]')
+
+    def __init__(self, text_edit):
+        super().__init__(text_edit)
+        self.edit = text_edit
+        self.document = text_edit.document()
+        self.rows = [""]
+        self.version = 0  # 内容每次变化加一，供发送缓存判断
+        self._updating = False
+        self._block_count = self.document.blockCount()
+        self.document.contentsChange.connect(self.on_contents_change)
+
+    @staticmethod
+    def format_row(digits):
+        """一行十六进制字符两两分组"""
+        return ' '.join([digits[i:i + 2] for i in range(0, len(digits), 2)])
+
+    def split_rows(self, digits):
+        """把一段十六进制字符拆成若干行；奇数个字符时末尾半字节留在最后一行"""
+        if len(digits) <= self.MAX_ROW_DIGITS:
+            return [digits]
+        step = self.ROW_BYTES * 2
+        return [digits[i:i + step] for i in range(0, len(digits), step)]
+
+    def on_contents_change(self, position, chars_removed, chars_added):
+        """文档内容变化：只整理受影响的行"""
+        if self._updating:
+            return
+
+        doc = self.document
+        new_block_count = doc.blockCount()
+        first = doc.findBlock(position)
+        last = doc.findBlock(position + chars_added)
+        if not first.isValid():
+            first = doc.firstBlock()
+        if not last.isValid():
+            last = doc.lastBlock()
+
+        first_no = first.blockNumber()
+        last_no = last.blockNumber()
+        # 删除的换行会合并行，插入的换行会拆行，按行数差推算旧的行范围
+        old_last_no = last_no + (self._block_count - new_block_count)
+
+        region_start = first.position()
+        region_end = last.position() + last.length() - 1
+        cursor = QTextCursor(doc)
+        cursor.setPosition(region_start)
+        cursor.setPosition(region_end, QTextCursor.KeepAnchor)
+        # selectedText 用 U+2029 表示段落分隔
+        region_text = cursor.selectedText().replace('\u2029', '\n')
+
+        # 光标之前的有效字符数，用于整理后恢复光标
+        edit_cursor = self.edit.textCursor()
+        cursor_offset = edit_cursor.position() - region_start
+        track_cursor = 0 <= cursor_offset <= len(region_text)
+        if track_cursor:
+            digits_before = len(self.NON_HEX.sub('', region_text[:cursor_offset]))
+
+        digits = self.NON_HEX.sub('', region_text)
+        if (chars_removed and not chars_added and track_cursor and digits_before
+                and digits == ''.join(self.rows[first_no:old_last_no + 1])):
+            # 只删掉了分隔空格（在空格后退格），改为删除光标前的一个字符
+            digits = digits[:digits_before - 1] + digits[digits_before:]
+            digits_before -= 1
+        new_rows = self.split_rows(digits)
+        self.rows[first_no:old_last_no + 1] = new_rows
+        self.version += 1
+
+        formatted = '\n'.join([self.format_row(row) for row in new_rows])
+        if formatted != region_text:
+            self._updating = True
+            cursor.beginEditBlock()
+            cursor.insertText(formatted)
+            cursor.endEditBlock()
+            self._updating = False
+
+        self._block_count = doc.blockCount()
+
+        if track_cursor:
+            edit_cursor.setPosition(region_start + self.display_offset(new_rows, digits_before))
+            self.edit.setTextCursor(edit_cursor)
+
+    def display_offset(self, rows, digits_before):
+        """有效字符偏移 -> 显示文本中的偏移"""
+        offset = 0
+        for index, row in enumerate(rows):
+            if digits_before <= len(row) or index == len(rows) - 1:
+                column = min(digits_before, len(row))
+                if column == len(row):
+                    return offset + len(self.format_row(row))
+                # 光标停在分组空格之前，退格可以直接删除前一个字符
+                if column and column % 2 == 0:
+                    return offset + column + column // 2 - 1
+                return offset + column + column // 2
+            digits_before -= len(row)
+            offset += len(self.format_row(row)) + 1
+        return offset
+
+    def hex_text(self):
+        """不带空格和换行的十六进制字符串"""
+        return ''.join(self.rows)
+
+    def set_hex_text(self, text):
+        """整体设置内容（程序写入时使用）"""
+        digits = self.NON_HEX.sub('', text)
+        step = self.ROW_BYTES * 2
+        self.set_rows([digits[i:i + step] for i in range(0, len(digits), step)])
+
+    def set_rows(self, rows):
+        """按给定的行整体设置内容"""
+        rows = list(rows) or [""]
+        self._updating = True
+        self.edit.setPlainText('\n'.join([self.format_row(row) for row in rows]))
+        self._updating = False
+        self.rows = rows
+        self.version += 1
+        self._block_count = self.document.blockCount()
+
+    def replace_rows(self, start, count, new_rows):
+        """用 new_rows 替换 rows[start:start + count]，只改写对应的文本块"""
+        rows = [] if self.rows == [""] else self.rows
+        total = len(rows)
+        doc = self.document
+        text = '\n'.join([self.format_row(row) for row in new_rows])
+
+        cursor = QTextCursor(doc)
+        if count:
+            first = doc.findBlockByNumber(start)
+            last = doc.findBlockByNumber(start + count - 1)
+            if new_rows:
+                cursor.setPosition(first.position())
+                cursor.setPosition(last.position() + last.length() - 1, QTextCursor.KeepAnchor)
+            elif start + count < total:
+                # 删除整行，连同其后的换行
+                cursor.setPosition(first.position())
+                cursor.setPosition(doc.findBlockByNumber(start + count).position(), QTextCursor.KeepAnchor)
+            elif start > 0:
+                # 删除末尾若干行，连同其前的换行
+                previous = doc.findBlockByNumber(start - 1)
+                cursor.setPosition(previous.position() + previous.length() - 1)
+                cursor.setPosition(last.position() + last.length() - 1, QTextCursor.KeepAnchor)
+            else:
+                cursor.select(QTextCursor.Document)
+        elif new_rows:
+            if start < total:
+                cursor.setPosition(doc.findBlockByNumber(start).position())
+                text += '\n'
+            elif total:
+                cursor.movePosition(QTextCursor.End)
+                text = '\n' + text
+        else:
+            return
+
+        self._updating = True
+        cursor.beginEditBlock()
+        cursor.insertText(text)
+        cursor.endEditBlock()
+        self._updating = False
+
+        rows[start:start + count] = new_rows
+        self.rows = rows or [""]
+        self.version += 1
+        self._block_count = doc.blockCount()
+
+    def clear(self):
+        """清空内容"""
+        self.set_hex_text("")
+
+    def incomplete_rows(self):
+        """末尾有半个字节的行号（最后一行除外）"""
+        return [i for i, row in enumerate(self.rows[:-1]) if len(row) % 2]
@@ -0,0 +1,102 @@
+# latency_histogram.py
+# -*- coding: utf-8 -*-
+
+
+class LatencyHistogram:
+    """HDR风格的延迟直方图（单位：纳秒）
+
+    每个2的幂区间再细分为 SUB_BUCKETS 个子桶，相对精度约 1/SUB_BUCKETS，
+    记录一次只做几次整数运算，适合在热路径上使用。
+    """
+
+    SUB_BITS = 5
+    SUB_BUCKETS = 1 << SUB_BITS  # 32个子桶，约3%精度
+    MAX_EXPONENT = 40  # 最大约 2^46 ns（约19小时）
+
+    def __init__(self):
+        self.counts = [0] * (2 * self.SUB_BUCKETS + self.MAX_EXPONENT * self.SUB_BUCKETS)
+        self.total = 0
+        self.sum = 0
+        self.min = 0
+        self.max = 0
+
+    def _index(self, value):
+        """数值 -> 桶下标"""
+        if value < 2 * self.SUB_BUCKETS:
+            return value
+        exponent = value.bit_length() - self.SUB_BITS - 1
+        if exponent > self.MAX_EXPONENT:
+            return len(self.counts) - 1
+        mantissa = value >> exponent
+        return 2 * self.SUB_BUCKETS + (exponent - 1) * self.SUB_BUCKETS + (mantissa - self.SUB_BUCKETS)
+
+    def _bucket_value(self, index):
+        """桶下标 -> 桶内最大值"""
+        if index < 2 * self.SUB_BUCKETS:
+            return index
+        exponent = (index - 2 * self.SUB_BUCKETS) // self.SUB_BUCKETS + 1
+        mantissa = (index - 2 * self.SUB_BUCKETS) % self.SUB_BUCKETS + self.SUB_BUCKETS
+        return ((mantissa + 1) << exponent) - 1
+
+    def record(self, value):
+        """记录一个延迟值（纳秒）"""
+        if value < 0:
+            value = 0
+        self.counts[self._index(value)] += 1
+        if self.total == 0 or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.total += 1
+        self.sum += value
+
+    def reset(self):
+        """清空统计"""
+        for i in range(len(self.counts)):
+            self.counts[i] = 0
+        self.total = 0
+        self.sum = 0
+        self.min = 0
+        self.max = 0
+
+    def mean(self):
+        """平均值（纳秒）"""
+        return self.sum / self.total if self.total else 0.0
+
+    def percentile(self, q):
+        """百分位数（q 取 0~100），返回所在桶的上界"""
+        if self.total == 0:
+            return 0
+        target = max(1, int(self.total * q / 100.0 + 0.5))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count:
+                seen += count
+                if seen >= target:
+                    return min(self._bucket_value(index), self.max)
+        return self.max
+
+    def buckets(self):
+        """返回非空桶列表 [(桶上界, 计数), ...]"""
+        return [(self._bucket_value(i), c) for i, c in enumerate(self.counts) if c]
+
+    def to_dict(self):
+        """导出统计数据（纳秒）"""
+        return {
+            'count': self.total,
+            'min': self.min,
+            'mean': self.mean(),
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'max': self.max,
+        }
+
+    def summary(self):
+        """生成一行可读的统计摘要（微秒）"""
+        if self.total == 0:
+            return "无数据"
+        return (f"次数 {self.total}, 平均 {self.mean() / 1000:.1f}µs, "
+                f"P50 {self.percentile(50) / 1000:.1f}µs, "
+                f"P99 {self.percentile(99) / 1000:.1f}µs, "
+                f"最大 {self.max / 1000:.1f}µs")
@@ -0,0 +1,80 @@
+# line_timestamper.py
+# -*- coding: utf-8 -*-
+import time
+
+
+class LineTimestamper:
+    """按行添加时间戳
+
+    时间取自读取线程记录的 monotonic_ns（读到数据的时刻，而不是显示的时刻）。
+    绝对时间格式会缓存当前秒的前缀，每行只需格式化毫秒/微秒整数。
+    """
+
+    MODES = (
+        ('abs_ms', "绝对时间（毫秒）"),
+        ('abs_us', "绝对时间（微秒）"),
+        ('delta', "与上一行间隔"),
+        ('relative', "相对会话开始"),
+    )
+
+    def __init__(self, mode='abs_ms'):
+        self.mode = mode if mode in dict(self.MODES) else 'abs_ms'
+        self.reset()
+
+    def reset(self):
+        """重新开始一个会话（打开串口或清空接收区时）"""
+        now = time.monotonic_ns()
+        self.session_start_ns = now
+        # monotonic 到墙上时间的偏移，只在会话开始时计算一次
+        self.wall_offset_ns = time.time_ns() - now
+        self.prev_line_ns = None
+        self.at_line_start = True
+        self._cached_second = None
+        self._cached_prefix = ""
+
+    def set_mode(self, mode):
+        """切换时间戳格式"""
+        if mode in dict(self.MODES):
+            self.mode = mode
+            self._cached_second = None
+
+    def prefix(self, t_ns):
+        """生成一行的时间戳前缀"""
+        mode = self.mode
+        if mode == 'abs_ms' or mode == 'abs_us':
+            second, frac = divmod(t_ns + self.wall_offset_ns, 1_000_000_000)
+            if second != self._cached_second:
+                self._cached_second = second
+                self._cached_prefix = time.strftime("[%H:%M:%S.", time.localtime(second))
+            if mode == 'abs_ms':
+                return f"{self._cached_prefix}{frac // 1_000_000:03d}] "
+            return f"{self._cached_prefix}{frac // 1000:06d}] "
+
+        if mode == 'delta':
+            delta_us = 0 if self.prev_line_ns is None else (t_ns - self.prev_line_ns) // 1000
+            self.prev_line_ns = t_ns
+            return f"[+{delta_us // 1000}.{delta_us % 1000:03d}ms] "
+
+        elapsed_us = (t_ns - self.session_start_ns) // 1000
+        return f"[{elapsed_us // 1_000_000}.{elapsed_us % 1_000_000:06d}] "
+
+    def stamp_lines(self, text, t_ns):
+        """给文本中每个新行的行首加时间戳，行状态跨数据块保留"""
+        parts = text.split('\n')
+        out = []
+        for i, part in enumerate(parts):
+            if i:
+                out.append('\n')
+                self.at_line_start = True
+            if part:
+                if self.at_line_start:
+                    out.append(self.prefix(t_ns))
+                    self.at_line_start = False
+                out.append(part)
+        return ''.join(out)
+
+    def stamp_block(self, text, t_ns):
+        """整块加时间戳并独占一行（十六进制显示使用）"""
+        lead = '' if self.at_line_start else '\n'
+        self.at_line_start = True
+        return f"{lead}{self.prefix(t_ns)}{text}\n"
@@ -0,0 +1,171 @@
+# modbus_monitor.py
+# -*- coding: utf-8 -*-
+import time
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex, QTimer
+from PyQt5.QtGui import QColor, QFont
+from PyQt5.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableView, QHeaderView
+
+from Serial_Port.modbus_rtu import ModbusRtuFramer, describe_frame
+
+
+class ModbusFrameModel(QAbstractTableModel):
+    """Modbus 帧列表模型：只保存原始帧，显示文本在视图取数据时才生成"""
+
+    COLUMNS = ("时间", "地址", "功能", "说明", "CRC", "原始数据")
+    MAX_ROWS = 200000  # 超出后成批删除最早的帧
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.frames = []
+        self.wall_offset_ns = time.time_ns() - time.monotonic_ns()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.frames)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.COLUMNS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        frame = self.frames[index.row()]
+        column = index.column()
+        if role == Qt.DisplayRole:
+            if column == 0:
+                second, frac = divmod(frame.t_ns + self.wall_offset_ns, 1_000_000_000)
+                return f"{time.strftime('%H:%M:%S', time.localtime(second))}.{frac // 1000:06d}"
+            if column == 1:
+                return str(frame.data[0]) if frame.data else ""
+            if column == 2:
+                return describe_frame(frame)[0]
+            if column == 3:
+                return describe_frame(frame)[1]
+            if column == 4:
+                return "正确" if frame.crc_ok else "错误"
+            return frame.data.hex(' ').upper()
+        if role == Qt.ForegroundRole and not frame.crc_ok:
+            return QColor("#d32f2f")
+        return None
+
+    def append_frames(self, frames):
+        """成批追加"""
+        overflow = len(self.frames) + len(frames) - self.MAX_ROWS
+        if overflow > 0:
+            # 多删一些，避免每批都触发删除
+            overflow = min(len(self.frames), overflow + self.MAX_ROWS // 10)
+            self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+            del self.frames[:overflow]
+            self.endRemoveRows()
+        start = len(self.frames)
+        self.beginInsertRows(QModelIndex(), start, start + len(frames) - 1)
+        self.frames.extend(frames)
+        self.endInsertRows()
+
+    def clear(self):
+        self.beginResetModel()
+        self.frames = []
+        self.endResetModel()
+
+
+class ModbusMonitor(QDialog):
+    """Modbus RTU 监视器
+
+    面板可见时对接收数据分帧；新帧先缓存，按固定频率成批加入表格。
+    """
+
+    REFRESH_INTERVAL = 100  # 毫秒
+
+    def __init__(self, serial_process, parent=None):
+        super().__init__(parent)
+        self.serial_process = serial_process
+        self.setWindowTitle("Modbus RTU 监视器")
+        self.resize(900, 480)
+
+        self.framer = ModbusRtuFramer(serial_process)
+        self.framer.frames_ready.connect(self.on_frames_ready)
+        self.pending_frames = []
+        self.frame_count = 0
+        self.crc_error_count = 0
+
+        self.model = ModbusFrameModel(self)
+        self.table_view = QTableView()
+        self.table_view.setModel(self.model)
+        self.table_view.setFont(QFont("Consolas", 9))
+        self.table_view.setSelectionBehavior(QTableView.SelectRows)
+        self.table_view.setWordWrap(False)
+        # 固定行高，视图只需计算可见行
+        self.table_view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        self.table_view.verticalHeader().setDefaultSectionSize(20)
+        self.table_view.verticalHeader().hide()
+        header = self.table_view.horizontalHeader()
+        for column, width in enumerate((120, 50, 110, 330, 50)):
+            header.resizeSection(column, width)
+        header.setStretchLastSection(True)
+
+        self.summary_lbl = QLabel("")
+        self.clear_btn = QPushButton("清空")
+        self.clear_btn.clicked.connect(self.on_clear)
+
+        top_layout = QHBoxLayout()
+        top_layout.addWidget(self.summary_lbl)
+        top_layout.addStretch()
+        top_layout.addWidget(self.clear_btn)
+
+        layout = QVBoxLayout(self)
+        layout.addLayout(top_layout)
+        layout.addWidget(self.table_view)
+
+        self.refresh_timer = QTimer(self)
+        self.refresh_timer.timeout.connect(self.refresh)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.framer.reset()
+        self.serial_process.data_received.connect(self.on_data_received)
+        self.refresh()
+        self.refresh_timer.start(self.REFRESH_INTERVAL)
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self.refresh_timer.stop()
+        self.serial_process.data_received.disconnect(self.on_data_received)
+
+    def on_data_received(self, data):
+        """接收数据块，时刻取读取时记录的 last_read_ns"""
+        self.framer.feed(data.data(), self.serial_process.last_read_ns)
+
+    def on_frames_ready(self, frames):
+        """新帧先缓存，计入收发统计"""
+        self.pending_frames.extend(frames)
+        errors = sum(1 for frame in frames if not frame.crc_ok)
+        self.frame_count += len(frames)
+        self.crc_error_count += errors
+        stats = self.serial_process.stats
+        stats.add('frames', len(frames))
+        if errors:
+            stats.add('checksum_failures', errors)
+
+    def on_clear(self):
+        """清空帧列表"""
+        self.pending_frames = []
+        self.frame_count = 0
+        self.crc_error_count = 0
+        self.model.clear()
+        self.refresh()
+
+    def refresh(self):
+        """把缓存的帧成批加入表格"""
+        if self.pending_frames:
+            scroll_bar = self.table_view.verticalScrollBar()
+            at_bottom = scroll_bar.value() >= scroll_bar.maximum()
+            self.model.append_frames(self.pending_frames)
+            self.pending_frames = []
+            if at_bottom:
+                self.table_view.scrollToBottom()
+        self.summary_lbl.setText(
+            f"帧 {self.frame_count}  CRC 错误 {self.crc_error_count}  "
+            f"帧间隔 {self.framer.gap_ns() / 1e6:.2f}ms（{self.serial_process.baud_rate} bps）")
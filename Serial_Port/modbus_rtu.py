@@ -0,0 +1,182 @@
+# modbus_rtu.py
+# -*- coding: utf-8 -*-
+import math
+from collections import namedtuple
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from Serial_Port.checksum import CRC16_MODBUS, crc16_modbus
+
+CRC16_TABLE = CRC16_MODBUS.table
+
+# 一帧：读取时刻、原始字节、CRC 是否正确
+ModbusFrame = namedtuple('ModbusFrame', ['t_ns', 'data', 'crc_ok'])
+
+MIN_FRAME = 4  # 地址 + 功能码 + CRC
+
+FUNCTION_NAMES = {
+    0x01: "读线圈",
+    0x02: "读离散输入",
+    0x03: "读保持寄存器",
+    0x04: "读输入寄存器",
+    0x05: "写单个线圈",
+    0x06: "写单个寄存器",
+    0x0F: "写多个线圈",
+    0x10: "写多个寄存器",
+}
+
+EXCEPTION_NAMES = {
+    0x01: "非法功能码",
+    0x02: "非法数据地址",
+    0x03: "非法数据值",
+    0x04: "从站设备故障",
+    0x05: "确认",
+    0x06: "从站设备忙",
+    0x08: "存储奇偶错误",
+    0x0A: "网关路径不可用",
+    0x0B: "网关目标无响应",
+}
+
+MAX_LISTED_VALUES = 16  # 说明中最多列出的寄存器/线圈数
+
+
+def split_frames(data, t_ns):
+    """把一段静默间隔之间的数据切成帧
+
+    整段 CRC 正确时即为一帧；否则逐字节累计 CRC，累计值为 0 的位置就是一帧的结尾
+    （CRC 连同其自身校验结果为 0），处理读取时粘在一起的多帧。剩余部分作为 CRC 错误帧。
+    """
+    if len(data) >= MIN_FRAME and crc16_modbus(data) == 0:
+        return [ModbusFrame(t_ns, bytes(data), True)]
+
+    frames = []
+    table = CRC16_TABLE
+    start = 0
+    crc = 0xFFFF
+    for i, byte in enumerate(data):
+        crc = (crc >> 8) ^ table[(crc ^ byte) & 0xFF]
+        if crc == 0 and i + 1 - start >= MIN_FRAME:
+            frames.append(ModbusFrame(t_ns, bytes(data[start:i + 1]), True))
+            start = i + 1
+            crc = 0xFFFF
+    if start < len(data):
+        frames.append(ModbusFrame(t_ns, bytes(data[start:]), False))
+    return frames
+
+
+def _u16(data, pos):
+    return (data[pos] << 8) | data[pos + 1]
+
+
+def _values_text(values):
+    text = ", ".join(str(v) for v in values[:MAX_LISTED_VALUES])
+    if len(values) > MAX_LISTED_VALUES:
+        text += f", ...（共 {len(values)} 个）"
+    return text
+
+
+def describe_frame(frame):
+    """解析功能码、寄存器和异常，返回 (功能码说明, 详细说明)
+
+    被动监听无法区分请求和响应，按帧长度与字节数字段推断。
+    """
+    data = frame.data
+    if len(data) < MIN_FRAME:
+        return "-", "帧过短"
+    function = data[1]
+    body = data[2:-2]
+
+    if function & 0x80:
+        name = FUNCTION_NAMES.get(function & 0x7F, f"0x{function & 0x7F:02X}")
+        code = body[0] if body else None
+        return f"{name} 异常", f"异常码 {code}: {EXCEPTION_NAMES.get(code, '未知')}"
+
+    name = FUNCTION_NAMES.get(function, f"0x{function:02X}")
+    if function in (0x01, 0x02, 0x03, 0x04):
+        if body and len(body) == body[0] + 1:
+            payload = body[1:]
+            if function in (0x03, 0x04):
+                values = [_u16(payload, i) for i in range(0, len(payload) - 1, 2)]
+                return name, f"响应 {len(values)} 个寄存器: {_values_text(values)}"
+            bits = [(payload[i // 8] >> (i % 8)) & 1 for i in range(len(payload) * 8)]
+            return name, f"响应 {len(payload)} 字节: {_values_text(bits)}"
+        if len(body) == 4:
+            return name, f"请求 起始 {_u16(body, 0)} 数量 {_u16(body, 2)}"
+    elif function in (0x05, 0x06):
+        if len(body) == 4:
+            return name, f"地址 {_u16(body, 0)} 值 0x{_u16(body, 2):04X}"
+    elif function in (0x0F, 0x10):
+        if len(body) == 4:
+            return name, f"响应 起始 {_u16(body, 0)} 数量 {_u16(body, 2)}"
+        if len(body) >= 5 and len(body) == body[4] + 5:
+            payload = body[5:]
+            if function == 0x10:
+                values = [_u16(payload, i) for i in range(0, len(payload) - 1, 2)]
+                return name, f"请求 起始 {_u16(body, 0)} 值: {_values_text(values)}"
+            return name, f"请求 起始 {_u16(body, 0)} 数量 {_u16(body, 2)}"
+    return name, f"数据 {body.hex(' ').upper()}"
+
+
+class ModbusRtuFramer(QObject):
+    """Modbus RTU 分帧：按 3.5 个字符的静默间隔切分
+
+    间隔用读取线程记录的时刻计算（SerialProcess.last_read_ns），
+    减去本次读到的字节本身的传输时间，得到两次读取之间线路的静默时长。
+    数据停止后由空闲定时器结束最后一帧。
+    """
+
+    # 一批新帧
+    frames_ready = pyqtSignal(list)
+
+    FIXED_GAP_NS = 1_750_000  # 波特率高于 19200 时规范规定的固定间隔
+
+    def __init__(self, serial_process):
+        super().__init__()
+        self.serial_process = serial_process
+        self.buffer = bytearray()
+        self.first_ns = 0
+        self.last_ns = 0
+
+        self.idle_timer = QTimer(self)
+        self.idle_timer.setSingleShot(True)
+        self.idle_timer.timeout.connect(self.on_idle)
+
+    def gap_ns(self):
+        """帧间静默间隔"""
+        if self.serial_process.baud_rate > 19200:
+            return self.FIXED_GAP_NS
+        return int(3.5 * self.serial_process.char_time_ns)
+
+    def reset(self):
+        self.buffer = bytearray()
+        self.idle_timer.stop()
+
+    def feed(self, data, t_ns):
+        """加入一次读取的数据"""
+        frames = []
+        if self.buffer:
+            silent_ns = t_ns - self.last_ns - len(data) * self.serial_process.char_time_ns
+            if silent_ns >= self.gap_ns():
+                frames = split_frames(self.buffer, self.first_ns)
+                self.buffer = bytearray()
+        if not self.buffer:
+            self.first_ns = t_ns
+        self.buffer += data
+        self.last_ns = t_ns
+
+        if frames:
+            self.frames_ready.emit(frames)
+        # 定时器精度为毫秒，取间隔的两倍并至少 2 毫秒
+        self.idle_timer.start(max(2, math.ceil(self.gap_ns() * 2 / 1e6)))
+
+    def on_idle(self):
+        """线路空闲：结束缓冲中的帧"""
+        if not self.buffer:
+            return
+        if self.serial_process.bytes_available():
+            # 还有未读取的数据，等读取后再判断
+            self.idle_timer.start(1)
+            return
+        frames = split_frames(self.buffer, self.first_ns)
+        self.buffer = bytearray()
+        self.frames_ready.emit(frames)
@@ -0,0 +1,77 @@
+# motor_view_model.py
+# -*- coding: utf-8 -*-
+from PyQt5.QtCore import QObject, QTimer
+
+# 各状态对应的标签与高亮样式
+STATUS_STYLES = {
+    'forward': ('forward_lbl', "background-color: lightgreen; font-weight: bold; border: 2px solid green;"),
+    'reverse': ('reversal_lbl', "background-color: lightblue; font-weight: bold; border: 2px solid blue;"),
+    'stop': ('cease_lbl', "background-color: #ffcccc; font-weight: bold; border: 2px solid red;"),
+}
+
+CONNECT_TEXTS = {1: "已连接", 2: "未连接"}
+
+
+class MotorViewModel(QObject):
+    """电机状态显示的视图模型
+
+    保存当前的速度、电机状态和连接状态，只有值真正变化时才更新控件：
+    状态标签的样式表只在初始化时设置一次，之后切换动态属性 active 并重新 polish 该标签；
+    速度文本按 DISPLAY_INTERVAL 限频刷新，中间的采样只更新模型。
+    """
+
+    DISPLAY_INTERVAL = 100  # 毫秒，数值显示的最快刷新间隔
+
+    def __init__(self, ui, parent=None):
+        super().__init__(parent)
+        self.ui = ui
+        self.status = None
+        self.speed = None
+        self.speed_text = ui.speed_ledit.text()
+        self.connect_state = None
+
+        self.labels = {}
+        for status, (name, style) in STATUS_STYLES.items():
+            label = getattr(ui, name)
+            label.setProperty('active', False)
+            label.setStyleSheet(
+                f"QLabel {{ background-color: lightgray; }} QLabel[active=\"true\"] {{ {style} }}")
+            self.labels[status] = label
+
+        self.display_timer = QTimer(self)
+        self.display_timer.setSingleShot(True)
+        self.display_timer.timeout.connect(self.refresh_speed)
+
+    def set_status(self, status):
+        """切换电机状态，只重绘状态变化的两个标签"""
+        if status == self.status:
+            return
+        for label, active in ((self.labels.get(self.status), False), (self.labels.get(status), True)):
+            if label is not None:
+                label.setProperty('active', active)
+                label.style().unpolish(label)
+                label.style().polish(label)
+        self.status = status
+
+    def set_speed(self, speed):
+        """更新速度；距上次刷新不足间隔时等定时器到期再显示最新值"""
+        self.speed = speed
+        if not self.display_timer.isActive():
+            self.refresh_speed()
+
+    def refresh_speed(self):
+        if self.speed is None:
+            return
+        text = f"{self.speed:.2f}"
+        if text != self.speed_text:
+            self.speed_text = text
+            self.ui.speed_ledit.setText(text)
+            # 刚刷新过，间隔内的新值由定时器补上
+            self.display_timer.start(self.DISPLAY_INTERVAL)
+
+    def set_connect_state(self, state):
+        """更新连接状态（1 已连接，2 未连接）"""
+        if state == self.connect_state or state not in CONNECT_TEXTS:
+            return
+        self.connect_state = state
+        self.ui.connect_btn.setText(CONNECT_TEXTS[state])
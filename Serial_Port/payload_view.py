@@ -0,0 +1,61 @@
+# payload_view.py
+# -*- coding: utf-8 -*-
+from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtGui import QFont
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPlainTextEdit, QPushButton
+
+
+class PayloadPageView(QWidget):
+    """载入数据的只读分页视图：每次只渲染一页十六进制转储"""
+
+    # 请求卸载载入的数据
+    unload_requested = pyqtSignal()
+
+    def __init__(self, payload, parent=None):
+        super().__init__(parent)
+        self.payload = payload
+        self.page = 0
+
+        self.summary_lbl = QLabel("")
+        self.summary_lbl.setFont(QFont("Consolas", 9))
+
+        self.page_tEdit = QPlainTextEdit()
+        self.page_tEdit.setReadOnly(True)
+        self.page_tEdit.setFont(QFont("Consolas", 9))
+        self.page_tEdit.setLineWrapMode(QPlainTextEdit.NoWrap)
+
+        self.prev_btn = QPushButton("上一页")
+        self.prev_btn.clicked.connect(lambda: self.show_page(self.page - 1))
+        self.page_lbl = QLabel("")
+        self.next_btn = QPushButton("下一页")
+        self.next_btn.clicked.connect(lambda: self.show_page(self.page + 1))
+        self.unload_btn = QPushButton("卸载")
+        self.unload_btn.clicked.connect(self.unload_requested.emit)
+
+        button_layout = QHBoxLayout()
+        button_layout.addWidget(self.prev_btn)
+        button_layout.addWidget(self.page_lbl)
+        button_layout.addWidget(self.next_btn)
+        button_layout.addStretch()
+        button_layout.addWidget(self.unload_btn)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(2)
+        layout.addWidget(self.summary_lbl)
+        layout.addWidget(self.page_tEdit)
+        layout.addLayout(button_layout)
+
+    def refresh(self):
+        """载入新数据后从第一页开始显示"""
+        self.summary_lbl.setText(self.payload.summary())
+        self.show_page(0)
+
+    def show_page(self, page):
+        """显示指定页"""
+        count = self.payload.page_count()
+        self.page = min(max(page, 0), count - 1)
+        self.page_tEdit.setPlainText(self.payload.page_text(self.page))
+        self.page_lbl.setText(f"{self.page + 1}/{count}")
+        self.prev_btn.setEnabled(self.page > 0)
+        self.next_btn.setEnabled(self.page < count - 1)
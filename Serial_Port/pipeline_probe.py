@@ -0,0 +1,80 @@
+# pipeline_probe.py
+# -*- coding: utf-8 -*-
+import time
+
+from Serial_Port.latency_histogram import LatencyHistogram
+
+
+class PipelineProbe:
+    """接收链路分段计时探针
+
+    在接收链路的各个节点打 monotonic_ns 时间戳，记录相邻节点之间的耗时到
+    各自的直方图中。关闭时调用方只做一次 `probe.enabled` 判断，开销可以忽略。
+    """
+
+    # 各阶段按链路顺序排列，每个阶段记录的是距上一个节点的耗时。
+    # 接收区和图表由定时器成批绘制，不在每次读取的链路中，单独记录每次绘制的耗时（不计入总耗时）
+    STAGES = (
+        ('read_done', "readyRead → 读取完成"),
+        ('slot_entry', "信号投递 → on_data_received"),
+        ('chart', "插件解码、图表入队"),
+        ('decode', "显示解码"),
+        ('append', "接收文本入队"),
+        ('total', "端到端总耗时"),
+        ('render', "接收区绘制（定时批量）"),
+        ('chart_draw', "图表重绘（定时）"),
+    )
+
+    def __init__(self):
+        self.enabled = False
+        self.histograms = {stage: LatencyHistogram() for stage, _ in self.STAGES}
+        self._start_ns = 0
+        self._last_ns = 0
+
+    def set_enabled(self, enabled):
+        """运行时开关"""
+        self.enabled = enabled
+        self._start_ns = 0
+
+    def begin(self):
+        """readyRead 到达时调用，开始一次计时"""
+        self._start_ns = self._last_ns = time.monotonic_ns()
+
+    def mark(self, stage):
+        """记录一个节点"""
+        if not self._start_ns:
+            return
+        now = time.monotonic_ns()
+        self.histograms[stage].record(now - self._last_ns)
+        self._last_ns = now
+
+    def record(self, stage, elapsed_ns):
+        """记录不在读取链路中的独立耗时"""
+        if self.enabled:
+            self.histograms[stage].record(elapsed_ns)
+
+    def end(self):
+        """链路结束，记录端到端耗时"""
+        if not self._start_ns:
+            return
+        self.histograms['total'].record(time.monotonic_ns() - self._start_ns)
+        self._start_ns = 0
+
+    def reset(self):
+        """清空所有统计"""
+        for histogram in self.histograms.values():
+            histogram.reset()
+
+    def to_dict(self):
+        """导出各阶段统计（纳秒）"""
+        return {stage: self.histograms[stage].to_dict() for stage, _ in self.STAGES}
+
+    def report(self):
+        """生成各阶段统计表（微秒）"""
+        lines = [f"{'阶段':<28}{'次数':>8}{'平均':>10}{'P50':>10}{'P99':>10}{'最大':>10}"]
+        for stage, title in self.STAGES:
+            h = self.histograms[stage]
+            lines.append(f"{title:<28}{h.total:>8}{h.mean() / 1000:>10.1f}"
+                         f"{h.percentile(50) / 1000:>10.1f}{h.percentile(99) / 1000:>10.1f}"
+                         f"{h.max / 1000:>10.1f}")
+        return "\n".join(lines)
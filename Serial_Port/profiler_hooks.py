@@ -0,0 +1,129 @@
+# profiler_hooks.py
+# -*- coding: utf-8 -*-
+import cProfile
+import functools
+import json
+import os
+import time
+from datetime import datetime
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+
+class HotPathProfiler(QObject):
+    """热路径性能采样
+
+    包装界面中的热点槽函数，采样窗口内用 cProfile 记录调用栈，同时记录每次调用的
+    起止时间。窗口结束后写出 .prof 文件和 Chrome trace JSON，可直接附到问题单上。
+    未采样时包装函数只多一次布尔判断。
+    """
+
+    # 环境变量：采样秒数，例如 PORTMONITOR_PROFILE=30
+    ENV_VAR = "PORTMONITOR_PROFILE"
+    DEFAULT_WINDOW = 30  # 秒
+    MAX_EVENTS = 200000  # trace 事件上限，防止长时间采样占满内存
+
+    # 采样结束信号：.prof 路径、trace 路径
+    finished = pyqtSignal(str, str)
+
+    def __init__(self, output_dir="profiles"):
+        super().__init__()
+        self.output_dir = output_dir
+        self.active = False
+        self._profile = None
+        self._depth = 0
+        self._events = []
+        self._start_ns = 0
+        self._stop_timer = QTimer(self)
+        self._stop_timer.setSingleShot(True)
+        self._stop_timer.timeout.connect(self.stop)
+
+    def instrument(self, obj, method_names):
+        """用采样包装替换对象上的方法（需在连接信号之前调用）"""
+        for name in method_names:
+            setattr(obj, name, self._wrap(name, getattr(obj, name)))
+
+    def _wrap(self, name, func):
+        profiler = self
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not profiler.active:
+                return func(*args, **kwargs)
+            return profiler._call(name, func, args, kwargs)
+
+        return wrapper
+
+    def _call(self, name, func, args, kwargs):
+        """采样期间执行一次调用"""
+        start = time.perf_counter_ns()
+        if self._depth == 0:
+            self._profile.enable()
+        self._depth += 1
+        try:
+            return func(*args, **kwargs)
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self._profile.disable()
+            if len(self._events) < self.MAX_EVENTS:
+                self._events.append((name, start, time.perf_counter_ns() - start))
+
+    def start_from_env(self):
+        """根据环境变量自动开始采样"""
+        value = os.environ.get(self.ENV_VAR, "").strip()
+        if not value:
+            return False
+        try:
+            seconds = float(value)
+        except ValueError:
+            seconds = self.DEFAULT_WINDOW
+        if seconds <= 1:
+            seconds = self.DEFAULT_WINDOW
+        self.start(seconds)
+        return True
+
+    def start(self, seconds=DEFAULT_WINDOW):
+        """开始一个有限时长的采样窗口"""
+        if self.active:
+            return
+        self._profile = cProfile.Profile()
+        self._events = []
+        self._depth = 0
+        self._start_ns = time.perf_counter_ns()
+        self.active = True
+        self._stop_timer.start(int(seconds * 1000))
+
+    def stop(self):
+        """结束采样并写出结果文件"""
+        if not self.active:
+            return None
+        self.active = False
+        self._stop_timer.stop()
+
+        os.makedirs(self.output_dir, exist_ok=True)
+        base = os.path.join(self.output_dir, f"portmonitor_{datetime.now().strftime('%Y%m%d_%H%M%S')}")
+        prof_path = base + ".prof"
+        trace_path = base + ".trace.json"
+
+        self._profile.dump_stats(prof_path)
+        self.write_chrome_trace(trace_path)
+        self._profile = None
+        self._events = []
+
+        self.finished.emit(prof_path, trace_path)
+        return prof_path, trace_path
+
+    def write_chrome_trace(self, path):
+        """写出 Chrome trace JSON（chrome://tracing 或 Perfetto 可打开）"""
+        pid = os.getpid()
+        events = [{
+            "name": name,
+            "ph": "X",
+            "ts": (start - self._start_ns) / 1000,
+            "dur": duration / 1000,
+            "pid": pid,
+            "tid": 0,
+        } for name, start, duration in self._events]
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
@@ -0,0 +1,92 @@
+# send_payload.py
+# -*- coding: utf-8 -*-
+import os
+
+
+class SendPayload:
+    """发送内容模型
+
+    实际发送的字节保存在 bytearray 中，字符串框和十六进制框只是它的视图：
+    编辑框内容不变时重复发送（如自动发送）直接复用缓存的字节，不再重新编码。
+    从文件或剪贴板载入的大数据直接保存为字节，界面只分页显示，不写入编辑框。
+    """
+
+    LARGE_THRESHOLD = 64 * 1024  # 超过此大小的载入数据使用分页视图
+    PAGE_BYTES = 4096  # 每页字节数
+    ROW_BYTES = 16  # 分页视图每行字节数
+
+    def __init__(self):
+        self.data = bytearray()
+        self.loaded = False  # 是否为载入的数据（编辑框不可编辑）
+        self.source = ""  # 'text'、'hex'、'file'、'clipboard'
+        self.name = ""
+        self._view_key = None
+
+    def from_text(self, text):
+        """字符串视图 -> 字节（文本对象不变时复用）"""
+        if self._view_key is not text:
+            self.data = bytearray(text.encode('utf-8'))
+            self.source = 'text'
+            self._view_key = text
+        return self.data
+
+    def from_hex(self, hex_input):
+        """十六进制视图 -> 字节（内容版本不变时复用）"""
+        key = ('hex', hex_input.version)
+        if self._view_key != key:
+            digits = hex_input.hex_text()
+            if len(digits) % 2:
+                # 奇数个字符时在前面补0
+                digits = '0' + digits
+            self.data = bytearray.fromhex(digits)
+            self.source = 'hex'
+            self._view_key = key
+        return self.data
+
+    def load(self, data, source, name=""):
+        """载入外部数据（文件、剪贴板）"""
+        self.data = bytearray(data)
+        self.loaded = True
+        self.source = source
+        self.name = name
+        self._view_key = None
+
+    def load_file(self, file_path):
+        """从文件载入"""
+        with open(file_path, 'rb') as f:
+            self.load(f.read(), 'file', os.path.basename(file_path))
+
+    def unload(self):
+        """卸载载入的数据，恢复为编辑框视图"""
+        self.data = bytearray()
+        self.loaded = False
+        self.source = ""
+        self.name = ""
+        self._view_key = None
+
+    def is_large(self):
+        return len(self.data) > self.LARGE_THRESHOLD
+
+    def page_count(self):
+        return max(1, -(-len(self.data) // self.PAGE_BYTES))
+
+    def page_text(self, page):
+        """生成一页的十六进制转储"""
+        start = page * self.PAGE_BYTES
+        chunk = bytes(self.data[start:start + self.PAGE_BYTES])
+        step = self.ROW_BYTES
+        return '\n'.join([f"{start + i:08X}  {chunk[i:i + step].hex(' ').upper()}"
+                          for i in range(0, len(chunk), step)])
+
+    def summary(self):
+        """大小摘要"""
+        size = len(self.data)
+        for unit, scale in (("GB", 1 << 30), ("MB", 1 << 20), ("KB", 1 << 10)):
+            if size >= scale:
+                text = f"{size / scale:.1f}{unit}（{size:,} 字节）"
+                break
+        else:
+            text = f"{size} 字节"
+        source = {'file': "文件", 'clipboard': "剪贴板"}.get(self.source, self.source)
+        name = f" {self.name}" if self.name else ""
+        return f"{source}{name}：{text}"
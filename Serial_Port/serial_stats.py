@@ -0,0 +1,115 @@
+# serial_stats.py
+# -*- coding: utf-8 -*-
+import time
+
+
+class RollingCounter:
+    """滑动窗口计数器
+
+    窗口划分为固定宽度的时间桶，每次计数只更新当前桶，跨桶时清掉过期的桶，
+    单次计数为 O(1)。速率按已完整经过的桶计算。
+    """
+
+    def __init__(self, window_seconds=5.0, bucket_count=20):
+        self.bucket_ns = int(window_seconds * 1e9 / bucket_count)
+        self.buckets = [0] * bucket_count
+        self.current = time.monotonic_ns() // self.bucket_ns
+        self.total = 0
+
+    def _advance(self, now_bucket):
+        """前进到当前时间桶，清空中间过期的桶"""
+        count = len(self.buckets)
+        steps = now_bucket - self.current
+        if steps >= count:
+            for i in range(count):
+                self.buckets[i] = 0
+        else:
+            for b in range(self.current + 1, now_bucket + 1):
+                self.buckets[b % count] = 0
+        self.current = now_bucket
+
+    def add(self, amount=1):
+        """计数"""
+        now_bucket = time.monotonic_ns() // self.bucket_ns
+        if now_bucket != self.current:
+            self._advance(now_bucket)
+        self.buckets[now_bucket % len(self.buckets)] += amount
+        self.total += amount
+
+    def rate(self):
+        """每秒速率（不含正在累计的当前桶）"""
+        now_bucket = time.monotonic_ns() // self.bucket_ns
+        if now_bucket != self.current:
+            self._advance(now_bucket)
+        completed = sum(self.buckets) - self.buckets[now_bucket % len(self.buckets)]
+        return completed * 1e9 / (self.bucket_ns * (len(self.buckets) - 1))
+
+    def reset(self):
+        """清空计数"""
+        for i in range(len(self.buckets)):
+            self.buckets[i] = 0
+        self.total = 0
+
+
+class SerialStatistics:
+    """收发统计：各项指标的滑动窗口速率和累计值"""
+
+    COUNTERS = (
+        ('rx_bytes', "接收字节"),
+        ('tx_bytes', "发送字节"),
+        ('rx_chunks', "接收数据块"),
+        ('frames', "解析帧"),
+        ('checksum_failures', "校验失败"),
+        ('paused_dropped', "暂停期间丢弃字节"),
+        ('decode_dropped', "解码队列已满丢弃字节"),
+        ('overruns', "疑似读缓冲溢出（串口读缓冲被填满）"),
+    )
+
+    def __init__(self, window_seconds=5.0):
+        self.window_seconds = window_seconds
+        self.counters = {name: RollingCounter(window_seconds) for name, _ in self.COUNTERS}
+
+    def add(self, name, amount=1):
+        """累加一个指标"""
+        self.counters[name].add(amount)
+
+    def rates(self):
+        """各指标每秒速率"""
+        return {name: counter.rate() for name, counter in self.counters.items()}
+
+    def totals(self):
+        """各指标累计值"""
+        return {name: counter.total for name, counter in self.counters.items()}
+
+    def export(self):
+        """导出统计数据，供界面、无界面工具和基准测试共用"""
+        return {
+            'window_seconds': self.window_seconds,
+            'rates': self.rates(),
+            'totals': self.totals(),
+        }
+
+    def reset(self):
+        """清空所有统计"""
+        for counter in self.counters.values():
+            counter.reset()
+
+    @staticmethod
+    def format_bytes(value):
+        """格式化字节数"""
+        for unit in ("B", "KB", "MB"):
+            if value < 1024:
+                return f"{value:.0f}{unit}" if unit == "B" else f"{value:.1f}{unit}"
+            value /= 1024
+        return f"{value:.1f}GB"
+
+    def status_text(self):
+        """状态栏摘要"""
+        rates = self.rates()
+        totals = self.totals()
+        return (f"RX {self.format_bytes(rates['rx_bytes'])}/s  "
+                f"TX {self.format_bytes(rates['tx_bytes'])}/s  "
+                f"块 {rates['rx_chunks']:.0f}/s  帧 {rates['frames']:.0f}/s  "
+                f"校验错 {rates['checksum_failures']:.0f}/s  "
+                f"丢弃 {self.format_bytes(totals['paused_dropped'] + totals['decode_dropped'])}  "
+                f"疑似溢出 {totals['overruns']:.0f}")
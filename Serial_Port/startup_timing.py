@@ -0,0 +1,70 @@
+# startup_timing.py
+# -*- coding: utf-8 -*-
+import os
+import time
+
+# 尽早导入本模块，以此作为启动计时的起点
+PROCESS_START_NS = time.perf_counter_ns()
+
+from PyQt5.QtCore import QObject, QEvent, QTimer
+
+
+class StartupTimer(QObject):
+    """启动耗时统计：导入、首次绘制、可打开串口"""
+
+    # 环境变量：冷启动目标（毫秒），超出时打印警告
+    TARGET_ENV_VAR = "PORTMONITOR_STARTUP_TARGET_MS"
+    FIRST_PAINT_TIMEOUT = 1000  # 毫秒，收不到绘制事件时的兜底
+
+    def __init__(self):
+        super().__init__()
+        self.marks = []
+        self._watched = None
+        self._first_paint_callback = None
+
+    def mark(self, name):
+        """记录一个启动节点（相对进程启动的毫秒数）"""
+        self.marks.append((name, (time.perf_counter_ns() - PROCESS_START_NS) / 1e6))
+
+    def elapsed(self, name):
+        """获取某个节点的耗时（毫秒）"""
+        for mark_name, ms in self.marks:
+            if mark_name == name:
+                return ms
+        return None
+
+    def call_after_first_paint(self, widget, callback):
+        """窗口第一次绘制完成后再执行回调"""
+        self._watched = widget
+        self._first_paint_callback = callback
+        widget.installEventFilter(self)
+        QTimer.singleShot(self.FIRST_PAINT_TIMEOUT, self._on_first_paint)
+
+    def eventFilter(self, obj, event):
+        if obj is self._watched and event.type() == QEvent.Paint:
+            # 绘制事件处理完之后再执行回调
+            QTimer.singleShot(0, self._on_first_paint)
+        return False
+
+    def _on_first_paint(self):
+        if self._first_paint_callback is None:
+            return
+        callback = self._first_paint_callback
+        self._first_paint_callback = None
+        self._watched.removeEventFilter(self)
+        self.mark("first_paint")
+        callback()
+
+    def report(self):
+        """生成启动耗时报告"""
+        text = "启动耗时: " + ", ".join(f"{name} {ms:.0f}ms" for name, ms in self.marks)
+
+        target = os.environ.get(self.TARGET_ENV_VAR, "").strip()
+        ready_ms = self.elapsed("ready")
+        if target and ready_ms is not None:
+            try:
+                if ready_ms > float(target):
+                    text += f"（超出目标 {float(target):.0f}ms）"
+            except ValueError:
+                pass
+        return text
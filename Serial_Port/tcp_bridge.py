@@ -0,0 +1,168 @@
+# tcp_bridge.py
+# -*- coding: utf-8 -*-
+import asyncio
+import threading
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from Serial_Port.bridge_policy import POLICY_TITLES
+
+
+class _Client:
+    """一个已连接的客户端：有界发送队列和统计"""
+
+    def __init__(self, address, writer, queue_size):
+        self.address = address
+        self.writer = writer
+        self.queue = asyncio.Queue(queue_size)
+        self.sent = 0
+        self.dropped = 0
+
+
+class TcpBridge(QObject):
+    """串口到 TCP 的转发服务
+
+    asyncio 服务器运行在独立线程中：接收数据由 publish() 投递到事件循环，
+    分发到每个客户端各自的有界队列，由各自的发送协程写出，慢客户端不会阻塞串口读取；
+    队列满时按策略丢弃数据或断开该客户端。客户端发来的数据通过 data_from_client 信号
+    （跨线程排队）交给界面线程发送。
+    """
+
+    # 客户端发来的数据（在界面线程中处理）
+    data_from_client = pyqtSignal(bytes)
+    # 客户端数量变化
+    clients_changed = pyqtSignal(int)
+
+    QUEUE_SIZE = 256  # 每个客户端最多排队的数据块数
+    READ_SIZE = 64 * 1024
+
+    def __init__(self, host="0.0.0.0", port=5000, policy='drop', queue_size=QUEUE_SIZE):
+        super().__init__()
+        self.host = host
+        self.port = port
+        self.policy = policy
+        self.queue_size = queue_size
+        self.clients = {}
+        # 各客户端的接收处理和发送协程（含已被断开、尚未结束的）
+        self.handlers = set()
+        self.senders = set()
+        self.client_count = 0  # 供界面线程无锁读取
+        self.loop = None
+        self.server = None
+        self.thread = None
+
+    def start(self):
+        """启动服务，端口被占用等错误抛出 OSError"""
+        started = threading.Event()
+        failure = []
+
+        def run():
+            self.loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self.loop)
+            try:
+                self.server = self.loop.run_until_complete(
+                    asyncio.start_server(self.handle_client, self.host, self.port))
+            except OSError as e:
+                failure.append(e)
+                started.set()
+                self.loop.close()
+                return
+            # 端口为 0 时取系统分配的端口
+            self.port = self.server.sockets[0].getsockname()[1]
+            started.set()
+            try:
+                self.loop.run_forever()
+            finally:
+                self.loop.close()
+
+        self.thread = threading.Thread(target=run, name="tcp-bridge", daemon=True)
+        self.thread.start()
+        started.wait()
+        if failure:
+            self.thread.join()
+            raise failure[0]
+
+    def stop(self):
+        """关闭所有客户端并停止服务"""
+        if self.thread is None:
+            return
+        future = asyncio.run_coroutine_threadsafe(self._shutdown(), self.loop)
+        try:
+            future.result(2)
+        except Exception as e:
+            print(f"关闭转发服务出错: {e}")
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(2)
+        self.thread = None
+
+    async def _shutdown(self):
+        """停止接受连接，取消并等待所有客户端协程结束后再关闭服务"""
+        self.server.close()
+        for client in list(self.clients.values()):
+            client.writer.transport.abort()
+        # 连接中止后接收处理协程读到 EOF 自行结束（3.11 的 start_server 对被取消的处理协程会报错），
+        # 发送协程可能在等队列，直接取消
+        for task in self.senders:
+            task.cancel()
+        await asyncio.gather(*self.handlers, *self.senders, return_exceptions=True)
+        await self.server.wait_closed()
+
+    def publish(self, data):
+        """投递接收数据（界面线程调用），没有客户端时直接返回"""
+        if self.client_count and self.thread is not None:
+            self.loop.call_soon_threadsafe(self._fan_out, bytes(data))
+
+    def _fan_out(self, data):
+        for client in list(self.clients.values()):
+            try:
+                client.queue.put_nowait(data)
+            except asyncio.QueueFull:
+                if self.policy == 'disconnect':
+                    print(f"客户端 {client.address} 接收过慢，已断开")
+                    # 正常关闭要等发送缓冲写完，慢客户端需直接中止连接
+                    self.clients.pop(id(client), None)
+                    client.writer.transport.abort()
+                else:
+                    client.dropped += len(data)
+
+    async def handle_client(self, reader, writer):
+        address = writer.get_extra_info('peername')
+        client = _Client(address, writer, self.queue_size)
+        self.clients[id(client)] = client
+        self.client_count = len(self.clients)
+        self.clients_changed.emit(self.client_count)
+        sender = asyncio.ensure_future(self._send_loop(client))
+        handler = asyncio.current_task()
+        self.handlers.add(handler)
+        self.senders.add(sender)
+        sender.add_done_callback(self.senders.discard)
+        try:
+            while True:
+                data = await reader.read(self.READ_SIZE)
+                if not data:
+                    break
+                self.data_from_client.emit(data)
+        except (ConnectionError, OSError):
+            pass
+        finally:
+            self.handlers.discard(handler)
+            sender.cancel()
+            writer.close()
+            self.clients.pop(id(client), None)
+            self.client_count = len(self.clients)
+            self.clients_changed.emit(self.client_count)
+
+    async def _send_loop(self, client):
+        try:
+            while True:
+                data = await client.queue.get()
+                client.writer.write(data)
+                await client.writer.drain()
+                client.sent += len(data)
+        except (ConnectionError, OSError):
+            client.writer.close()
+
+    def client_stats(self):
+        """各客户端 (地址, 已发送字节, 丢弃字节, 排队块数)"""
+        return [(client.address, client.sent, client.dropped, client.queue.qsize())
+                for client in list(self.clients.values())]
@@ -0,0 +1,111 @@
+# telemetry_store.py
+# -*- coding: utf-8 -*-
+import glob
+import json
+import os
+import time
+
+import numpy as np
+
+# 目录结构：
+#   meta.json              字段列表
+#   t_ns_000000.npy        时间戳列（墙上时间 ns，int64）
+#   <字段>_000000.npy      各字段列（float64，本行没有该字段时为 NaN）
+# 每批写出一组段文件，各列行数相同，按段号顺序拼接即为完整数据。
+TIME_COLUMN = "t_ns"
+
+
+class TelemetryStore:
+    """遥测数据列式存储：按批写出 .npy 段文件"""
+
+    BATCH_ROWS = 4096  # 每段行数
+    MAX_BATCH_AGE = 10  # 秒，数据稀疏时缓冲超过此时长也写出
+
+    def __init__(self, directory, fields, batch_rows=BATCH_ROWS):
+        self.directory = directory
+        self.fields = tuple(fields)
+        self.batch_rows = batch_rows
+        self.wall_offset_ns = time.time_ns() - time.monotonic_ns()
+        self.segment = 0
+        self.rows_written = 0
+
+        self._times = np.empty(batch_rows, dtype=np.int64)
+        self._columns = {field: np.full(batch_rows, np.nan) for field in self.fields}
+        self._count = 0
+
+        os.makedirs(directory, exist_ok=True)
+        with open(os.path.join(directory, "meta.json"), 'w', encoding='utf-8') as f:
+            json.dump({"fields": list(self.fields), "time_column": TIME_COLUMN}, f, ensure_ascii=False, indent=2)
+
+    def append_row(self, t_ns, values):
+        """追加一行（t_ns 为读取时的 monotonic_ns，values 为 {字段: 数值}）"""
+        row = self._count
+        t_ns += self.wall_offset_ns
+        self._times[row] = t_ns
+        for field, value in values.items():
+            self._columns[field][row] = value
+        self._count = row + 1
+        if self._count >= self.batch_rows or t_ns - self._times[0] > self.MAX_BATCH_AGE * 1_000_000_000:
+            self.flush()
+
+    def flush(self):
+        """写出当前批"""
+        count = self._count
+        if not count:
+            return
+        suffix = f"_{self.segment:06d}.npy"
+        np.save(os.path.join(self.directory, TIME_COLUMN + suffix), self._times[:count])
+        for field, column in self._columns.items():
+            np.save(os.path.join(self.directory, field + suffix), column[:count])
+            column.fill(np.nan)
+        self.segment += 1
+        self.rows_written += count
+        self._count = 0
+
+    def close(self):
+        self.flush()
+
+
+class TelemetryReader:
+    """读取遥测存储目录"""
+
+    def __init__(self, directory):
+        self.directory = directory
+        with open(os.path.join(directory, "meta.json"), 'r', encoding='utf-8') as f:
+            self.fields = tuple(json.load(f)["fields"])
+        pattern = os.path.join(directory, f"{TIME_COLUMN}_*.npy")
+        self.segments = sorted(os.path.basename(path)[len(TIME_COLUMN) + 1:-4] for path in glob.glob(pattern))
+
+    def load_segment(self, segment, fields=None):
+        """读取一段：{列名: 数组}"""
+        columns = (TIME_COLUMN,) + tuple(fields or self.fields)
+        return {name: np.load(os.path.join(self.directory, f"{name}_{segment}.npy")) for name in columns}
+
+    def chunks(self, fields=None):
+        """逐段读取"""
+        for segment in self.segments:
+            yield self.load_segment(segment, fields)
+
+    def load(self, fields=None):
+        """读取全部数据并拼接"""
+        columns = (TIME_COLUMN,) + tuple(fields or self.fields)
+        parts = {name: [] for name in columns}
+        for chunk in self.chunks(fields):
+            for name in columns:
+                parts[name].append(chunk[name])
+        return {name: np.concatenate(arrays) if arrays else np.empty(0) for name, arrays in parts.items()}
+
+    def export_csv(self, path, fields=None):
+        """逐段导出 CSV，内存占用只有一段；返回导出行数"""
+        fields = tuple(fields or self.fields)
+        dtype = [(TIME_COLUMN, np.int64)] + [(field, np.float64) for field in fields]
+        rows = 0
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            f.write(','.join((TIME_COLUMN,) + fields) + '\n')
+            for chunk in self.chunks(fields):
+                table = np.empty(len(chunk[TIME_COLUMN]), dtype=dtype)
+                for name in table.dtype.names:
+                    table[name] = chunk[name]
+                np.savetxt(f, table, fmt=['%d'] + ['%.9g'] * len(fields), delimiter=',')
+                rows += len(table)
+        return rows
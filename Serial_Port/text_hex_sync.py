@@ -0,0 +1,127 @@
+# text_hex_sync.py
+# -*- coding: utf-8 -*-
+from PyQt5.QtCore import QObject, QTimer
+
+
+class TextHexSync(QObject):
+    """字符串 -> 十六进制的增量同步（“下同步上”模式）
+
+    记录字符串文本框中被改动的行，防抖后只重新编码这些行，并替换十六进制框中对应的行。
+    每个文本行（含行尾换行）对应十六进制框中的若干行，line_rows 记录这个对应关系。
+    """
+
+    DEBOUNCE_INTERVAL = 150  # 毫秒
+
+    def __init__(self, text_edit, hex_input, source_text):
+        super().__init__(text_edit)
+        self.edit = text_edit
+        self.document = text_edit.document()
+        self.hex_input = hex_input
+        # 回调：返回当前实际文本（失去焦点时文本框显示的是 [\n] 格式）
+        self.source_text = source_text
+
+        self.enabled = False
+        self.suspended = False
+        self.line_rows = []
+        self._block_count = self.document.blockCount()
+        self._dirty = None  # (首行, 末行) 当前行号
+        self._full_resync = False
+
+        self.debounce_timer = QTimer(self)
+        self.debounce_timer.setSingleShot(True)
+        self.debounce_timer.timeout.connect(self.flush)
+        self.document.contentsChange.connect(self.on_contents_change)
+
+    def set_enabled(self, enabled):
+        """开启/关闭同步，开启时做一次全量同步"""
+        self.enabled = enabled
+        self.debounce_timer.stop()
+        self._dirty = None
+        if enabled:
+            self.full_sync()
+
+    def suspend(self, suspended):
+        """暂停跟踪（程序切换显示格式时使用）"""
+        self.suspended = suspended
+        if not suspended:
+            self._block_count = self.document.blockCount()
+
+    def on_contents_change(self, position, chars_removed, chars_added):
+        """记录改动的行范围并启动防抖"""
+        if self.suspended:
+            return
+        new_count = self.document.blockCount()
+        delta = new_count - self._block_count
+        self._block_count = new_count
+        if not self.enabled:
+            return
+
+        if not self.edit.hasFocus():
+            # 显示模式下的改动（如清空），行号与实际文本不对应，全量重建
+            self._full_resync = True
+        else:
+            first = self.document.findBlock(position).blockNumber()
+            last_block = self.document.findBlock(position + chars_added)
+            last = last_block.blockNumber() if last_block.isValid() else new_count - 1
+            first = max(first, 0)
+            if self._dirty is None:
+                self._dirty = [first, last, delta]
+            else:
+                dirty_first, dirty_last, total_delta = self._dirty
+                if dirty_last > first:
+                    dirty_last = max(dirty_last + delta, first)
+                self._dirty = [min(dirty_first, first), max(dirty_last, last), total_delta + delta]
+
+        self.debounce_timer.start(self.DEBOUNCE_INTERVAL)
+
+    def encode_lines(self, lines, ends_document):
+        """编码若干行，返回 (每行对应的十六进制行数, 十六进制行)"""
+        step = self.hex_input.ROW_BYTES * 2
+        counts = []
+        rows = []
+        last_index = len(lines) - 1
+        for index, line in enumerate(lines):
+            if index < last_index or not ends_document:
+                line += '\n'
+            digits = line.encode('utf-8').hex()
+            line_rows = [digits[i:i + step] for i in range(0, len(digits), step)]
+            counts.append(len(line_rows))
+            rows.extend(line_rows)
+        return counts, rows
+
+    def full_sync(self):
+        """全量同步"""
+        self.debounce_timer.stop()
+        self._dirty = None
+        self._full_resync = False
+        lines = self.source_text().split('\n')
+        self.line_rows, rows = self.encode_lines(lines, True)
+        self.hex_input.set_rows(rows)
+
+    def flush(self):
+        """把积累的改动同步到十六进制框"""
+        self.debounce_timer.stop()
+        if not self.enabled:
+            return
+        if self._full_resync:
+            self.full_sync()
+            return
+        if self._dirty is None:
+            return
+
+        first, last, total_delta = self._dirty
+        self._dirty = None
+        old_last = last - total_delta
+        line_count = self.document.blockCount()
+
+        lines = []
+        block = self.document.findBlockByNumber(first)
+        for _ in range(first, last + 1):
+            lines.append(block.text())
+            block = block.next()
+
+        counts, rows = self.encode_lines(lines, last == line_count - 1)
+        start_row = sum(self.line_rows[:first])
+        old_row_count = sum(self.line_rows[first:old_last + 1])
+        self.line_rows[first:old_last + 1] = counts
+        self.hex_input.replace_rows(start_row, old_row_count, rows)
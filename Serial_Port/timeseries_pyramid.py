@@ -0,0 +1,134 @@
+# timeseries_pyramid.py
+# -*- coding: utf-8 -*-
+import numpy as np
+
+
+class _Column:
+    """按倍数扩容的 numpy 列，追加为 O(1) 摊还"""
+
+    def __init__(self, dtype=np.float64, capacity=1024):
+        self.data = np.empty(capacity, dtype=dtype)
+        self.size = 0
+
+    def append(self, value):
+        if self.size == len(self.data):
+            grown = np.empty(len(self.data) * 2, dtype=self.data.dtype)
+            grown[:self.size] = self.data
+            self.data = grown
+        self.data[self.size] = value
+        self.size += 1
+
+    def view(self):
+        return self.data[:self.size]
+
+    def clear(self):
+        self.size = 0
+
+
+class TimeSeriesPyramid:
+    """多分辨率时间序列
+
+    第 0 层保存全部原始采样；第 k 层每个点由第 k-1 层的 FACTOR 个点合并，
+    记录起始时间、最小值、最大值、累加和与采样数（均值 = 和 / 数）。
+    新采样到来时逐层增量合并，查询时选择在可见范围内点数仍不少于屏幕像素的最粗一层，
+    因此无论缩放到 10 ms 还是 8 小时，每次重绘的点数都在同一量级。
+    """
+
+    FACTOR = 4
+    MAX_LEVELS = 12
+
+    def __init__(self):
+        self.times = _Column()
+        self.values = _Column()
+        # 聚合层：[时间, 最小, 最大, 累加和, 采样数]
+        self.levels = [[_Column() for _ in range(5)] for _ in range(self.MAX_LEVELS)]
+        # 各聚合层正在合并的点：[起始时间, 最小, 最大, 累加和, 采样数, 已合并点数]
+        self.pending = [None] * self.MAX_LEVELS
+
+    def __len__(self):
+        return self.times.size
+
+    def clear(self):
+        self.times.clear()
+        self.values.clear()
+        for columns in self.levels:
+            for column in columns:
+                column.clear()
+        self.pending = [None] * self.MAX_LEVELS
+
+    def append(self, t, value):
+        """追加一个采样（时间单调递增）"""
+        self.times.append(t)
+        self.values.append(value)
+        self._merge(0, t, value, value, value, 1)
+
+    def _merge(self, level, t, v_min, v_max, v_sum, count):
+        """把下一层的一个点并入第 level 层的待合并点，凑满 FACTOR 个时写入该层并继续向上"""
+        while level < self.MAX_LEVELS:
+            pending = self.pending[level]
+            if pending is None:
+                self.pending[level] = [t, v_min, v_max, v_sum, count, 1]
+                return
+            if v_min < pending[1]:
+                pending[1] = v_min
+            if v_max > pending[2]:
+                pending[2] = v_max
+            pending[3] += v_sum
+            pending[4] += count
+            pending[5] += 1
+            if pending[5] < self.FACTOR:
+                return
+            self.pending[level] = None
+            t, v_min, v_max, v_sum, count = pending[:5]
+            for column, value in zip(self.levels[level], pending):
+                column.append(value)
+            level += 1
+
+    def _tail(self, level):
+        """还未凑满的尾部数据合并为一个点（第 0 层到 level 层的待合并点）"""
+        parts = [p for p in self.pending[:level + 1] if p is not None]
+        if not parts:
+            return None
+        return (min(p[0] for p in parts), min(p[1] for p in parts), max(p[2] for p in parts),
+                sum(p[3] for p in parts), sum(p[4] for p in parts))
+
+    def query(self, t0, t1, pixels):
+        """查询 [t0, t1] 内的数据
+
+        返回 (层号, 时间, 最小, 最大, 均值)；第 0 层时最小、最大、均值都是原始值。
+        """
+        for level in range(self.MAX_LEVELS - 1, -1, -1):
+            columns = self.levels[level]
+            times = columns[0].view()
+            if len(times) < pixels:
+                continue
+            start = max(np.searchsorted(times, t0, 'right') - 1, 0)
+            end = np.searchsorted(times, t1, 'right') + 1
+            if end - start < pixels:
+                continue
+            t = times[start:end]
+            v_min = columns[1].view()[start:end]
+            v_max = columns[2].view()[start:end]
+            mean = columns[3].view()[start:end] / columns[4].view()[start:end]
+            tail = self._tail(level) if end > len(times) else None
+            if tail is not None:
+                t = np.append(t, tail[0])
+                v_min = np.append(v_min, tail[1])
+                v_max = np.append(v_max, tail[2])
+                mean = np.append(mean, tail[3] / tail[4])
+            return level + 1, t, v_min, v_max, mean
+
+        times = self.times.view()
+        start = max(np.searchsorted(times, t0, 'right') - 1, 0)
+        end = np.searchsorted(times, t1, 'right') + 1
+        values = self.values.view()[start:end]
+        return 0, times[start:end], values, values, values
+
+
+def envelope(t, v_min, v_max):
+    """聚合层的最小/最大值交替排列，连线后即为包络"""
+    x = np.repeat(t, 2)
+    y = np.empty(len(x))
+    y[0::2] = v_min
+    y[1::2] = v_max
+    return x, y
@@ -0,0 +1,255 @@
+# transports.py
+# -*- coding: utf-8 -*-
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal, QIODevice
+from PyQt5.QtNetwork import QAbstractSocket, QLocalSocket, QTcpSocket
+from PyQt5.QtSerialPort import QSerialPort
+
+# 端口名前缀
+TCP_PREFIX = "tcp://"
+UNIX_PREFIX = "unix://"
+
+
+def parse_target(text):
+    """解析端口名：tcp://host:port 或 host:port 为 TCP，unix://path 为 Unix 域套接字，其余为本地串口
+
+    返回 ('serial', 端口名) / ('tcp', 主机, 端口) / ('unix', 路径)
+    """
+    text = text.strip()
+    if text.startswith(UNIX_PREFIX):
+        return 'unix', text[len(UNIX_PREFIX):]
+    address = text[len(TCP_PREFIX):] if text.startswith(TCP_PREFIX) else text
+    host, sep, port = address.rpartition(':')
+    if sep and host and port.isdigit() and not host.startswith('/'):
+        return 'tcp', host.strip('[]'), int(port)
+    if text.startswith(TCP_PREFIX):
+        raise ValueError(f"无效的 TCP 地址: {text}")
+    return 'serial', text
+
+
+def is_network_target(text):
+    """端口名是否指向网络端点"""
+    try:
+        return parse_target(text)[0] != 'serial'
+    except ValueError:
+        return True
+
+
+class Transport(QObject):
+    """传输层基类
+
+    内部都是 QIODevice：读写由 Qt 事件循环驱动，不阻塞；每次 readyRead 读出全部可用数据，
+    写入进入设备的发送缓冲后成批发出。SerialProcess 只通过这里的接口访问设备。
+    """
+
+    ready_read = pyqtSignal()
+    error_occurred = pyqtSignal(str)
+    # 异步打开（网络连接）完成 / 失败（附原因）
+    opened = pyqtSignal()
+    open_failed = pyqtSignal(str)
+    # 连接意外断开（设备拔出、对端关闭）
+    connection_lost = pyqtSignal()
+
+    # 读缓冲被填满时驱动侧是否可能丢数据（串口没有端到端的流量控制）
+    FULL_BUFFER_MAY_OVERRUN = False
+
+    def __init__(self, device):
+        super().__init__()
+        self.device = device
+        device.readyRead.connect(self.ready_read)
+
+    def open(self):
+        """开始打开：立即失败返回 False；串口同步打开，返回后 is_open() 为真；
+        网络连接在后台进行，结果由 opened / open_failed 信号通知"""
+        raise NotImplementedError
+
+    def close(self):
+        self.device.close()
+
+    def is_open(self):
+        return self.device.isOpen()
+
+    def read_all(self):
+        return self.device.readAll()
+
+    def write(self, data):
+        return self.device.write(data)
+
+    def flush(self):
+        """尽量把发送缓冲写出（不等待）"""
+
+    def bytes_available(self):
+        return self.device.bytesAvailable()
+
+    def set_read_buffer_size(self, size):
+        self.device.setReadBufferSize(size)
+
+    def set_flow_control(self, rts, dtr):
+        """只有串口支持 RTS/DTR"""
+
+    def error_string(self):
+        return self.device.errorString()
+
+    def description(self):
+        return ""
+
+
+class SerialTransport(Transport):
+    """本地串口（QSerialPort）"""
+
+    FULL_BUFFER_MAY_OVERRUN = True
+
+    FATAL_ERRORS = (
+        QSerialPort.SerialPortError.ResourceError,
+        QSerialPort.SerialPortError.PermissionError,
+        QSerialPort.SerialPortError.OpenError,
+    )
+
+    ERROR_TEXTS = {
+        QSerialPort.SerialPortError.ResourceError: "资源错误，串口可能被拔出",
+        QSerialPort.SerialPortError.PermissionError: "权限错误，无法访问串口",
+        QSerialPort.SerialPortError.OpenError: "打开串口错误",
+        QSerialPort.SerialPortError.WriteError: "写入串口错误",
+        QSerialPort.SerialPortError.ReadError: "读取串口错误",
+        QSerialPort.SerialPortError.UnknownError: "未知串口错误",
+    }
+
+    def __init__(self, port_name, baud_rate, data_bits, parity, stop_bits, flow_control):
+        super().__init__(QSerialPort())
+        self.port_name = port_name
+        serial = self.device
+        serial.setPortName(port_name)
+        serial.setBaudRate(baud_rate)
+        serial.setDataBits(data_bits)
+        serial.setParity(parity)
+        serial.setStopBits(stop_bits)
+        serial.setFlowControl(flow_control)
+        serial.errorOccurred.connect(self.on_error)
+
+    def open(self):
+        return self.device.open(QIODevice.ReadWrite)
+
+    def flush(self):
+        self.device.flush()
+
+    def set_flow_control(self, rts, dtr):
+        if self.device.isOpen():
+            self.device.setRequestToSend(rts)
+            self.device.setDataTerminalReady(dtr)
+
+    def description(self):
+        return self.port_name
+
+    def on_error(self, error):
+        """处理串口错误"""
+        # 忽略 NoError 情况
+        if error == QSerialPort.SerialPortError.NoError:
+            return
+        self.error_occurred.emit(self.ERROR_TEXTS.get(error, f"串口错误: {self.device.errorString()}"))
+        # 如果串口打开时发生严重错误，关闭串口
+        if self.device.isOpen() and error in self.FATAL_ERRORS:
+            self.connection_lost.emit()
+
+
+class _SocketTransport(Transport):
+    """套接字传输的公共部分：不阻塞的连接（带超时）、对端断开"""
+
+    CONNECT_TIMEOUT = 3000  # 毫秒
+
+    def __init__(self, device):
+        super().__init__(device)
+        self.connected = False
+        self.connect_timer = QTimer(self)
+        self.connect_timer.setSingleShot(True)
+        self.connect_timer.timeout.connect(self.on_connect_timeout)
+        device.connected.connect(self.on_connected)
+        device.errorOccurred.connect(self.on_socket_error)
+        device.disconnected.connect(self.on_disconnected)
+
+    def open(self):
+        self.connect_timer.start(self.CONNECT_TIMEOUT)
+        self.start_connect()
+        return True
+
+    def start_connect(self):
+        raise NotImplementedError
+
+    def on_connected(self):
+        self.connect_timer.stop()
+        self.connected = True
+        self.opened.emit()
+
+    def on_socket_error(self, error):
+        """连接阶段的错误即打开失败；连接后的错误由 disconnected 处理"""
+        if self.connect_timer.isActive():
+            self.connect_timer.stop()
+            message = self.device.errorString()
+            self.device.abort()
+            self.open_failed.emit(message)
+
+    def on_connect_timeout(self):
+        self.device.abort()
+        self.open_failed.emit(f"连接超时（{self.CONNECT_TIMEOUT} ms）")
+
+    def on_disconnected(self):
+        if self.connected:
+            self.connected = False
+            self.error_occurred.emit(f"连接已断开: {self.description()}")
+            self.connection_lost.emit()
+
+    def close(self):
+        self.connect_timer.stop()
+        self.connected = False
+        self.device.abort()
+
+    def is_open(self):
+        return self.connected
+
+
+class TcpTransport(_SocketTransport):
+    """TCP 连接（串口服务器等网络端点）"""
+
+    def __init__(self, host, port):
+        super().__init__(QTcpSocket())
+        self.host = host
+        self.port = port
+
+    def start_connect(self):
+        self.device.connectToHost(self.host, self.port)
+
+    def on_connected(self):
+        # 小包立即发出，避免 Nagle 算法带来的延迟
+        self.device.setSocketOption(QAbstractSocket.LowDelayOption, 1)
+        super().on_connected()
+
+    def flush(self):
+        self.device.flush()
+
+    def description(self):
+        return f"{TCP_PREFIX}{self.host}:{self.port}"
+
+
+class UnixTransport(_SocketTransport):
+    """Unix 域套接字（Windows 上为命名管道）"""
+
+    def __init__(self, path):
+        super().__init__(QLocalSocket())
+        self.path = path
+
+    def start_connect(self):
+        self.device.connectToServer(self.path)
+
+    def flush(self):
+        self.device.flush()
+
+    def description(self):
+        return f"{UNIX_PREFIX}{self.path}"
+
+
+def create_transport(port_name, baud_rate, data_bits, parity, stop_bits, flow_control):
+    """按端口名创建传输层，网络端点忽略串口参数"""
+    target = parse_target(port_name)
+    if target[0] == 'tcp':
+        return TcpTransport(target[1], target[2])
+    if target[0] == 'unix':
+        return UnixTransport(target[1])
+    return SerialTransport(target[1], baud_rate, data_bits, parity, stop_bits, flow_control)
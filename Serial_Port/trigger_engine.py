@@ -0,0 +1,207 @@
+# trigger_engine.py
+# -*- coding: utf-8 -*-
+import time
+from collections import deque
+
+from PyQt5.QtCore import QObject, pyqtSignal
+
+from Serial_Port.latency_histogram import LatencyHistogram
+
+
+class MultiPatternMatcher:
+    """多模式流式匹配器（Aho-Corasick）
+
+    所有模式编译成一张完整的状态转移表，每个数据块只扫描一遍，
+    与模式数量无关；匹配状态在数据块之间保留，可以匹配跨块的模式。
+    """
+
+    def __init__(self, patterns):
+        self.patterns = [bytes(p) for p in patterns]
+        self.state = 0
+        self._build()
+
+    def _build(self):
+        """构建字典树、失败指针和转移表"""
+        goto = [{}]
+        outputs = [[]]
+        for pattern_id, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            node = 0
+            for byte in pattern:
+                nxt = goto[node].get(byte)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[node][byte] = nxt
+                    goto.append({})
+                    outputs.append([])
+                node = nxt
+            outputs[node].append(pattern_id)
+
+        # 广度优先计算失败指针，同时生成完整转移表
+        # 转移表按 状态*256+字节 展平，状态号预先乘以256，热循环只需一次下标
+        delta = [0] * (len(goto) * 256)
+        fail = [0] * len(goto)
+        queue = deque()
+        for byte in range(256):
+            nxt = goto[0].get(byte, 0)
+            delta[byte] = nxt << 8
+            if nxt:
+                queue.append(nxt)
+
+        while queue:
+            node = queue.popleft()
+            outputs[node] = outputs[node] + outputs[fail[node]]
+            base = node << 8
+            fail_base = fail[node] << 8
+            for byte in range(256):
+                nxt = goto[node].get(byte)
+                if nxt is None:
+                    delta[base + byte] = delta[fail_base + byte]
+                else:
+                    fail[nxt] = delta[fail_base + byte] >> 8
+                    delta[base + byte] = nxt << 8
+                    queue.append(nxt)
+
+        self._delta = delta
+        self._outputs = {node << 8: ids for node, ids in enumerate(outputs) if ids}
+
+    def reset(self):
+        """重置匹配状态（例如清空接收区或重新打开串口时）"""
+        self.state = 0
+
+    def feed(self, data):
+        """扫描一个数据块，返回 [(模式序号, 匹配结束位置), ...]"""
+        if not self._outputs:
+            return []
+
+        delta = self._delta
+        outputs = self._outputs
+        state = self.state
+        matches = []
+        for pos, byte in enumerate(data):
+            state = delta[state + byte]
+            if state in outputs:
+                for pattern_id in outputs[state]:
+                    matches.append((pattern_id, pos))
+        self.state = state
+        return matches
+
+
+class Trigger:
+    """单个触发器配置"""
+
+    ACTIONS = ('highlight', 'counter', 'pause', 'reply')
+
+    def __init__(self, config):
+        self.name = config.get("name", "")
+        self.pattern = self.parse_bytes(config.get("pattern", ""), config.get("is_hex", False))
+        self.actions = [a for a in config.get("actions", ["highlight"]) if a in self.ACTIONS]
+        self.reply = self.parse_bytes(config.get("reply", ""), config.get("reply_hex", False))
+        self.enabled = config.get("enabled", True)
+        self.count = 0
+
+        if not self.name:
+            self.name = self.pattern.decode('utf-8', errors='replace')
+
+    @staticmethod
+    def parse_bytes(text, is_hex):
+        """将配置中的文本或十六进制串转换为字节"""
+        if not text:
+            return b""
+        if is_hex:
+            return bytes.fromhex(text.replace(' ', ''))
+        return text.encode('utf-8')
+
+
+class TriggerEngine(QObject):
+    """接收流触发器引擎
+
+    挂在 SerialProcess.data_received 信号上，每个数据块由一个多模式匹配器扫描一次，
+    命中后执行动作（高亮、计数、暂停接收、自动回复），并统计命中到动作完成的延迟。
+    """
+
+    # 触发器命中信号：触发器名称、命中到动作完成的延迟（纳秒）
+    triggered = pyqtSignal(str, int)
+    # 请求界面高亮当前数据块
+    highlight_requested = pyqtSignal(str)
+    # 请求暂停接收（由界面同步按钮状态）
+    pause_requested = pyqtSignal(str)
+    # 计数器更新：触发器名称、累计次数
+    counter_changed = pyqtSignal(str, int)
+
+    def __init__(self, serial_process, trigger_configs=None):
+        super().__init__()
+        self.serial_process = serial_process
+        self.triggers = []
+        self.matcher = MultiPatternMatcher([])
+        self.latency = LatencyHistogram()
+        self.enabled = True
+
+        self.load_triggers(trigger_configs or [])
+        self.serial_process.data_received.connect(self.on_data_received)
+        self.serial_process.port_opened.connect(self.reset_state)
+
+    def load_triggers(self, trigger_configs):
+        """从配置加载触发器并重新编译匹配器"""
+        triggers = []
+        for config in trigger_configs:
+            try:
+                trigger = Trigger(config)
+            except ValueError as e:
+                print(f"触发器配置错误: {config.get('name', '')} {e}")
+                continue
+            if trigger.enabled and trigger.pattern:
+                triggers.append(trigger)
+
+        self.triggers = triggers
+        self.matcher = MultiPatternMatcher([t.pattern for t in triggers])
+
+    def reset_state(self):
+        """重置跨块匹配状态"""
+        self.matcher.reset()
+
+    def on_data_received(self, data):
+        """扫描接收到的数据块"""
+        if not self.enabled or not self.triggers:
+            return
+
+        matches = self.matcher.feed(data.data())
+        if not matches:
+            return
+
+        # 整块扫描完成即为命中时刻，同一块内后续动作的排队时间也计入延迟
+        match_ns = time.perf_counter_ns()
+        for pattern_id, _ in matches:
+            trigger = self.triggers[pattern_id]
+            self.fire(trigger)
+            latency_ns = time.perf_counter_ns() - match_ns
+            self.latency.record(latency_ns)
+            self.triggered.emit(trigger.name, latency_ns)
+
+    def fire(self, trigger):
+        """执行触发器动作"""
+        trigger.count += 1
+        for action in trigger.actions:
+            if action == 'highlight':
+                self.highlight_requested.emit(trigger.name)
+            elif action == 'counter':
+                self.counter_changed.emit(trigger.name, trigger.count)
+            elif action == 'pause':
+                self.serial_process.pause_receive(True)
+                self.pause_requested.emit(trigger.name)
+            elif action == 'reply' and trigger.reply:
+                self.serial_process.send_bytes(trigger.reply)
+
+    def get_stats(self):
+        """获取各触发器命中次数和延迟统计"""
+        return {
+            'triggers': {t.name: t.count for t in self.triggers},
+            'latency_ns': self.latency.to_dict()
+        }
+
+    def reset_stats(self):
+        """重置统计信息"""
+        for trigger in self.triggers:
+            trigger.count = 0
+        self.latency.reset()
@@ -1,4 +1,7 @@
 # -*- coding: utf-8 -*-
+# 启动计时最先导入
+from Serial_Port.startup_timing import StartupTimer
+
 import sys
 import os
 from PyQt5.QtWidgets import QApplication, QStackedWidget
@@ -9,6 +12,10 @@ from Serial_Port.app_SerialWindows import SerialAppClass
 
 class WindowManagerClass:
     def __init__(self):
+        # 启动耗时统计
+        self.startup_timer = StartupTimer()
+        self.startup_timer.mark("imports")
+
         self.app = QApplication(sys.argv)
         self.app.setStyle("Fusion")
 
@@ -17,6 +24,7 @@ class WindowManagerClass:
 
         # 创建窗口
         self.serial_port_window = SerialAppClass(self)
+        self.startup_timer.mark("window_created")
 
         # 添加到堆栈
         self.stacked_widget.addWidget(self.serial_port_window)
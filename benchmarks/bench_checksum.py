@@ -0,0 +1,44 @@
+# bench_checksum.py
+# -*- coding: utf-8 -*-
+"""校验算法吞吐量测试
+
+用法：python benchmarks/bench_checksum.py [MB]
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from Serial_Port.checksum import ALGORITHM_TITLES, compute
+
+TARGET_MB_S = 50  # CRC-16 目标吞吐量
+
+
+def bench(name, data, repeat=3):
+    """多次计算取最快一次，返回 MB/s"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        compute(name, data)
+        best = min(best, time.perf_counter() - start)
+    return len(data) / best / 1e6
+
+
+def main():
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    data = os.urandom(size_mb * 1024 * 1024)
+    print(f"数据大小: {size_mb} MB")
+    failed = False
+    for name, title in ALGORITHM_TITLES:
+        rate = bench(name, data)
+        mark = ""
+        if name.startswith("crc16") and rate < TARGET_MB_S:
+            mark = f"  低于目标 {TARGET_MB_S} MB/s"
+            failed = True
+        print(f"{title:<16}{rate:10.1f} MB/s{mark}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,26 @@
+# conftest.py
+# -*- coding: utf-8 -*-
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """无界面的 Qt 应用，供 QObject/定时器/套接字使用"""
+    from PyQt5.QtCore import QCoreApplication
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def wait_until(app, condition, timeout=2.0):
+    """处理 Qt 事件直到条件成立或超时，返回条件最后的结果"""
+    import time
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        app.processEvents()
+        time.sleep(0.001)
+    return True
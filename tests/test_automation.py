@@ -0,0 +1,152 @@
+# test_automation.py
+# -*- coding: utf-8 -*-
+import asyncio
+import gc
+import re
+
+import pytest
+
+from Serial_Port.automation import AsyncPort
+from Serial_Port.framing import cobs_encode
+
+
+async def device(reader, writer):
+    """本地 TCP 替身设备：连接后先发欢迎信息，PING 应答 PONG，CLOSE 断开，其余原样回显"""
+    writer.write(b"BANNER v1.0\r\n")
+    while data := await reader.read(4096):
+        if data.startswith(b"CLOSE"):
+            break
+        writer.write(data.replace(b"PING", b"PONG"))
+    writer.close()
+
+
+def run_with_device(scenario):
+    async def main():
+        server = await asyncio.start_server(device, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        try:
+            async with AsyncPort() as automation_port:
+                await scenario(automation_port, f"127.0.0.1:{port}")
+        finally:
+            server.close()
+            await server.wait_closed()
+    asyncio.run(main())
+
+
+def test_banner_on_connect_is_kept(qapp):
+    async def scenario(port, target):
+        await port.open(target)
+        result = await port.expect(b"BANNER", timeout=2)
+        assert result.before == b""
+
+    for _ in range(5):
+        run_with_device(scenario)
+
+
+def test_write_and_expect(qapp):
+    async def scenario(port, target):
+        await port.open(target)
+        await port.expect(b"\r\n", timeout=2)
+        await port.write(b"hello PING 42\n")
+        result = await port.expect(b"PONG", timeout=2)
+        assert result.before == b"hello "
+        result = await port.expect(re.compile(rb"(\d+)\n"), timeout=2)
+        assert result.groups == (b"42",)
+
+        # 模式跨越多次读取
+        for part in (b"ab", b"cdE", b"Fgh\n"):
+            await port.write(part)
+            await asyncio.sleep(0.01)
+        assert (await port.expect(b"cdEF", timeout=2)).before == b"ab"
+
+    run_with_device(scenario)
+
+
+def test_request_response_loop(qapp):
+    async def scenario(port, target):
+        await port.open(target)
+        await port.expect(b"\r\n", timeout=2)
+        for i in range(500):
+            await port.write(b"PING %d\n" % i)
+            await port.expect(b"PONG %d\n" % i, timeout=2)
+
+    run_with_device(scenario)
+
+
+def test_line_frames(qapp):
+    async def scenario(port, target):
+        await port.open(target)
+        await port.write(b"one\ntwo\nthree\n")
+        frames = []
+        async for frame in port.frames(timeout=2):
+            frames.append(frame)
+            if len(frames) == 4:
+                break
+        assert frames == [b"BANNER v1.0\r", b"one", b"two", b"three"]
+
+    run_with_device(scenario)
+
+
+def test_cobs_frames(qapp):
+    async def scenario(port, target):
+        await port.open(target)
+        await port.expect(b"\r\n", timeout=2)
+        payloads = [b"\x00\x01\x00abc", b"", b"\xff" * 300]
+        await port.write(b"".join(cobs_encode(p) + b"\x00" for p in payloads))
+        frames = []
+        async for frame in port.frames(framing='cobs', timeout=2):
+            frames.append(frame)
+            if len(frames) == len(payloads):
+                break
+        assert frames == payloads
+
+    run_with_device(scenario)
+
+
+def test_timeout_and_peer_close(qapp):
+    async def scenario(port, target):
+        await port.open(target)
+        with pytest.raises(TimeoutError):
+            await port.expect(b"NEVER", timeout=0.1)
+        await port.write(b"CLOSE")
+        with pytest.raises(ConnectionError):
+            await port.expect(b"NEVER", timeout=2)
+        assert not port.is_open
+
+    run_with_device(scenario)
+
+
+def test_open_refused(qapp):
+    async def scenario():
+        server = await asyncio.start_server(device, "127.0.0.1", 0)
+        port_no = server.sockets[0].getsockname()[1]
+        server.close()
+        await server.wait_closed()
+        async with AsyncPort() as port:
+            with pytest.raises(ConnectionError):
+                await port.open(f"127.0.0.1:{port_no}")
+
+    asyncio.run(scenario())
+
+
+
+def test_open_missing_serial_device_leaves_no_pending_error(qapp):
+    async def scenario():
+        loop = asyncio.get_running_loop()
+        reported = []
+        loop.set_exception_handler(lambda loop, context: reported.append(context))
+        created = []
+        create_future = loop.create_future
+        loop.create_future = lambda: created.append(create_future()) or created[-1]
+
+        async with AsyncPort() as port:
+            with pytest.raises(ConnectionError):
+                await port.open("/dev/ttyNOPE")
+            assert port._opened is None
+            # 未取回的异常在 future 被回收时报告
+            created.clear()
+            gc.collect()
+            await asyncio.sleep(0)
+            assert reported == []
+
+    asyncio.run(scenario())
@@ -0,0 +1,64 @@
+# test_capture_archive.py
+# -*- coding: utf-8 -*-
+import threading
+
+from conftest import wait_until
+from Serial_Port.capture_archive import CaptureReader, CaptureWriter
+
+
+def test_round_trip(qapp, tmp_path):
+    path = tmp_path / "capture.pmcap"
+    writer = CaptureWriter(str(path), 'lzma')
+    writer.BLOCK_BYTES = 64
+    chunks = [bytes([i]) * (i * 7 % 50 + 1) for i in range(40)]
+    for i, chunk in enumerate(chunks):
+        writer.write(chunk, i * 1000)
+    writer.close()
+    assert writer.wait(10)
+    with CaptureReader(str(path)) as reader:
+        assert len(reader.blocks) > 1
+        records = list(reader.records())
+    assert [data for _, data in records] == chunks
+    assert [t_ns - writer.wall_offset_ns for t_ns, _ in records] == [i * 1000 for i in range(40)]
+
+
+def test_close_does_not_wait_for_compression(qapp, tmp_path):
+    path = tmp_path / "capture.pmcap"
+    writer = CaptureWriter(str(path))
+    release = threading.Event()
+    compress = writer._compress
+
+    def slow(data):
+        release.wait(10)
+        return compress(data)
+
+    writer._compress = slow
+    finished = []
+    writer.finished.connect(lambda: finished.append(True))
+    writer.write(b"payload", 1)
+    writer.close()
+    # 压缩被挡住时 close() 已经返回
+    assert not writer.wait(0.1)
+    release.set()
+    assert writer.wait(10)
+    wait_until(qapp, lambda: finished)
+    with CaptureReader(str(path)) as reader:
+        assert [data for _, data in reader.records()] == [b"payload"]
+
+
+def test_close_after_worker_failure_does_not_hang(qapp, tmp_path):
+    writer = CaptureWriter(str(tmp_path / "capture.pmcap"))
+    writer.BLOCK_BYTES = 16
+
+    def broken(data):
+        raise OSError("No space left on device")
+
+    writer._compress = broken
+    # 第一块让工作线程出错，之后的块超过队列上限
+    for i in range(writer.MAX_PENDING_BLOCKS * 2):
+        writer.write(b"x" * 32, i)
+
+    writer.close()
+    assert writer.wait(10)
+    assert writer.failed
+    assert writer.dropped_bytes > 0
@@ -0,0 +1,56 @@
+# test_checksum.py
+# -*- coding: utf-8 -*-
+import random
+
+import pytest
+
+from Serial_Port.checksum import ALGORITHMS, LineChecksumVerifier, append_checksum, compute, verify
+
+
+def test_crc16_modbus_known_value():
+    assert compute('crc16_modbus', b"123456789") == bytes.fromhex("374b")
+
+
+def test_append_checksum_goes_before_line_ending():
+    framed = append_checksum('crc16_modbus', b"hello\r\n", line_mode=True)
+    assert framed.endswith(b"\r\n")
+    assert verify('crc16_modbus', framed[:-2])
+
+
+def test_binary_payload_ending_in_newline_keeps_its_bytes():
+    # Modbus 读保持寄存器请求，最后一个字节恰好是 0x0A
+    request = bytes.fromhex("01030000000A")
+    assert append_checksum('crc16_modbus', request) == bytes.fromhex("01030000000AC5CD")
+
+
+def feed_in_chunks(verifier, stream, rng):
+    results = []
+    position = 0
+    while position < len(stream):
+        size = rng.randint(1, 64)
+        results += verifier.feed(stream[position:position + size])
+        position += size
+    return results
+
+
+@pytest.mark.parametrize("name", sorted(ALGORITHMS))
+@pytest.mark.parametrize("ending", [b"\n", b"\r\n"])
+def test_send_path_output_passes_line_check(name, ending):
+    """发送端按行追加校验值的输出，接收端按行校验全部通过（包括校验值含 \\n、\\r 的行）"""
+    rng = random.Random(1)
+    alphabet = b"abcdefghijklmnopqrstuvwxyz0123456789 ,.:"
+    lines = [bytes(rng.choice(alphabet) for _ in range(rng.randint(1, 40))) for _ in range(5000)]
+    stream = b"".join(append_checksum(name, line + ending, line_mode=True) for line in lines)
+    # 最后一行之后再来一点数据，让需要向后查看的行也能判定
+    stream += b"\n" * 8
+
+    results = feed_in_chunks(LineChecksumVerifier(name), stream, rng)
+    assert [line for line, ok in results if not ok] == []
+    assert [line[:-ALGORITHMS[name].size] for line, _ in results] == lines
+
+
+def test_corrupted_line_is_reported():
+    verifier = LineChecksumVerifier('crc16_modbus')
+    good = append_checksum('crc16_modbus', b"good\n", line_mode=True)
+    results = verifier.feed(b"bad line\n" + good + b"\n\n\n")
+    assert results == [(b"bad line", False), (good[:-1], True)]
@@ -0,0 +1,110 @@
+# test_decode_pool.py
+# -*- coding: utf-8 -*-
+import os
+import random
+import time
+
+import pytest
+
+from conftest import wait_until
+from Serial_Port.decode_pool import DecodePool, DecoderSpec
+from Serial_Port.serial_stats import SerialStatistics
+
+
+# 以下解码函数在工作进程中按 "模块:函数" 导入
+def echo_lines(data):
+    """原样返回整批；批次没在分隔符处切开时报错。耗时随内容变化，让各进程乱序完成"""
+    if not data.endswith(b'\n'):
+        return [f"BAD CUT {data!r}\n"]
+    time.sleep(data[0] % 3 * 0.005)
+    if data.startswith(b"crash"):
+        os._exit(3)
+    return [data.decode()]
+
+
+def echo_aligned(data):
+    """按 4 字节对齐的批次原样返回（十六进制）"""
+    if len(data) % 4:
+        return [f"BAD CUT {len(data)}\n"]
+    time.sleep(data[0] % 3 * 0.005)
+    return [data.hex()]
+
+
+class SmallPool(DecodePool):
+    SLOT_BYTES = 64
+    SLOT_COUNT = 4
+    DISPATCH_INTERVAL = 5
+
+
+def run_pool(qapp, pool, chunks, expected):
+    output = []
+    pool.decoded.connect(output.extend)
+    try:
+        for chunk in chunks:
+            pool.feed(chunk)
+            qapp.processEvents()
+        assert wait_until(qapp, lambda: len("".join(output)) >= len(expected), timeout=20)
+    finally:
+        pool.close()
+    return "".join(output)
+
+
+def random_chunks(data, rng):
+    chunks = []
+    position = 0
+    while position < len(data):
+        size = rng.randint(1, 100)
+        chunks.append(data[position:position + size])
+        position += size
+    return chunks
+
+
+@pytest.fixture
+def rng():
+    return random.Random(7)
+
+
+def test_delimited_batches_keep_receive_order(qapp, rng):
+    text = "".join(f"{i} {'x' * rng.randint(0, 30)}\n" for i in range(400))
+    spec = DecoderSpec('test_decode_pool:echo_lines', "test", b'\n', 1)
+    pool = SmallPool(spec, workers=3)
+    assert run_pool(qapp, pool, random_chunks(text.encode(), rng), text) == text
+
+
+def test_aligned_batches_keep_receive_order(qapp, rng):
+    data = bytes(rng.randrange(256) for _ in range(4 * 500))
+    spec = DecoderSpec('test_decode_pool:echo_aligned', "test", None, 4)
+    pool = SmallPool(spec, workers=3)
+    assert run_pool(qapp, pool, random_chunks(data, rng), data.hex()) == data.hex()
+
+
+def test_dead_worker_does_not_stall_output(qapp):
+    spec = DecoderSpec('test_decode_pool:echo_lines', "test", b'\n', 1)
+    pool = SmallPool(spec, workers=2)
+    output = []
+    pool.decoded.connect(output.extend)
+    try:
+        for line in (b"before\n", b"crash\n", b"after\n"):
+            # 每行单独成批
+            pool.feed(line)
+            pool.cut_batches()
+            pool.dispatch()
+        assert wait_until(qapp, lambda: any(line == "after\n" for line in output), timeout=20)
+    finally:
+        pool.close()
+    assert output[0] == "before\n"
+    assert "解码进程已退出" in output[1]
+    assert output[2] == "after\n"
+
+
+def test_dropped_batches_are_counted(qapp):
+    stats = SerialStatistics()
+    spec = DecoderSpec('test_decode_pool:echo_lines', "test", b'\n', 1)
+    pool = SmallPool(spec, workers=1, stats=stats)
+    pool.MAX_PENDING_BYTES = 64
+    try:
+        pool.feed(b"line\n" * 200)
+        assert pool.dropped > 0
+        assert stats.totals()['decode_dropped'] == pool.dropped
+    finally:
+        pool.close()
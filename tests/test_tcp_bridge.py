@@ -0,0 +1,126 @@
+# test_tcp_bridge.py
+# -*- coding: utf-8 -*-
+import socket
+import threading
+import time
+
+import pytest
+
+from conftest import wait_until
+from Serial_Port.tcp_bridge import TcpBridge
+
+CHUNK = b"x" * 64 * 1024
+
+
+class Reader:
+    """在后台线程中持续读取的客户端"""
+
+    def __init__(self, port):
+        self.sock = socket.create_connection(("127.0.0.1", port))
+        self.received = bytearray()
+        self.closed = False
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def run(self):
+        try:
+            while True:
+                data = self.sock.recv(256 * 1024)
+                if not data:
+                    break
+                self.received += data
+        except OSError:
+            pass
+        self.closed = True
+
+
+def slow_client(port):
+    """连接后从不读取的客户端，接收缓冲尽量小"""
+    sock = socket.socket()
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4096)
+    sock.connect(("127.0.0.1", port))
+    return sock
+
+
+@pytest.fixture
+def make_bridge(qapp):
+    bridges = []
+
+    def make(**kwargs):
+        bridge = TcpBridge("127.0.0.1", 0, **kwargs)
+        bridge.start()
+        bridges.append(bridge)
+        return bridge
+
+    yield make
+    for bridge in bridges:
+        bridge.stop()
+
+
+def publish_paced(bridge, reader, count):
+    """逐块发布，每块等快客户端收完，保证快客户端不会因排队丢数据"""
+    for i in range(count):
+        bridge.publish(CHUNK)
+        assert wait_until_plain(lambda: len(reader.received) >= (i + 1) * len(CHUNK))
+
+
+def wait_until_plain(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.001)
+    return True
+
+
+def test_fan_out_and_write_forwarding(qapp, make_bridge):
+    bridge = make_bridge()
+    received = []
+    bridge.data_from_client.connect(received.append)
+    a, b = Reader(bridge.port), Reader(bridge.port)
+    assert wait_until_plain(lambda: bridge.client_count == 2)
+
+    bridge.publish(b"hello")
+    assert wait_until_plain(lambda: a.received == b"hello" and b.received == b"hello")
+
+    a.sock.sendall(b"cmd-a")
+    b.sock.sendall(b"cmd-b")
+    assert wait_until(qapp, lambda: sorted(received) == [b"cmd-a", b"cmd-b"])
+
+
+def test_drop_policy_keeps_slow_client(make_bridge):
+    bridge = make_bridge(policy='drop', queue_size=8)
+    fast = Reader(bridge.port)
+    slow = slow_client(bridge.port)
+    assert wait_until_plain(lambda: bridge.client_count == 2)
+
+    publish_paced(bridge, fast, 400)
+    stats = {address[1]: dropped for address, _, dropped, _ in bridge.client_stats()}
+    assert stats[fast.sock.getsockname()[1]] == 0
+    assert stats[slow.getsockname()[1]] > 0
+    assert bridge.client_count == 2
+    slow.close()
+
+
+def test_disconnect_policy_drops_slow_client(make_bridge):
+    bridge = make_bridge(policy='disconnect', queue_size=8)
+    fast = Reader(bridge.port)
+    slow = slow_client(bridge.port)
+    assert wait_until_plain(lambda: bridge.client_count == 2)
+
+    publish_paced(bridge, fast, 400)
+    assert wait_until_plain(lambda: bridge.client_count == 1)
+    assert len(fast.received) == 400 * len(CHUNK)
+    slow.close()
+
+
+def test_stop_with_clients_finishes_all_tasks(make_bridge):
+    bridge = make_bridge()
+    clients = [Reader(bridge.port), slow_client(bridge.port)]
+    assert wait_until_plain(lambda: bridge.client_count == 2)
+    bridge.publish(b"data")
+    bridge.stop()
+    assert not bridge.handlers and not bridge.senders
+    assert bridge.thread is None
+    assert wait_until_plain(lambda: clients[0].closed)
+    clients[1].close()
@@ -0,0 +1,167 @@
+# test_transports.py
+# -*- coding: utf-8 -*-
+import os
+import socket
+import sys
+import threading
+import time
+
+import pytest
+
+from conftest import wait_until
+from Serial_Port.app_SerialProcess import SerialProcess
+from Serial_Port.transports import parse_target, is_network_target
+
+OPEN_ARGS = (115200, 8, 0, 1, 0)
+
+
+class EchoServer:
+    """本地 TCP 替身设备：原样回显，可由测试主动断开"""
+
+    def __init__(self, family=socket.AF_INET, address=("127.0.0.1", 0)):
+        self.server = socket.socket(family)
+        self.server.bind(address)
+        self.server.listen(1)
+        self.address = self.server.getsockname()
+        self.conn = None
+        self.accepted = threading.Event()
+        threading.Thread(target=self.run, daemon=True).start()
+
+    def run(self):
+        self.conn, _ = self.server.accept()
+        self.accepted.set()
+        try:
+            while data := self.conn.recv(65536):
+                self.conn.sendall(data)
+        except OSError:
+            pass
+
+    def disconnect(self):
+        self.accepted.wait(2)
+        self.conn.shutdown(socket.SHUT_RDWR)
+
+    def close(self):
+        if self.conn is not None:
+            self.conn.close()
+        self.server.close()
+
+
+@pytest.fixture
+def echo_server():
+    server = EchoServer()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def process(qapp):
+    process = SerialProcess()
+    received = bytearray()
+    errors = []
+    process.data_received.connect(lambda data: received.extend(data.data()))
+    process.error_occurred.connect(errors.append)
+    process.received = received
+    process.errors = errors
+    yield process
+    process.release_transport()
+
+
+def test_parse_target():
+    assert parse_target("COM3") == ('serial', "COM3")
+    assert parse_target("/dev/ttyUSB0") == ('serial', "/dev/ttyUSB0")
+    assert parse_target("192.168.1.10:4001") == ('tcp', "192.168.1.10", 4001)
+    assert parse_target("tcp://[::1]:4001") == ('tcp', "::1", 4001)
+    assert parse_target("unix:///tmp/dev.sock") == ('unix', "/tmp/dev.sock")
+    assert is_network_target("localhost:9000") and not is_network_target("COM3")
+    with pytest.raises(ValueError):
+        parse_target("tcp://nohost")
+
+
+def test_tcp_round_trip(qapp, process, echo_server):
+    host, port = echo_server.address
+    # 连接在后台进行，open_port 立即返回
+    assert process.open_port(f"{host}:{port}", *OPEN_ARGS)
+    assert process.is_opening and not process.is_open
+    assert wait_until(qapp, lambda: process.is_open)
+
+    payload = bytes(range(256)) * 64
+    assert process.send_bytes(payload)
+    assert wait_until(qapp, lambda: len(process.received) >= len(payload))
+    assert bytes(process.received) == payload
+    assert process.errors == []
+
+
+def test_full_socket_buffer_is_not_an_overrun(qapp, process, echo_server):
+    host, port = echo_server.address
+    process.set_read_buffer_size(64)
+    process.open_port(f"tcp://{host}:{port}", *OPEN_ARGS)
+    assert wait_until(qapp, lambda: process.is_open)
+    process.send_bytes(b"x" * 4096)
+    assert wait_until(qapp, lambda: len(process.received) >= 4096)
+    assert process.stats.totals()['overruns'] == 0
+
+
+def test_data_held_while_paused_is_dropped_on_close(qapp, process, echo_server):
+    host, port = echo_server.address
+    process.open_port(f"{host}:{port}", *OPEN_ARGS)
+    assert wait_until(qapp, lambda: process.is_open)
+    process.pause_receive(True)
+    process.send_bytes(b"old connection")
+    assert wait_until(qapp, lambda: process.paused_bytes == len(b"old connection"))
+
+    process.close_port()
+    assert process.pause_receive(False) == []
+
+
+def test_peer_disconnect_emits_connection_lost(qapp, process, echo_server):
+    host, port = echo_server.address
+    process.open_port(f"{host}:{port}", *OPEN_ARGS)
+    assert wait_until(qapp, lambda: process.is_open)
+    lost = []
+    closed = []
+    process.transport.connection_lost.connect(lambda: lost.append(True))
+    process.port_closed.connect(lambda: closed.append(True))
+
+    echo_server.disconnect()
+    assert wait_until(qapp, lambda: lost and closed)
+    assert not process.is_open
+    assert any("连接已断开" in error for error in process.errors)
+
+
+def test_refused_connection_fails_without_blocking(qapp, process):
+    probe = socket.socket()
+    probe.bind(("127.0.0.1", 0))
+    port = probe.getsockname()[1]
+    probe.close()  # 端口无人监听
+
+    start = time.monotonic()
+    assert process.open_port(f"127.0.0.1:{port}", *OPEN_ARGS)
+    assert time.monotonic() - start < 0.5
+    assert wait_until(qapp, lambda: process.errors)
+    assert not process.is_open and not process.is_opening
+    assert process.transport is None
+
+
+def test_cancel_while_connecting(qapp, process, echo_server):
+    host, port = echo_server.address
+    process.open_port(f"{host}:{port}", *OPEN_ARGS)
+    process.close_port()
+    assert not process.is_opening
+    time.sleep(0.05)
+    qapp.processEvents()
+    assert not process.is_open
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix 域套接字")
+def test_unix_round_trip(qapp, process, tmp_path):
+    path = str(tmp_path / "device.sock")
+    server = EchoServer(socket.AF_UNIX, path)
+    try:
+        process.open_port(f"unix://{path}", *OPEN_ARGS)
+        assert wait_until(qapp, lambda: process.is_open)
+        process.send_bytes(b"ping")
+        assert wait_until(qapp, lambda: bytes(process.received) == b"ping")
+    finally:
+        server.close()
+        if os.path.exists(path):
+            os.unlink(path)